@@ -5,12 +5,15 @@ import math
 import tkintermapview
 import threading
 import csv
+import json
+import urllib.parse
 from mavsdk.mission import MissionItem, MissionPlan
 import tkinter.filedialog as filedialog
 import tkinter.messagebox as messagebox
 import os
 import serial.tools.list_ports
 from mavsdk.camera import (CameraError, Mode)
+from mavsdk.telemetry import FlightMode
 import tkinter
 import cv2
 from PIL import Image, ImageTk
@@ -19,15 +22,139 @@ from ultralytics import YOLO
 import time
 import queue
 import logging
-from dataclasses import dataclass
-from typing import Optional
+import logging.handlers
+import bisect
+import copy
+import gzip
+import shutil
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 from datetime import datetime
 
-# Logging konfigürasyonu
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# İsteğe bağlı CPU çıkarım backend'leri
+try:
+    import onnxruntime  # noqa: F401
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import openvino  # noqa: F401
+    OPENVINO_AVAILABLE = True
+except ImportError:
+    OPENVINO_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Logging konfigürasyonu (setup_logging ile kuyruk tabanlı hale getirilir)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 logger = logging.getLogger(__name__)
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """Log kaydını tek satırlık JSON'a çeviren formatter"""
+
+    def format(self, record):
+        entry = {
+            "ts": record.created,
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class GzipRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Döndürülen log dosyalarını gzip ile sıkıştıran dosya handler'ı"""
+
+    def __init__(self, filename, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 20):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.namer = lambda name: name + ".gz"
+        self.rotator = self._compress
+
+    @staticmethod
+    def _compress(source, dest):
+        """Dolan dosyayı sıkıştırıp kaynağı sil (yalnızca listener thread'inde çalışır)"""
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Kuyruk doluysa bekletmeden kaydı düşüren ve sayan handler"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        """Mesajı çöz, traceback'i ayrı alanda sakla (JSON'da 'exc' olarak yazılır)"""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging(log_dir: str = "flight_logs", level: int = logging.INFO,
+                  queue_size: int = 10000) -> logging.handlers.QueueListener:
+    """Kök logger'ı kuyruğa bağla; konsol ve JSONL dosya yazımı arka plan listener'ında yapılır"""
+    os.makedirs(log_dir, exist_ok=True)
+    session = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    file_handler = GzipRotatingFileHandler(os.path.join(log_dir, f"gcs_{session}.jsonl"))
+    file_handler.setFormatter(JsonLinesFormatter())
+
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(level)
+
+    listener = logging.handlers.QueueListener(queue_handler.queue, console_handler, file_handler,
+                                              respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def shutdown_logging(listener: logging.handlers.QueueListener):
+    """Kuyrukta kalan kayıtları yazıp listener'ı durdur"""
+    queue_handler = next((h for h in logging.getLogger().handlers
+                          if isinstance(h, DroppingQueueHandler)), None)
+    if queue_handler and queue_handler.dropped:
+        logger.warning(f"Log kuyruğu dolduğu için {queue_handler.dropped} kayıt düşürüldü")
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
 class LogHandler(logging.Handler):
     """Custom log handler GUI'de log göstermek için"""
 
@@ -38,7 +165,619 @@ class LogHandler(logging.Handler):
     def emit(self, record):
         log_message = self.format(record)
         if self.log_callback:
-            self.log_callback(log_message)
+            self.log_callback(log_message, record.levelno)
+
+
+class GuiLogSink:
+    """Log kayıtlarını sınırlı deque'da tutup GUI'ye sabit aralıkla toplu ekleyen sınıf"""
+
+    LEVELS = {"DEBUG": logging.DEBUG, "INFO": logging.INFO, "WARNING": logging.WARNING,
+              "ERROR": logging.ERROR, "CRITICAL": logging.CRITICAL}
+    LEVEL_COLORS = {logging.WARNING: "orange", logging.ERROR: "red", logging.CRITICAL: "red"}
+
+    def __init__(self, max_records: int = 5000, max_display_lines: int = 500, flush_interval_ms: int = 200):
+        self.records = deque(maxlen=max_records)  # (seviye, metin) - arama bu tampon üzerinde
+        self.max_display_lines = max_display_lines
+        self.flush_interval_ms = flush_interval_ms
+        self.min_level = logging.INFO
+        self.display_lines = 0
+        self.root = None
+        self.textbox = None
+        self._pending = deque()  # Herhangi bir thread'den eklenir, Tk thread'inde boşaltılır
+        self._flush_failed = False  # Hata kaydı da bu sink'e döner; aynı hata tekrar tekrar loglanmaz
+        self.search_pattern = ""  # Boş değilse görüntü canlı kuyruk yerine bir eşleşmenin çevresini gösterir
+        self.search_position = -1  # Gösterilen eşleşmenin sırası
+        self._search_entries = []  # Arama anındaki filtrelenmiş kayıtlar
+        self._search_hits = []  # _search_entries içinde eşleşen indeksler
+
+    def add(self, message: str, levelno: int = logging.INFO):
+        """Kaydı tampona ekle (thread-safe, GUI'ye dokunmaz)"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        entry = (levelno, f"[{timestamp}] {message}")
+        self.records.append(entry)
+        self._pending.append(entry)
+
+    def attach(self, root, textbox):
+        """Textbox'a bağlan ve periyodik boşaltmayı başlat"""
+        self.root = root
+        self.textbox = textbox
+        for levelno, color in self.LEVEL_COLORS.items():
+            textbox.tag_config(logging.getLevelName(levelno), foreground=color)
+        textbox.tag_config("search", background="yellow", foreground="black")
+        self.root.after(self.flush_interval_ms, self._flush)
+
+    def _flush(self):
+        """Bekleyen kayıtları tek seferde sona ekle"""
+        try:
+            batch = []
+            while self._pending:
+                levelno, text = self._pending.popleft()
+                if levelno >= self.min_level:
+                    batch.append((levelno, text))
+            # Arama sonucu incelenirken görüntü sabit kalır; kayıtlar tamponda, aramadan çıkınca görünür
+            if batch and self.textbox and not self.search_pattern:
+                self._insert(batch[-self.max_display_lines:])
+            self._flush_failed = False
+        except Exception as e:
+            if not self._flush_failed:
+                self._flush_failed = True
+                logger.error(f"Log gösterim hatası: {e}")
+        finally:
+            if self.root:
+                self.root.after(self.flush_interval_ms, self._flush)
+
+    def _insert(self, entries):
+        """Satırları ekle, görüntü sınırını aşan eski satırları baştan sil"""
+        self.textbox.configure(state="normal")
+        for levelno, text in entries:
+            self.textbox.insert("end", text + "\n", logging.getLevelName(levelno))
+        self.display_lines += len(entries)
+
+        excess = self.display_lines - self.max_display_lines
+        if excess > 0:
+            self.textbox.delete("1.0", f"{excess + 1}.0")
+            self.display_lines -= excess
+        self.textbox.configure(state="disabled")
+        self.textbox.see("end")
+
+    def set_level(self, level_name: str):
+        """Seviye filtresini değiştir ve görüntüyü bir kez tampondan kur"""
+        self.min_level = self.LEVELS.get(level_name, logging.INFO)
+        self.end_search()
+
+    def _rebuild(self):
+        """Canlı görüntüyü tampondaki son kayıtlardan yeniden kur"""
+        self._pending.clear()
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.configure(state="disabled")
+        self.display_lines = 0
+        entries = [entry for entry in list(self.records) if entry[0] >= self.min_level]
+        self._insert(entries[-self.max_display_lines:])
+
+    def search(self, pattern: str, step: int = -1) -> int:
+        """Tamponda ara, eşleşmenin çevresini göster; aynı desenle tekrar çağrı step kadar ilerler"""
+        if not pattern:
+            self.end_search()
+            return 0
+
+        if pattern != self.search_pattern:
+            pattern_lower = pattern.lower()
+            self.search_pattern = pattern
+            self._search_entries = [entry for entry in list(self.records) if entry[0] >= self.min_level]
+            self._search_hits = [i for i, (_, text) in enumerate(self._search_entries)
+                                 if pattern_lower in text.lower()]
+            self.search_position = len(self._search_hits) if step < 0 else -1
+
+        if not self._search_hits:
+            self.search_position = -1
+            self.textbox.tag_remove("search", "1.0", "end")
+            return 0
+
+        self.search_position = (self.search_position + step) % len(self._search_hits)
+        self._show_match(self._search_hits[self.search_position])
+        return len(self._search_hits)
+
+    def _show_match(self, entry_index: int):
+        """Eşleşmeyi ortalayan max_display_lines kayıtlık pencereyi tampondan çiz"""
+        half = self.max_display_lines // 2
+        start = max(0, min(entry_index - half, len(self._search_entries) - self.max_display_lines))
+        window = self._search_entries[start:start + self.max_display_lines]
+
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        target = "1.0"
+        for offset, (levelno, text) in enumerate(window, start):
+            if offset == entry_index:
+                target = self.textbox.index("end-1c")  # Çok satırlı kayıtlarda da doğru satır
+            self.textbox.insert("end", text + "\n", logging.getLevelName(levelno))
+        self.display_lines = len(window)
+        self.textbox.configure(state="disabled")
+
+        self._highlight(self.search_pattern)
+        self.textbox.see(target)
+
+    def end_search(self):
+        """Aramadan çık ve canlı kuyruğa dön"""
+        self.search_pattern = ""
+        self.search_position = -1
+        self._search_entries = []
+        self._search_hits = []
+        if self.textbox:
+            self._rebuild()
+
+    def _highlight(self, pattern: str):
+        """Görünen satırlardaki eşleşmeleri işaretle"""
+        self.textbox.tag_remove("search", "1.0", "end")
+        index = "1.0"
+        while True:
+            index = self.textbox.search(pattern, index, stopindex="end", nocase=True)
+            if not index:
+                break
+            end_index = f"{index}+{len(pattern)}c"
+            self.textbox.tag_add("search", index, end_index)
+            index = end_index
+
+    def clear(self):
+        """Tamponu ve görüntüyü temizle"""
+        self.records.clear()
+        self._pending.clear()
+        self.search_pattern = ""
+        self.search_position = -1
+        self._search_entries = []
+        self._search_hits = []
+        self.display_lines = 0
+        if self.textbox:
+            self.textbox.configure(state="normal")
+            self.textbox.delete("1.0", "end")
+            self.textbox.configure(state="disabled")
+
+
+class TelemetryHub:
+    """MAVSDK telemetri akışlarını bir kez açıp son değeri tüm tüketicilere dağıtan sınıf"""
+
+    # Konu adı -> akışı açan fonksiyon
+    STREAMS = {
+        "position": lambda drone: drone.telemetry.position(),
+        "battery": lambda drone: drone.telemetry.battery(),
+        "armed": lambda drone: drone.telemetry.armed(),
+        "flight_mode": lambda drone: drone.telemetry.flight_mode(),
+        "health": lambda drone: drone.telemetry.health(),
+        "connection_state": lambda drone: drone.core.connection_state(),
+    }
+
+    ANY_TOPIC = "*"  # Tüm konuları dinleyen callback'ler için
+
+    def __init__(self, drone_system, topics=None):
+        self.drone = drone_system
+        self.topics = list(topics or self.STREAMS)
+        self.latest = {}  # Konu -> son değer
+        self.timestamps = {}  # Konu -> son değerin geliş zamanı
+        self.sample_counts = {topic: 0 for topic in self.topics}
+        self.is_running = False
+        self._subscribers = {topic: set() for topic in self.topics}
+        self._listeners = {topic: [] for topic in self.topics}
+        self._tasks = []
+
+    async def start(self):
+        """Akışları aç (event loop thread'inde çağrılmalı)"""
+        if self.is_running:
+            return
+
+        self.is_running = True
+        for topic in self.topics:
+            if self.drone is not None and topic in self.STREAMS:
+                self._tasks.append(asyncio.ensure_future(self._pump(topic)))
+        logger.info(f"Telemetri hub başlatıldı: {', '.join(self.topics)}")
+
+    def stop(self):
+        """Akışları kapat"""
+        self.is_running = False
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        logger.info("Telemetri hub durduruldu")
+
+    async def _pump(self, topic: str):
+        """Tek bir akışı açık tutup gelen her değeri yayınla"""
+        while self.is_running:
+            try:
+                async for value in self.STREAMS[topic](self.drone):
+                    self.publish(topic, value)
+                    if not self.is_running:
+                        break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Telemetri akışı hatası ({topic}): {e}")
+
+            # Akış kapandıysa kısa bir beklemeden sonra yeniden aç
+            if self.is_running:
+                await asyncio.sleep(1)
+
+    def publish(self, topic: str, value):
+        """Yeni değeri kaydet ve abonelere dağıt (event loop thread'inden çağrılmalı)"""
+        self.latest[topic] = value
+        self.timestamps[topic] = time.time()
+        self.sample_counts[topic] = self.sample_counts.get(topic, 0) + 1
+
+        # Yavaş aboneler sadece en güncel değeri görür
+        for subscriber in self._subscribers.get(topic, ()):
+            if subscriber.full():
+                subscriber.get_nowait()
+            subscriber.put_nowait(value)
+
+        for callback in list(self._listeners.get(topic, ())) + list(self._listeners.get(self.ANY_TOPIC, ())):
+            try:
+                callback(topic, value)
+            except Exception as e:
+                logger.error(f"Telemetri dinleyici hatası ({topic}): {e}")
+
+    def add_listener(self, topic: str, callback):
+        """Her yeni değerde senkron çağrılacak callback ekle (ANY_TOPIC tüm konuları dinler)"""
+        self._listeners.setdefault(topic, []).append(callback)
+
+    def remove_listener(self, topic: str, callback):
+        """Callback'i kaldır"""
+        if callback in self._listeners.get(topic, []):
+            self._listeners[topic].remove(callback)
+
+    async def subscribe(self, topic: str):
+        """Konudaki değerleri async iterator olarak döndür"""
+        subscriber = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(topic, set()).add(subscriber)
+        try:
+            if topic in self.latest:
+                subscriber.put_nowait(self.latest[topic])
+            while True:
+                yield await subscriber.get()
+        finally:
+            self._subscribers[topic].discard(subscriber)
+
+    async def wait_until(self, topic: str, predicate, timeout: Optional[float] = None):
+        """Koşulu sağlayan ilk değeri bekle, zaman aşımında asyncio.TimeoutError fırlat"""
+        async def _wait():
+            async for value in self.subscribe(topic):
+                if predicate(value):
+                    return value
+
+        return await asyncio.wait_for(_wait(), timeout)
+
+    async def wait_for(self, topic: str, timeout: Optional[float] = None):
+        """Konunun son değerini döndür, henüz gelmediyse ilk değeri bekle"""
+        if topic in self.latest:
+            return self.latest[topic]
+        return await self.wait_until(topic, lambda value: True, timeout)
+
+    def get(self, topic: str, default=None):
+        """Konunun son değerini beklemeden döndür"""
+        return self.latest.get(topic, default)
+
+    def snapshot(self) -> dict:
+        """Tüm konuların son değerlerinin kopyası"""
+        return dict(self.latest)
+
+
+class HeartbeatTracker:
+    """Araçtan gerçekten gelen mesajları zaman damgalayıp bağlantı kalitesini ölçen sınıf"""
+
+    def __init__(self, max_interval: float, on_link_lost=None, on_link_restored=None, window: float = 5.0):
+        self.max_interval = max_interval
+        self.on_link_lost = on_link_lost
+        self.on_link_restored = on_link_restored
+        self.window = window
+        self.last_arrival = 0.0  # loop.time() cinsinden
+        self.mean_interval = 0.0  # Mesajlar arası süre (EWMA)
+        self.jitter = 0.0  # RFC 3550 tarzı varış jitter'ı
+        self.nominal_rate = 0.0  # Sağlıklı bağlantıda gözlenen en yüksek mesaj hızı
+        self.message_count = 0
+        self.is_link_lost = False
+        self._arrivals = deque()
+        self._arrivals_lock = threading.Lock()  # GUI thread'i de okurken budar
+        self._last_interval = None
+        self._loop = None
+        self._timer = None
+
+    def beat(self, topic=None, value=None):
+        """Mesaj geldiğinde çağrılır (TelemetryHub dinleyicisi, event loop thread'inde)"""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        now = self._loop.time()
+
+        if self.last_arrival:
+            interval = now - self.last_arrival
+            if self._last_interval is not None:
+                self.jitter += (abs(interval - self._last_interval) - self.jitter) / 16.0
+            self._last_interval = interval
+            self.mean_interval = interval if not self.mean_interval else \
+                self.mean_interval + (interval - self.mean_interval) / 16.0
+
+        with self._arrivals_lock:
+            self._arrivals.append(now)
+        self.nominal_rate = max(self.nominal_rate * 0.999, self.get_rate())
+
+        if self.is_link_lost:
+            gap = now - self.last_arrival
+            self.is_link_lost = False
+            logger.info(f"Bağlantı geri geldi ({gap:.2f} s kesinti)")
+            if self.on_link_restored:
+                self.on_link_restored(gap)
+
+        self.last_arrival = now
+        self.message_count += 1
+
+        # Zamanlayıcı her mesajda yeniden kurulmaz, süresi dolunca son mesaja göre ertelenir
+        if self._timer is None:
+            self._timer = self._loop.call_at(now + self.max_interval, self._check_gap)
+
+    def _check_gap(self):
+        """Son mesajdan beri geçen süre limiti aştıysa bağlantı kaybını bildir"""
+        self._timer = None
+        deadline = self.last_arrival + self.max_interval
+        if self._loop.time() < deadline:
+            self._timer = self._loop.call_at(deadline, self._check_gap)
+            return
+
+        self.is_link_lost = True
+        gap = self._loop.time() - self.last_arrival
+        logger.warning(f"Heartbeat kaybı: {gap:.2f} s boyunca mesaj gelmedi")
+        if self.on_link_lost:
+            self.on_link_lost(gap)
+
+    def get_rate(self) -> float:
+        """Son pencere içindeki mesaj hızı (Hz); mesaj gelmese de okuma anına göre budanır"""
+        if self._loop is None:
+            return 0.0
+        cutoff = self._loop.time() - self.window  # Monoton saat, her thread'den okunabilir
+        with self._arrivals_lock:
+            while self._arrivals and self._arrivals[0] < cutoff:
+                self._arrivals.popleft()
+            return len(self._arrivals) / self.window
+
+    def get_link_quality(self) -> float:
+        """0-1 arası bağlantı kalitesi (anlık hız / nominal hız)"""
+        if self.is_link_lost or not self.nominal_rate:
+            return 0.0
+        return min(1.0, self.get_rate() / self.nominal_rate)
+
+    def stop(self):
+        """Zamanlayıcıyı iptal et (herhangi bir thread'den çağrılabilir)"""
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._cancel_timer)
+
+    def _cancel_timer(self):
+        """Bekleyen zamanlayıcıyı iptal et"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def reset(self):
+        """Kayıp izlemeyi durdur ve ölçümleri sıfırla; sonraki mesajla yeniden başlar (event loop thread'inde)"""
+        self._cancel_timer()
+        self.last_arrival = 0.0
+        self.mean_interval = 0.0
+        self.jitter = 0.0
+        self.nominal_rate = 0.0
+        self.is_link_lost = False
+        with self._arrivals_lock:
+            self._arrivals.clear()
+        self._last_interval = None
+
+
+class CameraModeCache:
+    """Kamera modunu arka planda yenileyen TTL önbelleği"""
+
+    def __init__(self, drone_system, camera_id: int = 1, ttl: float = 5.0, timeout: float = 2.0):
+        self.drone = drone_system
+        self.camera_id = camera_id
+        self.ttl = ttl
+        self.timeout = timeout
+        self.mode = None
+        self.error = None
+        self.updated_at = 0.0
+        self.is_running = False
+        self._task = None
+
+    async def start(self):
+        """Arka plan yenileme görevini başlat (event loop thread'inde çağrılmalı)"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._task = asyncio.ensure_future(self._refresh_loop())
+
+    def stop(self):
+        """Yenilemeyi durdur"""
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _refresh_loop(self):
+        """TTL süresince bir kamera modunu yenile"""
+        while self.is_running:
+            await self.refresh()
+            await asyncio.sleep(self.ttl)
+
+    async def refresh(self):
+        """Kamera modunu zaman aşımıyla sorgula"""
+        try:
+            mode = await asyncio.wait_for(self.drone.camera.get_mode(self.camera_id), self.timeout)
+            self.set(mode)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.error = str(e) or type(e).__name__
+            logger.debug(f"Kamera modu okunamadı: {self.error}")
+
+    def set(self, mode):
+        """Bilinen modu önbelleğe yaz (örn. set_mode sonrası)"""
+        self.mode = mode
+        self.error = None
+        self.updated_at = time.time()
+
+    def is_stale(self) -> bool:
+        """Son başarılı okuma iki TTL'den eski mi"""
+        return time.time() - self.updated_at > 2 * self.ttl
+
+    def describe(self) -> str:
+        """Bilgi paneli için kamera durumu"""
+        if self.mode is None:
+            return "ERİŞİLEMİYOR" if self.error else "Bağlantı yok"
+        text = "FOTOĞRAF modu" if self.mode == Mode.PHOTO else "VİDEO modu"
+        if self.is_stale():
+            text += " (eski)"
+        return text
+
+
+# Uçuş kaydı satır yapısı - diske ham ikili olarak yazılır, np.memmap ile okunur
+FLIGHT_RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('lat', '<f8'),
+    ('lon', '<f8'),
+    ('relative_alt', '<f4'),
+    ('battery', '<f4'),
+    ('flight_mode', '<i2'),
+    ('armed', '?'),
+])
+
+
+class FlightRecorder:
+    """Telemetri örneklerini halka tampona yazıp arka planda diske aktaran uçuş kaydedici"""
+
+    def __init__(self, file_path: str, ring_size: int = 4096):
+        self.file_path = file_path
+        self.ring_size = ring_size
+        self.ring = np.zeros(ring_size, dtype=FLIGHT_RECORD_DTYPE)
+        self.count = 0  # Toplam kayıt sayısı
+        self.flushed = 0  # Diske aktarılan kayıt sayısı
+        self.telemetry_hub = None
+        self._lock = threading.Lock()
+        self._write_queue = queue.Queue()
+        self._writer_thread = None
+
+    def open(self):
+        """Kayıt dosyasını ve yazıcı thread'ini aç"""
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer_thread.start()
+        logger.info(f"Uçuş kaydı başlatıldı: {self.file_path}")
+
+    def attach(self, telemetry_hub):
+        """Her pozisyon örneğinde hub'daki son değerlerle bir satır yaz"""
+        self.telemetry_hub = telemetry_hub
+        telemetry_hub.add_listener("position", self._on_position)
+
+    def detach(self):
+        """Hub dinleyicisini kaldır"""
+        if self.telemetry_hub:
+            self.telemetry_hub.remove_listener("position", self._on_position)
+            self.telemetry_hub = None
+
+    def _on_position(self, topic: str, position):
+        """Hub callback'i"""
+        battery = self.telemetry_hub.get("battery")
+        flight_mode = self.telemetry_hub.get("flight_mode")
+        self.append(
+            time.time(),
+            position.latitude_deg,
+            position.longitude_deg,
+            position.relative_altitude_m,
+            battery.remaining_percent if battery is not None else float('nan'),
+            getattr(flight_mode, 'value', -1),
+            bool(self.telemetry_hub.get("armed", False))
+        )
+
+    def append(self, timestamp: float, lat: float, lon: float, relative_alt: float,
+               battery: float, flight_mode: int, armed: bool):
+        """Halka tampona bir kayıt ekle"""
+        with self._lock:
+            self.ring[self.count % self.ring_size] = (timestamp, lat, lon, relative_alt,
+                                                      battery, flight_mode, armed)
+            self.count += 1
+
+            # Tamponun yarısı dolunca diske aktar, böylece yazılmamış kayıt ezilmez
+            if self.count - self.flushed >= self.ring_size // 2:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        """Diske aktarılmamış kayıtları yazıcı kuyruğuna kopyala"""
+        start = self.flushed % self.ring_size
+        end = self.count % self.ring_size
+        if self.count == self.flushed:
+            return
+        if start < end:
+            self._write_queue.put(self.ring[start:end].copy())
+        else:
+            self._write_queue.put(np.concatenate((self.ring[start:], self.ring[:end])))
+        self.flushed = self.count
+
+    def flush(self):
+        """Bekleyen kayıtları diske aktar"""
+        with self._lock:
+            self._flush_locked()
+
+    def _write_loop(self):
+        """Kuyruktaki blokları dosyanın sonuna ekle"""
+        with open(self.file_path, "ab") as file:
+            while True:
+                block = self._write_queue.get()
+                if block is None:
+                    break
+                try:
+                    file.write(block.tobytes())
+                    file.flush()
+                except Exception as e:
+                    logger.error(f"Uçuş kaydı yazma hatası: {e}")
+
+    def recent(self, n: Optional[int] = None) -> np.ndarray:
+        """Son n kaydı (en fazla ring_size) zaman sırasıyla döndür"""
+        with self._lock:
+            available = min(self.count, self.ring_size)
+            n = available if n is None else min(n, available)
+            indices = np.arange(self.count - n, self.count) % self.ring_size
+            return self.ring[indices]
+
+    def close(self):
+        """Kalan kayıtları yaz ve dosyayı kapat"""
+        self.detach()
+        self.flush()
+        if self._writer_thread:
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=5.0)
+            self._writer_thread = None
+        logger.info(f"Uçuş kaydı kapatıldı: {self.count} kayıt")
+
+    @staticmethod
+    def load(file_path: str) -> np.ndarray:
+        """Kayıt dosyasını kopyalamadan (memory-mapped) aç"""
+        record_count = os.path.getsize(file_path) // FLIGHT_RECORD_DTYPE.itemsize
+        if record_count == 0:
+            return np.zeros(0, dtype=FLIGHT_RECORD_DTYPE)
+        return np.memmap(file_path, dtype=FLIGHT_RECORD_DTYPE, mode="r", shape=(record_count,))
+
+
+@dataclass
+class PositionSample:
+    """MAVSDK Position ile aynı alanlara sahip hafif telemetri örneği"""
+    latitude_deg: float
+    longitude_deg: float
+    absolute_altitude_m: float
+    relative_altitude_m: float
+
+
+@dataclass
+class BatterySample:
+    """MAVSDK Battery ile aynı alanlara sahip hafif telemetri örneği"""
+    remaining_percent: float
+    voltage_v: float = float('nan')
+
+
+@dataclass
+class ConnectionStateSample:
+    """MAVSDK ConnectionState ile aynı alanlara sahip örnek"""
+    is_connected: bool
 
 
 @dataclass
@@ -59,117 +798,286 @@ class FailsafeConfig:
     """Failsafe konfigürasyonu - Daha esnek ayarlar"""
     min_battery_level: float = 15.0  # %15 altında uyarı
     critical_battery_level: float = 8.0  # %8 altında acil iniş
+    battery_hysteresis: float = 2.0  # Batarya kuralları bu kadar yükselince sıfırlanır
     max_heartbeat_interval: float = 10.0  # 10 saniye sinyal kayıpları
     max_altitude: float = 200.0  # Maksimum irtifa (metre) - artırıldı
+    altitude_hysteresis: float = 5.0  # İrtifa kuralı bu kadar alçalınca sıfırlanır
     enable_geofence: bool = False  # Geofence devre dışı
     goto_timeout: float = 30.0  # Goto komutu timeout süresi
 
 
+@dataclass
+class FailsafeRule:
+    """Bir telemetri konusuna bağlı, histerezisli failsafe kuralı"""
+    name: str
+    topic: str
+    trigger: Callable  # value -> bool, kural tetiklenir
+    clear: Callable  # value -> bool, tetiklenmiş kural sıfırlanır
+    action: Callable  # async value -> None
+    priority: int = 100  # Küçük değer = yüksek öncelik
+    is_active: bool = False
+    eval_count: int = 0
+    trigger_count: int = 0
+    last_eval_ms: float = 0.0
+    max_eval_ms: float = 0.0
+    total_eval_ms: float = 0.0
+
+
+class FailsafeRuleEngine:
+    """Failsafe kurallarını yeni telemetri değeri geldiği anda değerlendiren sınıf"""
+
+    def __init__(self, telemetry_hub):
+        self.telemetry_hub = telemetry_hub
+        self.rules = []
+        self._rules_by_topic = {}
+
+    def add_rule(self, rule: FailsafeRule):
+        """Kuralı ekle ve konusunu dinlemeye başla"""
+        if rule.topic not in self._rules_by_topic:
+            self._rules_by_topic[rule.topic] = []
+            self.telemetry_hub.add_listener(rule.topic, self._on_value)
+
+        self.rules.append(rule)
+        self._rules_by_topic[rule.topic].append(rule)
+        self._rules_by_topic[rule.topic].sort(key=lambda r: r.priority)
+
+    def detach(self):
+        """Hub dinleyicilerini kaldır"""
+        for topic in self._rules_by_topic:
+            self.telemetry_hub.remove_listener(topic, self._on_value)
+        self._rules_by_topic.clear()
+        self.rules.clear()
+
+    def _on_value(self, topic: str, value):
+        """Hub callback'i - değeri aynı anda değerlendir"""
+        self.evaluate(topic, value)
+
+    def reevaluate(self):
+        """Tüm kuralları konularının son değeriyle yeniden değerlendir (koşul dışı durum değişince)"""
+        for topic in list(self._rules_by_topic):
+            value = self.telemetry_hub.get(topic)
+            if value is not None:
+                self.evaluate(topic, value)
+
+    def evaluate(self, topic: str, value):
+        """Konudaki kuralları öncelik sırasıyla değerlendir, tetiklenenleri çalıştır"""
+        fired = []
+        for rule in self._rules_by_topic.get(topic, ()):
+            start_time = time.perf_counter()
+            try:
+                if not rule.is_active and rule.trigger(value):
+                    rule.is_active = True
+                    rule.trigger_count += 1
+                    fired.append(rule)
+                elif rule.is_active and rule.clear(value):
+                    rule.is_active = False
+                    logger.info(f"Failsafe kuralı normale döndü: {rule.name}")
+            except Exception as e:
+                logger.error(f"Failsafe kural hatası ({rule.name}): {e}")
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            rule.eval_count += 1
+            rule.last_eval_ms = elapsed_ms
+            rule.total_eval_ms += elapsed_ms
+            rule.max_eval_ms = max(rule.max_eval_ms, elapsed_ms)
+
+        if fired:
+            # Aksiyonlar öncelik sırasıyla, tek görevde sırayla gönderilir
+            asyncio.ensure_future(self._run_actions(fired, value))
+
+    async def _run_actions(self, rules, value):
+        """Tetiklenen kuralların aksiyonlarını çalıştır"""
+        for rule in rules:
+            try:
+                logger.info(f"Failsafe kuralı tetiklendi: {rule.name} (öncelik {rule.priority})")
+                await rule.action(value)
+            except Exception as e:
+                logger.error(f"Failsafe aksiyon hatası ({rule.name}): {e}")
+
+    def get_stats(self) -> list:
+        """Kural başına değerlendirme istatistikleri"""
+        return [{
+            'name': rule.name,
+            'priority': rule.priority,
+            'active': rule.is_active,
+            'evaluations': rule.eval_count,
+            'triggers': rule.trigger_count,
+            'last_ms': rule.last_eval_ms,
+            'max_ms': rule.max_eval_ms,
+            'avg_ms': rule.total_eval_ms / rule.eval_count if rule.eval_count else 0.0,
+        } for rule in sorted(self.rules, key=lambda r: r.priority)]
+
+
 class FailsafeManager:
     """Failsafe işlemlerini yöneten sınıf"""
 
-    def __init__(self, drone_system, gui_callback=None):
+    def __init__(self, drone_system, gui_callback=None, telemetry_hub=None):
         self.drone = drone_system
         self.gui_callback = gui_callback
+        self.telemetry_hub = telemetry_hub or TelemetryHub(drone_system)
         self.config = FailsafeConfig()
         self.drone_state = DroneState()
+        self.rule_engine = FailsafeRuleEngine(self.telemetry_hub)
+        self.heartbeat_tracker = HeartbeatTracker(self.config.max_heartbeat_interval,
+                                                  on_link_lost=self._on_link_lost)
         self.is_monitoring = False
         self.goto_active = False  # Goto komutu aktif mi
         self.goto_start_time = 0  # Goto başlangıç zamanı
 
     async def start_monitoring(self):
         """Failsafe izlemeyi başlat"""
+        if self.is_monitoring:
+            return
+
         self.is_monitoring = True
-        logger.info("Failsafe monitoring başlatıldı")
+        for topic in ("position", "battery", "connection_state"):
+            self.telemetry_hub.add_listener(topic, self._update_state)
+        self.telemetry_hub.add_listener(TelemetryHub.ANY_TOPIC, self._on_message)
+        for rule in self._build_rules():
+            self.rule_engine.add_rule(rule)
+
+        await self.telemetry_hub.start()
+        logger.info(f"Failsafe monitoring başlatıldı ({len(self.rule_engine.rules)} kural)")
+
+    def _build_rules(self) -> list:
+        """Batarya, irtifa, bağlantı ve goto timeout kurallarını tanımla"""
+        config = self.config
+        return [
+            # Goto sırasında yalnızca uyarı verilir; uyarı kuralı ayrı olduğundan asıl kural kilitlenmez
+            # ve goto bitince (set_goto_active) son değerle yeniden değerlendirilip tetiklenir
+            FailsafeRule(
+                name="critical_battery",
+                topic="battery",
+                trigger=lambda battery: (not self.goto_active and
+                                         battery.remaining_percent <= self._critical_battery_level()),
+                clear=lambda battery: battery.remaining_percent >
+                                      self._critical_battery_level() + config.battery_hysteresis,
+                action=self._on_critical_battery,
+                priority=0,
+            ),
+            FailsafeRule(
+                name="critical_battery_goto",
+                topic="battery",
+                trigger=lambda battery: (self.goto_active and
+                                         battery.remaining_percent <= self._critical_battery_level()),
+                clear=lambda battery: (not self.goto_active or battery.remaining_percent >
+                                       self._critical_battery_level() + config.battery_hysteresis),
+                action=lambda battery: self._trigger_warning(
+                    f"Düşük batarya (Goto aktif): %{battery.remaining_percent:.1f}"),
+                priority=1,
+            ),
+            FailsafeRule(
+                name="connection_lost",
+                topic="connection_state",
+                trigger=lambda state: not self.goto_active and not state.is_connected,
+                clear=lambda state: state.is_connected,
+                action=self._on_connection_lost,
+                priority=10,
+            ),
+            FailsafeRule(
+                name="connection_lost_goto",
+                topic="connection_state",
+                trigger=lambda state: self.goto_active and not state.is_connected,
+                clear=lambda state: not self.goto_active or state.is_connected,
+                action=lambda state: self._trigger_warning("Bağlantı kaybı (Goto aktif)"),
+                priority=11,
+            ),
+            FailsafeRule(
+                name="low_battery",
+                topic="battery",
+                trigger=lambda battery: (self._critical_battery_level() < battery.remaining_percent
+                                         <= config.min_battery_level),
+                clear=lambda battery: battery.remaining_percent > config.min_battery_level + config.battery_hysteresis,
+                action=lambda battery: self._trigger_warning(f"Düşük batarya: %{battery.remaining_percent:.1f}"),
+                priority=20,
+            ),
+            FailsafeRule(
+                name="max_altitude",
+                topic="position",
+                trigger=lambda position: position.relative_altitude_m > self._max_altitude(),
+                clear=lambda position: position.relative_altitude_m <
+                                       self._max_altitude() - config.altitude_hysteresis,
+                action=lambda position: self._trigger_warning(
+                    f"Maksimum irtifa aşıldı: {position.relative_altitude_m:.1f}m"),
+                priority=30,
+            ),
+            FailsafeRule(
+                name="goto_timeout",
+                topic="position",
+                trigger=lambda position: (self.goto_active and
+                                          (time.time() - self.goto_start_time) > config.goto_timeout),
+                clear=lambda position: not self.goto_active,
+                action=self._on_goto_timeout,
+                priority=40,
+            ),
+        ]
 
-        # Paralel monitoring görevleri
-        await asyncio.gather(
-            self._monitor_battery(),
-            self._monitor_connection(),
-            self._monitor_altitude(),
-            return_exceptions=True
-        )
+    def _critical_battery_level(self) -> float:
+        """Goto aktifken daha esnek kritik batarya seviyesi"""
+        if self.goto_active:
+            return max(5.0, self.config.critical_battery_level - 3.0)
+        return self.config.critical_battery_level
+
+    def _max_altitude(self) -> float:
+        """Goto aktifken daha yüksek irtifa limiti"""
+        if self.goto_active:
+            return self.config.max_altitude + 50  # 50m ek tolerans
+        return self.config.max_altitude
+
+    def _update_state(self, topic: str, value):
+        """Hub'dan gelen değerlerle drone durumunu güncelle"""
+        if topic == "battery":
+            self.drone_state.battery_level = value.remaining_percent
+        elif topic == "position":
+            self.drone_state.altitude = value.relative_altitude_m
+            self.drone_state.latitude = value.latitude_deg
+            self.drone_state.longitude = value.longitude_deg
+        elif topic == "connection_state":
+            self.drone_state.is_connected = value.is_connected
+
+    def _on_message(self, topic: str, value):
+        """Araçtan gelen her mesajı heartbeat olarak say"""
+        if topic == "connection_state":
+            return  # MAVSDK'nın yerelde ürettiği durum, araçtan gelen mesaj değil
+        self.drone_state.last_heartbeat = time.time()
+        self.heartbeat_tracker.beat(topic, value)
+
+    def _on_link_lost(self, gap: float):
+        """Heartbeat tracker callback'i - mesaj aralığı limiti aşıldı"""
+        if not self.is_monitoring:
+            return
+        if not self.goto_active:
+            asyncio.ensure_future(self._trigger_failsafe(f"Heartbeat kaybı ({gap:.1f} s)!"))
+        else:
+            asyncio.ensure_future(self._trigger_warning(f"Heartbeat kaybı (Goto aktif): {gap:.1f} s"))
 
     def set_goto_active(self, active: bool):
-        """Goto komutunun aktif olduğunu belirt"""
+        """Goto komutunun aktif olduğunu belirt (event loop thread'inden)"""
         self.goto_active = active
         if active:
             self.goto_start_time = time.time()
             logger.info("Goto komutu aktif - Failsafe esnek modda")
         else:
             logger.info("Goto komutu tamamlandı - Failsafe normal modda")
-
-    async def _monitor_battery(self):
-        """Batarya seviyesini izle"""
-        while self.is_monitoring:
-            try:
-                battery_info = await self.drone.telemetry.battery().__anext__()
-                self.drone_state.battery_level = battery_info.remaining_percent
-
-                # Goto aktifken daha esnek kontrol
-                critical_level = self.config.critical_battery_level
-                if self.goto_active:
-                    critical_level = max(5.0, self.config.critical_battery_level - 3.0)
-
-                if self.drone_state.battery_level <= critical_level:
-                    if not self.goto_active:
-                        await self._trigger_emergency_landing("Kritik batarya seviyesi!")
-                    else:
-                        await self._trigger_warning(
-                            f"Düşük batarya (Goto aktif): %{self.drone_state.battery_level:.1f}")
-                elif self.drone_state.battery_level <= self.config.min_battery_level:
-                    await self._trigger_warning(f"Düşük batarya: %{self.drone_state.battery_level:.1f}")
-
-                await asyncio.sleep(2)
-            except Exception as e:
-                logger.error(f"Batarya monitoring hatası: {e}")
-                await asyncio.sleep(5)
-
-    async def _monitor_connection(self):
-        """Bağlantı durumunu izle"""
-        while self.is_monitoring:
-            try:
-                self.drone_state.last_heartbeat = time.time()
-
-                # Bağlantı durumunu kontrol et
-                async for state in self.drone.core.connection_state():
-                    if not state.is_connected and not self.goto_active:
-                        await self._trigger_failsafe("Bağlantı kaybı!")
-                    elif not state.is_connected and self.goto_active:
-                        await self._trigger_warning("Bağlantı kaybı (Goto aktif)")
-                    break
-
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Bağlantı monitoring hatası: {e}")
-                await asyncio.sleep(3)
-
-    async def _monitor_altitude(self):
-        """İrtifa sınırlarını izle"""
-        while self.is_monitoring:
-            try:
-                position = await self.drone.telemetry.position().__anext__()
-                self.drone_state.altitude = position.relative_altitude_m
-                self.drone_state.latitude = position.latitude_deg
-                self.drone_state.longitude = position.longitude_deg
-
-                # Goto aktifken daha yüksek limit
-                max_alt = self.config.max_altitude
-                if self.goto_active:
-                    max_alt = self.config.max_altitude + 50  # 50m ek tolerans
-
-                if self.drone_state.altitude > max_alt:
-                    await self._trigger_warning(f"Maksimum irtifa aşıldı: {self.drone_state.altitude:.1f}m")
-
-                # Goto timeout kontrolü
-                if self.goto_active and (time.time() - self.goto_start_time) > self.config.goto_timeout:
-                    logger.warning("Goto timeout - Normal monitoring'e dönülüyor")
-                    self.goto_active = False
-
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"İrtifa monitoring hatası: {e}")
-                await asyncio.sleep(3)
+            # Goto sırasında ertelenen kurallar yeni mesaj beklemeden son değerlerle tetiklenir
+            self.rule_engine.reevaluate()
+            if self.heartbeat_tracker.is_link_lost:
+                # Kayıp zamanlayıcısı bir kez bildirip durur, mesaj gelmediği sürece tekrar çağrılmaz
+                gap = asyncio.get_running_loop().time() - self.heartbeat_tracker.last_arrival
+                self._on_link_lost(gap)
+
+    async def _on_critical_battery(self, battery):
+        """Kritik batarya kuralı aksiyonu"""
+        await self._trigger_emergency_landing("Kritik batarya seviyesi!")
+
+    async def _on_connection_lost(self, state):
+        """Bağlantı kaybı kuralı aksiyonu"""
+        await self._trigger_failsafe("Bağlantı kaybı!")
+
+    async def _on_goto_timeout(self, position):
+        """Goto timeout kuralı aksiyonu"""
+        logger.warning("Goto timeout - Normal monitoring'e dönülüyor")
+        self.set_goto_active(False)
 
     async def _trigger_failsafe(self, reason: str):
         """Failsafe'i tetikle"""
@@ -182,6 +1090,10 @@ class FailsafeManager:
         if self.gui_callback:
             self.gui_callback(f"FAILSAFE: {reason}")
 
+        if self.drone is None:
+            logger.info("Araç yok (replay), RTL komutu gönderilmedi")
+            return
+
         try:
             # RTL (Return to Launch) komutunu ver
             await self.drone.action.return_to_launch()
@@ -198,6 +1110,10 @@ class FailsafeManager:
         if self.gui_callback:
             self.gui_callback(f"ACİL İNİŞ: {reason}")
 
+        if self.drone is None:
+            logger.info("Araç yok (replay), iniş komutu gönderilmedi")
+            return
+
         try:
             await self.drone.action.land()
             logger.info("Acil iniş komutu gönderildi")
@@ -214,126 +1130,2510 @@ class FailsafeManager:
         """Manuel failsafe tetikleme"""
         await self._trigger_failsafe("Manuel failsafe tetiklendi")
 
+    def reset(self):
+        """Failsafe kilidini, kural durumlarını ve heartbeat izlemeyi sıfırla (replay başında/sonunda)"""
+        self.drone_state.is_failsafe_active = False
+        self.goto_active = False
+        for rule in self.rule_engine.rules:
+            rule.is_active = False
+        self.heartbeat_tracker.reset()
+
     def stop_monitoring(self):
         """İzlemeyi durdur"""
         self.is_monitoring = False
+        self.rule_engine.detach()
+        for topic in ("position", "battery", "connection_state"):
+            self.telemetry_hub.remove_listener(topic, self._update_state)
+        self.telemetry_hub.remove_listener(TelemetryHub.ANY_TOPIC, self._on_message)
+        self.heartbeat_tracker.stop()
         logger.info("Failsafe monitoring durduruldu")
 
 
+class FrameSlot:
+    """Yalnızca en son frame'i tutan, thread-safe tek elemanlı yuva (yeni frame eskisini düşürür)"""
+
+    def __init__(self, condition: Optional[threading.Condition] = None):
+        self._cond = condition or threading.Condition()
+        self.frame = None
+        self.seq = 0  # Yazılan frame sayısı (0 = henüz frame yok)
+        self.timestamp = 0.0  # Yakalama anı (time.time)
+        self.dropped = 0  # Okunmadan üzerine yazılan frame sayısı
+        self.closed = False
+        self._consumed = True
+
+    def put(self, frame, timestamp: float):
+        """Yeni frame'i yaz, okunmamış eskisini düşür ve bekleyenleri uyandır"""
+        with self._cond:
+            if not self._consumed:
+                self.dropped += 1
+            self.frame = frame
+            self.timestamp = timestamp
+            self.seq += 1
+            self._consumed = False
+            self._cond.notify_all()
+
+    def _take(self):
+        self._consumed = True
+        self._cond.notify_all()
+        return self.seq, self.timestamp, self.frame
+
+    def get(self, after_seq: int = 0):
+        """after_seq'ten yeni frame varsa (seq, timestamp, frame), yoksa None döndür"""
+        with self._cond:
+            if self.seq <= after_seq:
+                return None
+            return self._take()
+
+    def wait(self, after_seq: int = 0, timeout: Optional[float] = None):
+        """after_seq'ten yeni frame gelene, yuva kapanana veya süre dolana kadar bekle"""
+        with self._cond:
+            self._cond.wait_for(lambda: self.seq > after_seq or self.closed, timeout)
+            if self.seq <= after_seq:
+                return None
+            return self._take()
+
+    def wait_consumed(self, timeout: Optional[float] = None) -> bool:
+        """Son frame okunana veya yuva kapanana kadar bekle (üreticide geri basınç için)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._consumed or self.closed, timeout)
+
+    def close(self):
+        """Bekleyen tüm thread'leri uyandır"""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def reopen(self):
+        """Kapatılmış yuvayı yeniden kullanıma aç"""
+        with self._cond:
+            self.closed = False
+
+
+class FrameGrabber:
+    """Kamerayı ayrı thread'de sürekli okuyup en son frame'i FrameSlot'a yazan sınıf"""
+
+    def __init__(self, source=0, fps_alpha: float = 0.1):
+        self.source = source
+        self.fps_alpha = fps_alpha
+        self.slot = FrameSlot()
+        self.cap = None
+        self.fps = 0.0  # Ölçülen yakalama FPS'i (EWMA)
+        self.read_failures = 0
+        self._sinks = []
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self) -> bool:
+        """Kamerayı aç ve yakalama thread'ini başlat"""
+        self.cap = cv2.VideoCapture(self.source)
+        if not self.cap.isOpened():
+            self.cap.release()
+            return False
+
+        # Sürücü tamponunda frame birikmesin
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+        return True
+
+    def add_sink(self, callback: Callable):
+        """Her yeni frame'de yakalama thread'inden callback(frame, seq, timestamp) çağır"""
+        self._sinks.append(callback)
+
+    def is_running(self) -> bool:
+        """Yakalama thread'i çalışıyor mu"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _capture_loop(self):
+        """Kamerayı boşaltma döngüsü"""
+        last_time = None
+        try:
+            while not self._stop_event.is_set():
+                ret, frame = self.cap.read()
+                if not ret:
+                    self.read_failures += 1
+                    time.sleep(0.05)
+                    continue
+
+                timestamp = time.time()
+                if last_time is not None and timestamp > last_time:
+                    instant_fps = 1.0 / (timestamp - last_time)
+                    self.fps = instant_fps if not self.fps else \
+                        self.fps + self.fps_alpha * (instant_fps - self.fps)
+                last_time = timestamp
+
+                self.slot.put(frame, timestamp)
+                for sink in self._sinks:
+                    try:
+                        sink(frame, self.slot.seq, timestamp)
+                    except Exception as e:
+                        logger.error(f"Frame alıcı hatası: {e}")
+        finally:
+            self.cap.release()
+
+    def stop(self):
+        """Yakalamayı durdur; kamera yakalama thread'inde serbest bırakılır"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def get_stats(self) -> dict:
+        """Yakalama FPS'i, frame ve düşen frame sayıları"""
+        return {
+            'fps': self.fps,
+            'frames': self.slot.seq,
+            'dropped': self.slot.dropped,
+            'read_failures': self.read_failures,
+        }
+
+
+@dataclass
+class InferenceBackend:
+    """Yüklenmiş bir model ve ölçülen performansı"""
+    name: str
+    path: str
+    model: object = None
+    fps: float = 0.0
+    map50: Optional[float] = None
+
+
+class BackendSelector:
+    """best.pt'yi ONNX Runtime / OpenVINO'ya dışa aktarıp en hızlı CPU backend'ini seçen sınıf"""
+
+    def __init__(self, model_path: str, imgsz: int = 320, calibration_dir: Optional[str] = None):
+        self.model_path = model_path
+        self.imgsz = imgsz
+        self.calibration_dir = calibration_dir  # data.yaml içeriyorsa OpenVINO INT8 denenir
+        self.backends = []
+
+    @property
+    def calibration_data(self) -> Optional[str]:
+        """INT8 kalibrasyonu için data.yaml yolu (yoksa None)"""
+        if not self.calibration_dir:
+            return None
+        data_yaml = os.path.join(self.calibration_dir, "data.yaml")
+        return data_yaml if os.path.exists(data_yaml) else None
+
+    def sample_frames(self, limit: int = 16) -> list:
+        """Kalibrasyon setindeki gerçek kamera frame'lerinden eşit aralıklı örnek (yoksa boş)"""
+        if not self.calibration_dir:
+            return []
+        image_dir = os.path.join(self.calibration_dir, "images")
+        if not os.path.isdir(image_dir):
+            return []
+        names = sorted(name for name in os.listdir(image_dir) if name.lower().endswith((".jpg", ".png")))
+        step = max(1, len(names) // limit)
+        frames = [cv2.imread(os.path.join(image_dir, name)) for name in names[::step][:limit]]
+        return [frame for frame in frames if frame is not None]
+
+    def candidates(self) -> list:
+        """Kurulu paketlere göre denenecek backend adları"""
+        names = ["pytorch"]
+        if ONNXRUNTIME_AVAILABLE:
+            names.append("onnx")
+        if OPENVINO_AVAILABLE:
+            names.append("openvino")
+            if self.calibration_data:
+                names.append("openvino_int8")
+        return names
+
+    def _export_path(self, name: str) -> str:
+        """Ultralytics'in dışa aktarılan model için kullandığı yol"""
+        base = os.path.splitext(self.model_path)[0]
+        return {
+            "pytorch": self.model_path,
+            "onnx": base + ".onnx",
+            "openvino": base + "_openvino_model",
+            "openvino_int8": base + "_int8_openvino_model",
+        }[name]
+
+    def export(self, name: str) -> str:
+        """Backend için modeli dışa aktar; güncel bir dışa aktarım varsa yeniden kullan"""
+        path = self._export_path(name)
+        if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(self.model_path):
+            return path
+
+        logger.info(f"Model dışa aktarılıyor: {name}")
+        source = YOLO(self.model_path)
+        if name == "onnx":
+            return source.export(format="onnx", imgsz=self.imgsz, dynamic=True, simplify=True)
+        if name == "openvino":
+            return source.export(format="openvino", imgsz=self.imgsz, dynamic=True)
+        if name == "openvino_int8":
+            if not self.calibration_data:
+                raise RuntimeError("INT8 için kalibrasyon seti yok (canlı akıştan toplanır)")
+            return source.export(format="openvino", imgsz=self.imgsz, dynamic=True, int8=True,
+                                 data=self.calibration_data)
+        return path
+
+    def load(self, name: str) -> InferenceBackend:
+        """Backend'i (gerekirse dışa aktararak) yükle"""
+        path = self.export(name)
+        model = YOLO(path, task="detect") if name != "pytorch" else YOLO(path)
+        return InferenceBackend(name, path, model)
+
+    def benchmark(self, backend: InferenceBackend, frames: list, runs: int = 20) -> float:
+        """Frame'ler üzerinde tekil çıkarım FPS'ini ölç"""
+        for frame in frames[:2]:
+            backend.model(frame, imgsz=self.imgsz, verbose=False)  # Isınma
+
+        start_time = time.perf_counter()
+        for i in range(runs):
+            backend.model(frames[i % len(frames)], imgsz=self.imgsz, verbose=False)
+        elapsed = time.perf_counter() - start_time
+        backend.fps = runs / elapsed if elapsed else 0.0
+        return backend.fps
+
+    def select(self, frames: list) -> Optional[InferenceBackend]:
+        """Tüm adayları yükleyip ölç, en hızlısını döndür"""
+        self.backends = []
+        for name in self.candidates():
+            try:
+                backend = self.load(name)
+                self.benchmark(backend, frames)
+                self.backends.append(backend)
+                logger.info(f"Backend {name}: {backend.fps:.1f} FPS")
+            except Exception as e:
+                logger.warning(f"Backend {name} kullanılamadı: {e}")
+
+        if not self.backends:
+            return None
+        return max(self.backends, key=lambda backend: backend.fps)
+
+    def compare(self, frames: list, data_yaml: Optional[str] = None) -> list:
+        """Backend'leri PyTorch'a göre FPS ve (etiketli veri verilirse) mAP50 ile karşılaştır"""
+        if not self.backends:
+            self.select(frames)
+
+        for backend in self.backends:
+            if data_yaml:
+                try:
+                    metrics = backend.model.val(data=data_yaml, imgsz=self.imgsz, batch=1, verbose=False)
+                    backend.map50 = float(metrics.box.map50)
+                except Exception as e:
+                    logger.warning(f"Backend {backend.name} mAP ölçülemedi: {e}")
+
+        baseline = next((b for b in self.backends if b.name == "pytorch"), None)
+        report = []
+        for backend in self.backends:
+            row = {'backend': backend.name, 'fps': backend.fps, 'map50': backend.map50,
+                   'speedup': backend.fps / baseline.fps if baseline and baseline.fps else None,
+                   'map50_delta': (backend.map50 - baseline.map50)
+                   if baseline and backend.map50 is not None and baseline.map50 is not None else None}
+            report.append(row)
+
+            speedup = f"x{row['speedup']:.2f}" if row['speedup'] is not None else "-"
+            map_text = f"{backend.map50:.3f}" if backend.map50 is not None else "-"
+            delta = f"{row['map50_delta']:+.3f}" if row['map50_delta'] is not None else "-"
+            logger.info(f"{backend.name:14} | {backend.fps:6.1f} FPS ({speedup}) | mAP50 {map_text} ({delta})")
+        return report
+
+    @staticmethod
+    def write_calibration_set(frames: list, directory: str, class_names: dict) -> str:
+        """Örnek frame'leri INT8 kalibrasyonu için görüntü klasörü + data.yaml olarak kaydet"""
+        image_dir = os.path.join(directory, "images")
+        os.makedirs(image_dir, exist_ok=True)
+        for i, frame in enumerate(frames):
+            cv2.imwrite(os.path.join(image_dir, f"calib_{i:04d}.jpg"), frame)
+
+        data_yaml = os.path.join(directory, "data.yaml")
+        with open(data_yaml, "w", encoding="utf-8") as f:
+            f.write(f"path: {os.path.abspath(directory)}\ntrain: images\nval: images\nnames:\n")
+            for class_id, name in sorted(class_names.items()):
+                f.write(f"  {class_id}: {name}\n")
+        return data_yaml
+
+
+@dataclass
+class DetectionBoxes:
+    """Ayrı süreçten dönen kutular: (N, 6) float32 - x1, y1, x2, y2, skor, sınıf"""
+    data: np.ndarray
+
+
+@dataclass
+class DetectionResult:
+    """Ultralytics Results yerine geçen hafif sonuç (yalnızca .boxes.data)"""
+    boxes: DetectionBoxes
+
+
+def _inference_process_main(model_path: str, backend: str, calibration_dir: Optional[str], imgsz: int,
+                            shm_name: str, slot_bytes: int, requests, results):
+    """Çıkarım sürecinin ana döngüsü: frame'ler paylaşımlı bellekten okunur, yalnızca kutular döner"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = None
+    try:
+        processor = VideoProcessor(model_path, backend=backend, calibration_dir=calibration_dir, background_load=False)
+        if not processor.model:
+            results.put((0, "error", "Model yüklenemedi"))
+            return
+        model = processor.model
+        results.put((0, "ready", processor.backend_name))
+
+        while True:
+            request = requests.get()
+            if request is None:
+                break
+            request_id = request[0]
+            try:
+                _, request_imgsz, slots = request
+                frames = [np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_bytes)
+                          for slot, shape in slots]
+                outputs = model(frames, imgsz=request_imgsz or imgsz, verbose=False)
+                results.put((request_id, "ok", [np.asarray(output.boxes.data.cpu(), dtype=np.float32)
+                                                for output in outputs]))
+            except Exception as e:
+                results.put((request_id, "error", str(e)))
+            finally:
+                frames = None  # Paylaşımlı bellek görünümleri kapatmadan önce bırakılmalı
+    except Exception as e:
+        results.put((0, "error", str(e)))
+    finally:
+        frames = None
+        shm.close()
+
+
+class RemoteModel:
+    """YOLO modelini ayrı süreçte çalıştıran vekil; frame'ler paylaşımlı bellek yuvalarıyla gider"""
+
+    def __init__(self, model_path: str, backend: str = "auto", calibration_dir: Optional[str] = None,
+                 imgsz: int = 320, slots: int = 4, max_frame_shape: tuple = (1080, 1920, 3),
+                 timeout: float = 10.0, startup_timeout: float = 300.0):
+        self.model_path = model_path
+        self.backend = backend
+        self.calibration_dir = calibration_dir
+        self.imgsz = imgsz
+        self.slots = slots
+        self.slot_bytes = int(np.prod(max_frame_shape))
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout  # İlk çalıştırmada dışa aktarım uzun sürebilir
+        self.backend_name = None
+        self._shm = None
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._request_id = 0  # Zaman aşımından sonra gelen eski yanıtlar bununla ayıklanır
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Paylaşımlı belleği ayır ve çıkarım sürecini başlat (spawn)"""
+        try:
+            context = multiprocessing.get_context("spawn")
+            self._shm = shared_memory.SharedMemory(create=True, size=self.slots * self.slot_bytes)
+            self._requests = context.Queue()
+            self._results = context.Queue()
+            self._process = context.Process(
+                target=_inference_process_main,
+                args=(self.model_path, self.backend, self.calibration_dir, self.imgsz,
+                      self._shm.name, self.slot_bytes, self._requests, self._results),
+                daemon=True)
+            self._process.start()
+            _, status, payload = self._results.get(timeout=self.startup_timeout)
+        except queue.Empty:
+            status, payload = "error", "Çıkarım süreci zamanında hazır olmadı"
+        except Exception as e:
+            # Süreç ve paylaşımlı bellek her durumda serbest bırakılır
+            status, payload = "error", str(e)
+        if status != "ready":
+            logger.error(f"Çıkarım süreci başlatılamadı: {payload}")
+            self.close()
+            return False
+
+        self.backend_name = payload
+        logger.info(f"Çıkarım süreci hazır (pid {self._process.pid}, backend {payload})")
+        return True
+
+    def __call__(self, frames: list, imgsz: Optional[int] = None, verbose: bool = False) -> list:
+        """Frame'leri yuvalara kopyala, süreçten yalnızca kutu dizilerini al"""
+        outputs = []
+        with self._lock:
+            for start in range(0, len(frames), self.slots):
+                request = []
+                for slot, frame in enumerate(frames[start:start + self.slots]):
+                    if frame.nbytes > self.slot_bytes:
+                        raise ValueError(f"Frame yuvaya sığmıyor: {frame.shape}")
+                    view = np.ndarray(frame.shape, dtype=np.uint8, buffer=self._shm.buf,
+                                      offset=slot * self.slot_bytes)
+                    view[...] = frame
+                    request.append((slot, frame.shape))
+                del view
+
+                self._request_id += 1
+                self._requests.put((self._request_id, imgsz, request))
+                status, payload = self._wait_result(self._request_id)
+                if status != "ok":
+                    raise RuntimeError(payload)
+                if len(payload) != len(request):
+                    raise RuntimeError(f"Çıkarım süreci {len(request)} frame için "
+                                       f"{len(payload)} sonuç döndürdü")
+                outputs.extend(DetectionResult(DetectionBoxes(data)) for data in payload)
+        return outputs
+
+    def _wait_result(self, request_id: int):
+        """request_id'nin yanıtını bekle; önceki zaman aşımlarından kalan yanıtları at"""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                reply_id, status, payload = self._results.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise RuntimeError("Çıkarım süreci yanıt vermedi")
+            if reply_id == request_id:
+                return status, payload
+            logger.debug(f"Eski çıkarım yanıtı atlandı (#{reply_id}, beklenen #{request_id})")
+
+    def close(self):
+        """Süreci durdur, paylaşımlı belleği serbest bırak"""
+        if self._process:
+            if self._process.is_alive():
+                self._requests.put(None)
+                self._process.join(timeout=5.0)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        if self._shm:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+class AdaptiveInferenceController:
+    """Ölçülen çıkarım maliyeti ve CPU yüküne göre atlanan frame sayısını ve imgsz'yi ayarlayan sınıf"""
+
+    IMGSZ_LADDER = (224, 256, 320, 416, 512, 640)
+
+    def __init__(self, target_fps: float = 15.0, target_latency_ms: Optional[float] = None,
+                 initial_imgsz: int = 320, min_imgsz: int = 224, max_imgsz: int = 640, max_skip: int = 5,
+                 cpu_high: float = 85.0, cpu_low: float = 60.0, adjust_interval: float = 1.0,
+                 alpha: float = 0.2, min_skip: int = 0):
+        self.target_fps = target_fps  # Akışın gerçek zamanlı kalması gereken frame hızı
+        self.target_latency_ms = target_latency_ms  # Tek çıkarımın üst sınırı (opsiyonel)
+        self.ladder = [size for size in self.IMGSZ_LADDER if min_imgsz <= size <= max_imgsz]
+        self.level = min(range(len(self.ladder)), key=lambda i: abs(self.ladder[i] - initial_imgsz))
+        self.min_skip = max(0, min_skip)  # Takipçi varken dedektör her N. turda çalışabilir
+        self.max_skip = max(max_skip, self.min_skip)
+        self.cpu_high = cpu_high
+        self.cpu_low = cpu_low
+        self.adjust_interval = adjust_interval
+        self.alpha = alpha
+        self.skip = self.min_skip  # İki çıkarım arasında atlanan tur sayısı
+        self.cost_ms = None  # Mevcut imgsz'de tur başına çıkarım süresi (EWMA)
+        self.cpu_percent = None
+        self._tick = 0
+        self._last_adjust = time.monotonic()
+
+    @property
+    def imgsz(self) -> int:
+        """Bir sonraki çıkarımda kullanılacak çözünürlük"""
+        return self.ladder[self.level]
+
+    def should_infer(self) -> bool:
+        """Bu turda model çalışsın mı (aradaki turlarda son tespitler kullanılır)"""
+        infer = self._tick % (self.skip + 1) == 0
+        self._tick += 1
+        return infer
+
+    def record(self, inference_ms: float):
+        """Çıkarım süresini kaydet ve gerekirse ayarları güncelle"""
+        self.cost_ms = inference_ms if self.cost_ms is None else \
+            self.cost_ms + self.alpha * (inference_ms - self.cost_ms)
+        now = time.monotonic()
+        if now - self._last_adjust >= self.adjust_interval:
+            self._last_adjust = now
+            self._adjust()
+
+    @staticmethod
+    def _read_cpu_percent() -> Optional[float]:
+        """Sistem CPU yükü (%); ölçülemiyorsa None"""
+        if PSUTIL_AVAILABLE:
+            return psutil.cpu_percent(interval=None)
+        if hasattr(os, "getloadavg"):
+            return os.getloadavg()[0] / (os.cpu_count() or 1) * 100
+        return None
+
+    def _adjust(self):
+        """Bütçe aşılırsa önce frame atla, sonra çözünürlüğü düşür; boşta ise tersini yap"""
+        self.cpu_percent = self._read_cpu_percent()
+        busy = self.cpu_percent is not None and self.cpu_percent > self.cpu_high
+        idle = self.cpu_percent is None or self.cpu_percent < self.cpu_low
+        budget_ms = 1000.0 / self.target_fps
+        cost = self.cost_ms
+
+        if self.target_latency_ms and cost > self.target_latency_ms and self.level > 0:
+            self._set_level(self.level - 1)
+        elif cost > budget_ms * (self.skip + 1) or busy:
+            if self.skip < self.max_skip:
+                self.skip += 1
+            elif self.level > 0:
+                self._set_level(self.level - 1)
+        elif idle and self.skip > self.min_skip and cost < budget_ms * self.skip * 0.8:
+            self.skip -= 1
+        elif idle and self.skip == self.min_skip and self.level + 1 < len(self.ladder):
+            # Maliyet yaklaşık piksel sayısıyla ölçeklenir
+            predicted = cost * (self.ladder[self.level + 1] / self.imgsz) ** 2
+            within_latency = not self.target_latency_ms or predicted < self.target_latency_ms * 0.8
+            if predicted < budget_ms * (self.skip + 1) * 0.8 and within_latency:
+                self._set_level(self.level + 1)
+
+    def _set_level(self, level: int):
+        """Çözünürlük basamağını değiştir"""
+        self.level = level
+        self.cost_ms = None  # Yeni çözünürlükte maliyet yeniden ölçülür
+        logger.info(f"Çıkarım çözünürlüğü: imgsz={self.imgsz}, atlama={self.skip}")
+
+    def get_state(self) -> dict:
+        """Denetleyicinin mevcut ayarları ve ölçümleri"""
+        return {
+            'imgsz': self.imgsz,
+            'skip': self.skip,
+            'cost_ms': self.cost_ms,
+            'cpu_percent': self.cpu_percent,
+            'target_fps': self.target_fps,
+        }
+
+
+@dataclass
+class Track:
+    """Takip edilen tek nesne"""
+    track_id: int
+    box: np.ndarray  # x1, y1, x2, y2
+    score: float
+    class_id: int
+    velocity: np.ndarray = field(default_factory=lambda: np.zeros(4, dtype=np.float32))  # Tur başına
+    hits: int = 1
+    misses: int = 0
+    age: int = 0  # Son eşleşmeden beri geçen tur
+    reported: bool = False
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """(N, 4) ve (M, 4) kutular arasındaki IoU matrisi"""
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    return intersection / np.maximum(area_a[:, None] + area_b[None, :] - intersection, 1e-6)
+
+
+class IouTracker:
+    """SORT/ByteTrack tarzı hafif takipçi: sabit hız tahmini, iki aşamalı IoU eşleştirme"""
+
+    def __init__(self, iou_threshold: float = 0.3, high_threshold: float = 0.7, min_hits: int = 2,
+                 max_misses: int = 10, velocity_alpha: float = 0.5):
+        self.iou_threshold = iou_threshold
+        self.high_threshold = high_threshold  # Yeni iz yalnızca yüksek skorlu tespitten açılır
+        self.min_hits = min_hits  # Bu kadar eşleşmeden sonra iz doğrulanır ve raporlanır
+        self.max_misses = max_misses
+        self.velocity_alpha = velocity_alpha
+        self.tracks = []
+        self._next_id = 1
+
+    def predict(self):
+        """Dedektörün çalışmadığı turda izleri hızlarıyla ilerlet"""
+        for track in self.tracks:
+            track.box = track.box + track.velocity
+            track.age += 1
+
+    def _match(self, tracks: list, detections: np.ndarray) -> tuple:
+        """Aynı sınıftaki izlerle tespitleri IoU'ya göre açgözlü eşle"""
+        if not tracks or not len(detections):
+            return [], list(range(len(tracks))), list(range(len(detections)))
+
+        iou = box_iou(np.array([track.box for track in tracks]), detections[:, :4])
+        same_class = np.array([track.class_id for track in tracks])[:, None] == detections[:, 5].astype(np.int64)
+        iou[~same_class] = 0.0
+
+        matches = []
+        matched_tracks = set()
+        matched_detections = set()
+        for flat in np.argsort(-iou, axis=None):
+            track_index, detection_index = (int(i) for i in np.unravel_index(flat, iou.shape))
+            if iou[track_index, detection_index] < self.iou_threshold:
+                break
+            if track_index in matched_tracks or detection_index in matched_detections:
+                continue
+            matches.append((track_index, detection_index))
+            matched_tracks.add(track_index)
+            matched_detections.add(detection_index)
+
+        return (matches,
+                [i for i in range(len(tracks)) if i not in matched_tracks],
+                [i for i in range(len(detections)) if i not in matched_detections])
+
+    def _apply(self, track: Track, detection: np.ndarray):
+        """İzi eşleşen tespitle güncelle"""
+        box = detection[:4].astype(np.float32)
+        steps = max(track.age, 1)
+        velocity = (box - track.box + track.velocity * steps) / steps  # Tahmin öncesi konuma göre
+        track.velocity = track.velocity + self.velocity_alpha * (velocity - track.velocity)
+        track.box = box
+        track.score = float(detection[4])
+        track.hits += 1
+        track.misses = 0
+        track.age = 0
+
+    def update(self, detections: np.ndarray) -> list:
+        """Dedektör çıktısıyla izleri güncelle, bu turda doğrulanan yeni izleri döndür"""
+        self.predict()
+        high = detections[detections[:, 4] >= self.high_threshold]
+        low = detections[detections[:, 4] < self.high_threshold]
+
+        # 1. aşama: yüksek skorlu tespitler
+        matches, unmatched_tracks, unmatched_high = self._match(self.tracks, high)
+        for track_index, detection_index in matches:
+            self._apply(self.tracks[track_index], high[detection_index])
+
+        # 2. aşama: kalan izler düşük skorlu tespitlerle (örtülme, bulanıklık)
+        remaining = [self.tracks[i] for i in unmatched_tracks]
+        low_matches, still_unmatched, _ = self._match(remaining, low)
+        for track_index, detection_index in low_matches:
+            self._apply(remaining[track_index], low[detection_index])
+        for track_index in still_unmatched:
+            remaining[track_index].misses += 1
+
+        for detection_index in unmatched_high:
+            detection = high[detection_index]
+            self.tracks.append(Track(self._next_id, detection[:4].astype(np.float32), float(detection[4]),
+                                     int(detection[5])))
+            self._next_id += 1
+
+        self.tracks = [track for track in self.tracks if track.misses <= self.max_misses]
+
+        confirmed = []
+        for track in self.tracks:
+            if not track.reported and track.hits >= self.min_hits:
+                track.reported = True
+                confirmed.append(track)
+        return confirmed
+
+    def active(self, max_misses: int = 2) -> tuple:
+        """Gösterilecek doğrulanmış izler: ((N, 6) kutular, (N,) iz kimlikleri)"""
+        tracks = [track for track in self.tracks if track.hits >= self.min_hits and track.misses <= max_misses]
+        if not tracks:
+            return np.zeros((0, 6), dtype=np.float32), np.zeros(0, dtype=np.int64)
+        boxes = np.array([[*track.box, track.score, track.class_id] for track in tracks], dtype=np.float32)
+        return boxes, np.array([track.track_id for track in tracks], dtype=np.int64)
+
+
+@dataclass
+class ProcessedFrame:
+    """Çıkarım sonucu: ham frame, takip edilen kutular ve sınıf sayıları (çizim yapılmaz)"""
+    frame: np.ndarray
+    detections: np.ndarray  # (N, 6): x1, y1, x2, y2, skor, sınıf
+    counts: np.ndarray  # Sınıf başına tespit sayısı
+    track_ids: Optional[np.ndarray] = None
+
+
+@dataclass
+class VideoStream:
+    """VideoProcessor'a bağlı tek kamera akışı"""
+    name: str
+    input_slot: FrameSlot
+    output_slot: FrameSlot = field(default_factory=FrameSlot)
+    last_seq: int = 0  # Worker'ın aldığı son giriş frame'i
+    last_done_seq: int = 0  # İşi biten son giriş frame'i
+    frame_count: int = 0
+    tracker: IouTracker = field(default_factory=IouTracker)  # Dedektörün atladığı turları doldurur
+
+
 class VideoProcessor:
-    """Video işleme sınıfı"""
+    """Video işleme sınıfı (birden fazla kaynak, tek model, toplu çıkarım)"""
+
+    DEFAULT_SOURCE = "main"
+
+    CONFIDENCE_THRESHOLD = 0.7
+    TRACK_LOW_THRESHOLD = 0.3  # Takipçinin ikinci aşamada kullandığı en düşük skor
+    CLASS_COLORS = {0: (0, 255, 0), 1: (255, 0, 0), 2: (0, 0, 255)}  # BGR
+    CLASS_NAMES = {0: "Bottle", 1: "Box", 2: "Plastic"}
+
+    # INT8 kalibrasyon seti canlı akıştan saniyede bir frame alınarak toplanır
+    CALIBRATION_FRAMES = 64
+    CALIBRATION_INTERVAL_S = 1.0
 
-    def __init__(self, model_path: str, detection_callback=None):
+    def __init__(self, model_path: str, detection_callback=None, backend: str = "auto",
+                 calibration_dir: Optional[str] = None, out_of_process: bool = False,
+                 target_fps: float = 15.0, target_latency_ms: Optional[float] = None, detect_every: int = 1,
+                 background_load: bool = True):
         self.model_path = model_path
         self.model = None
+        self.out_of_process = out_of_process  # Model ayrı süreçte (RemoteModel) çalışır
+        self.backend = backend  # "auto" = CPU'da en hızlı backend ölçülerek seçilir
+        self.backend_name = None
+        self.calibration_dir = calibration_dir  # None = INT8 kalibrasyon seti toplanmaz
+        self.imgsz = 320
+        self.controller = AdaptiveInferenceController(target_fps, target_latency_ms, initial_imgsz=self.imgsz,
+                                                      min_skip=detect_every - 1)
+        self.inference_count = 0  # Modelin çalıştığı tur sayısı
+        self.inferred_frames = 0  # Modele verilen toplam frame (ortalama batch boyutu için)
+        self.last_batch_size = 0
         self.is_processing = False
-        self.input_queue = queue.Queue(maxsize=5)
-        self.output_queue = queue.Queue(maxsize=5)
         self.detection_callback = detection_callback
-        self.last_bottle_detection_time = 0
-        self.detection_cooldown = 5.0
-        self._load_model()
+        self.frame_count = 0  # İşlenen toplam frame
+        self.stage_ms = {}  # Aşama başına EWMA süre (ms)
+        self.last_stage_ms = {}
+        self.timing_alpha = 0.1
+        self.streams = {}
+        self._input_cond = threading.Condition()  # Tüm giriş yuvalarınca paylaşılır
+        self._done_cond = threading.Condition()
+        self._thread = None
+        self._model_loader = None  # Modeli yükleyen/backend seçen arka plan thread'i
+        self._closed = False
+        self._calibration_frames = []
+        self._last_calibration_sample = 0.0
+        self._needs_calibration = bool(calibration_dir) and \
+            not os.path.exists(os.path.join(calibration_dir, "data.yaml"))
+        self.add_source(self.DEFAULT_SOURCE)
+        if background_load:
+            # Dışa aktarım ve backend ölçümü ilk çalıştırmada dakikalar sürebilir, çağıran thread bekletilmez
+            self._model_loader = threading.Thread(target=self._load_model, daemon=True)
+            self._model_loader.start()
+        else:
+            self._load_model()
+
+    @property
+    def input_slot(self) -> FrameSlot:
+        """Varsayılan kaynağın giriş yuvası"""
+        return self.streams[self.DEFAULT_SOURCE].input_slot
+
+    @property
+    def output_slot(self) -> FrameSlot:
+        """Varsayılan kaynağın çıkış yuvası"""
+        return self.streams[self.DEFAULT_SOURCE].output_slot
+
+    def add_source(self, name: str) -> VideoStream:
+        """Yeni kamera akışı ekle; giriş yuvası ortak Condition'ı kullanır"""
+        with self._input_cond:
+            if name not in self.streams:
+                self.streams[name] = VideoStream(name, FrameSlot(self._input_cond))
+            return self.streams[name]
 
     def _load_model(self):
-        """YOLO modelini yükle"""
+        """YOLO modelini yükle; GPU yoksa en hızlı CPU backend'ini seç (model hazır olana kadar None kalır)"""
         try:
-            if os.path.exists(self.model_path):
-                self.model = YOLO(self.model_path)
-                if torch.cuda.is_available():
-                    self.model = self.model.cuda()
+            if not os.path.exists(self.model_path):
+                logger.warning(f"Model dosyası bulunamadı: {self.model_path}")
+                return
+
+            if self.out_of_process:
+                self._start_remote_model(RemoteModel(self.model_path, backend=self.backend,
+                                                     calibration_dir=self.calibration_dir, imgsz=self.imgsz))
+                return
+
+            if torch.cuda.is_available():
+                if self._set_model(YOLO(self.model_path).cuda(), "pytorch_cuda"):
                     logger.info(f"GPU Kullanılıyor: {torch.cuda.get_device_name(0)}")
-                else:
-                    logger.info("GPU bulunamadı, CPU kullanılıyor.")
+                return
+
+            logger.info("GPU bulunamadı, CPU kullanılıyor.")
+            selector = BackendSelector(self.model_path, imgsz=self.imgsz, calibration_dir=self.calibration_dir)
+            if self.backend == "auto":
+                chosen = selector.select(self._benchmark_frames(selector))
             else:
-                logger.warning(f"Model dosyası bulunamadı: {self.model_path}")
+                chosen = selector.load(self.backend)
+
+            if chosen and self._set_model(chosen.model, chosen.name):
+                logger.info(f"Çıkarım backend'i: {chosen.name} ({chosen.path})")
         except Exception as e:
             logger.error(f"Model yükleme hatası: {e}")
 
+    def _set_model(self, model, backend_name: str) -> bool:
+        """Yüklenen modeli devreye al; yükleme sürerken close() çağrıldıysa False"""
+        with self._input_cond:
+            if self._closed:
+                return False
+            self.model = model
+            self.backend_name = backend_name
+            return True
+
+    def _start_remote_model(self, remote: RemoteModel):
+        """Ayrı çıkarım sürecini başlat, hazır olunca modeli devreye al"""
+        if remote.start() and not self._set_model(remote, f"{remote.backend_name} (ayrı süreç)"):
+            remote.close()  # Başlatma sürerken kapatıldı
+
+    def _benchmark_frames(self, selector: BackendSelector) -> list:
+        """Backend ölçümü için gerçek frame'ler; kalibrasyon seti henüz yoksa gürültü"""
+        frames = selector.sample_frames()
+        if frames:
+            return frames
+        logger.warning("Kalibrasyon frame'i yok, backend ölçümü rastgele görüntüyle yapılıyor")
+        return [np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(4)]
+
+    def compare_backends(self, data_yaml: Optional[str] = None) -> list:
+        """CPU backend'lerini gerçek frame'lerde PyTorch'a göre karşılaştır (uzun sürer)"""
+        selector = BackendSelector(self.model_path, imgsz=self.imgsz, calibration_dir=self.calibration_dir)
+        return selector.compare(self._benchmark_frames(selector), data_yaml)
+
+    def _sample_calibration(self, batch: list):
+        """Kalibrasyon seti yoksa canlı frame'leri biriktir, dolunca arka planda diske yaz"""
+        now = time.monotonic()
+        if now - self._last_calibration_sample < self.CALIBRATION_INTERVAL_S:
+            return
+        self._last_calibration_sample = now
+        self._calibration_frames.append(batch[0][3].copy())
+        if len(self._calibration_frames) < self.CALIBRATION_FRAMES:
+            return
+
+        frames, self._calibration_frames = self._calibration_frames, []
+        self._needs_calibration = False
+        threading.Thread(target=self._write_calibration, args=(frames,), daemon=True).start()
+
+    def _write_calibration(self, frames: list):
+        """Toplanan frame'leri kalibrasyon seti olarak kaydet (ayrı thread)"""
+        try:
+            BackendSelector.write_calibration_set(frames, self.calibration_dir, self.CLASS_NAMES)
+            logger.info(f"INT8 kalibrasyon seti yazıldı ({len(frames)} frame): {self.calibration_dir}; "
+                        f"OpenVINO INT8 bir sonraki başlatmada denenir")
+        except Exception as e:
+            logger.error(f"Kalibrasyon seti yazma hatası: {e}")
+
     def start_processing(self):
         """Video işleme başlat"""
         if not self.model:
-            logger.error("Model yüklenmemiş, video işleme başlatılamıyor")
+            if self._model_loader and self._model_loader.is_alive():
+                logger.warning("Model henüz hazırlanıyor, video işleme başlatılamıyor")
+            else:
+                logger.error("Model yüklenmemiş, video işleme başlatılamıyor")
+            return
+
+        if self.is_processing:
             return
 
-        self.is_processing = True
-        processing_thread = threading.Thread(target=self._process_frames, daemon=True)
-        processing_thread.start()
-        logger.info("Video işleme başlatıldı")
+        with self._input_cond:
+            for stream in self.streams.values():
+                stream.input_slot.reopen()
+                stream.last_seq = stream.input_slot.seq  # Önceki oturumdan kalan frame işlenmez
+                stream.input_slot.dropped = 0  # Düşen frame sayısı oturum başına
+            self.is_processing = True
+        self._thread = threading.Thread(target=self._process_frames, daemon=True)
+        self._thread.start()
+        logger.info(f"Video işleme başlatıldı ({len(self.streams)} kaynak)")
+
+    def _record_timing(self, timings: dict):
+        """Aşama sürelerini sakla ve EWMA'yı güncelle"""
+        self.last_stage_ms = timings
+        for stage, elapsed_ms in timings.items():
+            previous = self.stage_ms.get(stage)
+            self.stage_ms[stage] = elapsed_ms if previous is None else \
+                previous + self.timing_alpha * (elapsed_ms - previous)
+
+    def _collect_batch(self, timeout: float) -> list:
+        """Herhangi bir kaynakta yeni frame olana kadar bekle, tüm yeni frame'leri topla"""
+        with self._input_cond:
+            self._input_cond.wait_for(
+                lambda: not self.is_processing or any(stream.input_slot.seq > stream.last_seq
+                                                      for stream in self.streams.values()),
+                timeout)
+            batch = []
+            for stream in self.streams.values():
+                item = stream.input_slot.get(stream.last_seq)
+                if item:
+                    stream.last_seq = item[0]
+                    batch.append((stream, *item))
+            return batch
+
+    def _filter_detections(self, result, threshold: Optional[float] = None) -> np.ndarray:
+        """Eşik ve sınıf filtresini ham kutu dizisinde vektörel uygula"""
+        data = result.boxes.data
+        if hasattr(data, "cpu"):
+            data = data.cpu().numpy()
+        data = np.asarray(data, dtype=np.float32).reshape(-1, 6)
+
+        threshold = self.CONFIDENCE_THRESHOLD if threshold is None else threshold
+        class_ids = data[:, 5].astype(np.int64)
+        keep = (data[:, 4] > threshold) & (class_ids >= 0) & (class_ids < len(self.CLASS_NAMES))
+        return data[keep]
+
+    def _publish_tracks(self, stream: VideoStream, frame, capture_time: float):
+        """Akışın aktif izlerini frame'le birlikte çıkış yuvasına yaz"""
+        boxes, track_ids = stream.tracker.active()
+        counts = np.bincount(boxes[:, 5].astype(np.int64), minlength=len(self.CLASS_NAMES))
+        stream.output_slot.put(ProcessedFrame(frame, boxes, counts, track_ids), capture_time)
+        stream.frame_count += 1
+
+    def draw_overlay(self, image, detections: np.ndarray, counts: np.ndarray,
+                     scale_x: float = 1.0, scale_y: float = 1.0, rgb: bool = True,
+                     track_ids: Optional[np.ndarray] = None):
+        """Kutuları ve sayaçları yalnızca gösterilen görüntünün üzerine çiz (yerinde)"""
+        def color_of(class_id):
+            color = self.CLASS_COLORS[class_id]
+            return color[::-1] if rgb else color
+
+        boxes = np.round(detections[:, :4] * (scale_x, scale_y, scale_x, scale_y)).astype(np.int32)
+        labels = track_ids.tolist() if track_ids is not None else [None] * len(detections)
+        for (x1, y1, x2, y2), score, class_id, track_id in zip(boxes.tolist(), detections[:, 4].tolist(),
+                                                               detections[:, 5].astype(np.int64).tolist(), labels):
+            color = color_of(class_id)
+            track_label = f" #{track_id}" if track_id is not None else ""
+            cv2.rectangle(image, (x1, y1), (x2, y2), color, 2)
+            cv2.putText(image, f"{self.CLASS_NAMES[class_id]}{track_label} {score:.2f}", (x1, y1 - 5),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
+
+        y_offset = 20
+        for class_id, count in enumerate(counts.tolist()):
+            cv2.putText(image, f"{self.CLASS_NAMES[class_id]}: {count}", (10, y_offset),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, color_of(class_id), 2, cv2.LINE_AA)
+            y_offset += 22
 
     def _process_frames(self):
-        """Frame işleme döngüsü"""
-        threshold = 0.7
-        class_colors = {0: (0, 255, 0), 1: (255, 0, 0), 2: (0, 0, 255)}
-        class_names = {0: "Bottle", 1: "Box", 2: "Plastic"}
-
+        """Frame işleme döngüsü: her turda tüm kaynakların yeni frame'leri tek model çağrısında işlenir"""
         while self.is_processing:
+            batch = self._collect_batch(timeout=0.5)
+            if not batch:
+                continue
+
             try:
-                if not self.input_queue.empty():
-                    frame = self.input_queue.get()
-                    start_time = time.time()
-
-                    results = self.model(frame, imgsz=320, verbose=False)[0]
-                    processed_frame = frame.copy()
-                    object_counts = {0: 0, 1: 0, 2: 0}
-
-                    bottle_detected = False
-
-                    for result in results.boxes.data.tolist():
-                        x1, y1, x2, y2, score, class_id = result
-
-                        if score > threshold and int(class_id) in class_colors:
-                            class_id = int(class_id)
-                            object_counts[class_id] += 1
-
-                            if class_id == 0:
-                                bottle_detected = True
-
-                            color = class_colors[class_id]
-                            cv2.rectangle(processed_frame, (int(x1), int(y1)), (int(x2), int(y2)), color, 2)
-                            cv2.putText(processed_frame, f"{class_names[class_id]} {score:.2f}",
-                                        (int(x1), int(y1) - 10),
-                                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2, cv2.LINE_AA)
-
-                    if bottle_detected and self.detection_callback:
-                        current_time = time.time()
-                        if current_time - self.last_bottle_detection_time > self.detection_cooldown:
-                            self.detection_callback("bottle", object_counts[0])
-                            self.last_bottle_detection_time = current_time
-
-                    y_offset = 30
-                    for class_id, count in object_counts.items():
-                        cv2.putText(processed_frame, f"{class_names[class_id]}: {count}",
-                                    (10, y_offset),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 1, class_colors[class_id], 2, cv2.LINE_AA)
-                        y_offset += 30
-
-                    processing_time = (time.time() - start_time) * 1000
-
-                    if self.output_queue.full():
-                        self.output_queue.get()
-                    self.output_queue.put(processed_frame)
-                else:
-                    time.sleep(0.01)
+                if self._needs_calibration:
+                    self._sample_calibration(batch)
+
+                if not self.controller.should_infer():
+                    # Atlanan tur: izler tahminle ilerletilip yeni frame'le yayınlanır
+                    for stream, _, capture_time, frame in batch:
+                        stream.tracker.predict()
+                        self._publish_tracks(stream, frame, capture_time)
+                    self.frame_count += len(batch)
+                    continue
+
+                start_time = time.perf_counter()
+                results = self.model([frame for _, _, _, frame in batch], imgsz=self.controller.imgsz,
+                                     verbose=False)
+                inference_done = time.perf_counter()
+                self.inference_count += 1
+                self.inferred_frames += len(batch)
+                self.last_batch_size = len(batch)
+                self.controller.record((inference_done - start_time) * 1000)
+
+                new_tracks = []
+                for (stream, _, capture_time, frame), result in zip(batch, results):
+                    detections = self._filter_detections(result, self.TRACK_LOW_THRESHOLD)
+                    new_tracks.extend((track, capture_time) for track in stream.tracker.update(detections))
+                    self._publish_tracks(stream, frame, capture_time)
+                self.frame_count += len(batch)
+
+                # Her yeni şişe izi bir kez raporlanır
+                if self.detection_callback:
+                    for track, capture_time in new_tracks:
+                        if track.class_id == 0:
+                            # Konum, tespitin çekildiği frame'in zamanına göre bulunur
+                            self.detection_callback("bottle", 1, capture_time, track.score)
+                done = time.perf_counter()
+
+                oldest_capture = min((capture_time for _, _, capture_time, _ in batch if capture_time),
+                                     default=0.0)
+                self._record_timing({
+                    'inference': (inference_done - start_time) * 1000,
+                    'inference_per_frame': (inference_done - start_time) * 1000 / len(batch),
+                    'postprocess': (done - inference_done) * 1000,
+                    'processing': (done - start_time) * 1000,
+                    'latency': (time.time() - oldest_capture) * 1000 if oldest_capture else 0.0,
+                })
             except Exception as e:
                 logger.error(f"Frame işleme hatası: {e}")
                 time.sleep(0.1)
+            finally:
+                with self._done_cond:
+                    for stream, seq, _, _ in batch:
+                        stream.last_done_seq = seq
+                    self._done_cond.notify_all()
+
+    def wait_processed(self, seq: int, timeout: Optional[float] = None, source: str = DEFAULT_SOURCE) -> bool:
+        """Kaynağın giriş yuvasındaki seq numaralı frame'in işi bitene kadar bekle"""
+        stream = self.streams[source]
+        with self._done_cond:
+            return self._done_cond.wait_for(lambda: stream.last_done_seq >= seq or not self.is_processing,
+                                            timeout)
+
+    def get_stats(self) -> dict:
+        """İşlenen/düşen frame sayıları ve aşama süreleri (ms)"""
+        return {
+            'frames': self.frame_count,
+            'dropped': sum(stream.input_slot.dropped for stream in self.streams.values()),
+            'backend': self.backend_name,
+            'inferences': self.inference_count,
+            'mean_batch_size': self.inferred_frames / self.inference_count if self.inference_count else 0.0,
+            'last_batch_size': self.last_batch_size,
+            'controller': self.controller.get_state(),
+            'sources': {name: {'frames': stream.frame_count, 'dropped': stream.input_slot.dropped}
+                        for name, stream in self.streams.items()},
+            'stage_ms': dict(self.stage_ms),
+            'last_stage_ms': dict(self.last_stage_ms),
+        }
+
+    def submit(self, frame, seq: int = 0, timestamp: float = 0.0, source: str = DEFAULT_SOURCE):
+        """Frame'i kaynağın giriş yuvasına yaz; işlenmemiş önceki frame düşer"""
+        if self.is_processing:
+            self.streams[source].input_slot.put(frame, timestamp)
 
     def stop_processing(self):
-        """Video işlemeyi durdur"""
-        self.is_processing = False
+        """Video işlemeyi durdur ve worker thread'in çıkmasını bekle"""
+        if not self.is_processing:
+            return
+        with self._input_cond:
+            self.is_processing = False
+            for stream in self.streams.values():
+                stream.input_slot.close()
+        with self._done_cond:
+            self._done_cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+        stats = self.get_stats()
+        stages = ", ".join(f"{stage} {ms:.1f}" for stage, ms in self.stage_ms.items())
+        logger.info(f"Video işleme durduruldu: {stats['frames']} frame, "
+                    f"{stats['dropped']} düşen frame, ortalama batch {stats['mean_batch_size']:.1f} ({stages} ms)")
+
+    def close(self):
+        """İşlemeyi durdur ve ayrı çıkarım sürecini kapat"""
+        self.stop_processing()
+        with self._input_cond:
+            self._closed = True
+        if isinstance(self.model, RemoteModel):
+            self.model.close()
+            self.model = None
+
+
+class DisplayPipeline:
+    """Gösterilecek frame'i worker thread'inde yeniden kullanılan RGB tamponlarına hazırlayan sınıf"""
+
+    def __init__(self, video_processor: VideoProcessor, buffer_count: int = 3, cost_alpha: float = 0.1):
+        self.video_processor = video_processor
+        self.buffer_count = buffer_count  # Biri ekranda, biri yuvada beklerken üçüncüsüne yazılır
+        self.cost_alpha = cost_alpha
+        self.slot = FrameSlot()  # Hazır tampon indeksi
+        self.size = (320, 240)
+        self.prepare_ms = 0.0  # Worker tarafı hazırlık süresi (EWMA)
+        self._buffers = []
+        self._resized = None  # BGR boyutlandırma tamponu (yalnızca worker)
+        self._next = 0
+        self._in_use = None  # Tk thread'inin o an kopyaladığı tampon
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self, source_slot: FrameSlot):
+        """Kaynak yuvayı (ham veya işlenmiş frame) izleyen worker'ı başlat"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._prepare_loop, args=(source_slot,), daemon=True)
+        self._thread.start()
+
+    def set_size(self, width: int, height: int):
+        """Hedef gösterim boyutu (Tk thread'inden; tamponlar worker'da yeniden ayrılır)"""
+        self.size = (max(1, width), max(1, height))
+
+    def _acquire_buffer(self, width: int, height: int) -> int:
+        """Ekranda veya yuvada beklemeyen bir tamponun indeksini döndür"""
+        if self._resized is None or self._resized.shape[:2] != (height, width):
+            self._resized = np.empty((height, width, 3), dtype=np.uint8)
+        with self._lock:
+            if not self._buffers:
+                self._buffers = [None] * self.buffer_count
+            pending = self.slot.frame if self.slot.seq else None
+            for _ in range(self.buffer_count):
+                index = self._next
+                self._next = (self._next + 1) % self.buffer_count
+                if index != self._in_use and index != pending:
+                    # Boyut değişince yalnızca yazılacak tampon yeniden ayrılır, yuvada bekleyen geçerli kalır
+                    if self._buffers[index] is None or self._buffers[index].shape[:2] != (height, width):
+                        self._buffers[index] = np.empty((height, width, 3), dtype=np.uint8)
+                    return index
+        raise RuntimeError("Boş gösterim tamponu yok")
+
+    def _prepare_loop(self, source_slot: FrameSlot):
+        """Yeni frame'i boyutlandır, RGB'ye çevir, overlay'i çiz ve yayınla"""
+        last_seq = source_slot.seq
+        while not self._stop_event.is_set():
+            item = source_slot.wait(last_seq, timeout=0.5)
+            if item is None:
+                continue
+            last_seq, timestamp, payload = item
+
+            try:
+                start_time = time.perf_counter()
+                detections = None
+                frame = payload
+                if isinstance(payload, ProcessedFrame):
+                    frame, detections, counts = payload.frame, payload.detections, payload.counts
+                    track_ids = payload.track_ids
+
+                width, height = self.size
+                index = self._acquire_buffer(width, height)
+                buffer = self._buffers[index]
+                cv2.resize(frame, (width, height), dst=self._resized)
+                cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=buffer)
+                if detections is not None:
+                    frame_height, frame_width = frame.shape[:2]
+                    self.video_processor.draw_overlay(buffer, detections, counts,
+                                                      width / frame_width, height / frame_height,
+                                                      track_ids=track_ids)
+                self.slot.put(index, timestamp)
+
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                self.prepare_ms = elapsed_ms if not self.prepare_ms else \
+                    self.prepare_ms + self.cost_alpha * (elapsed_ms - self.prepare_ms)
+            except Exception as e:
+                logger.error(f"Gösterim hazırlama hatası: {e}")
+
+    def take(self, after_seq: int):
+        """Yeni hazır tampon varsa kilitleyip (seq, tampon) döndür; iş bitince release() çağrılmalı"""
+        with self._lock:
+            item = self.slot.get(after_seq)
+            if item is None:
+                return None
+            seq, _, index = item
+            self._in_use = index
+            return seq, self._buffers[index]
+
+    def release(self):
+        """Tk thread'i tamponu kopyalamayı bitirdi"""
+        with self._lock:
+            self._in_use = None
+
+    def stop(self):
+        """Worker'ı durdur"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+
+class FlightReplay:
+    """Kaydedilmiş uçuşu canlı uçuşla aynı kod yollarından geçiren oynatıcı"""
+
+    def __init__(self, record_path: str, telemetry_hub, video_path: Optional[str] = None,
+                 video_processor=None, speed: Optional[float] = 1.0):
+        self.record_path = record_path
+        self.telemetry_hub = telemetry_hub
+        self.video_path = video_path
+        self.video_processor = video_processor
+        self.speed = speed  # None veya 0 = olabildiğince hızlı
+        self.records = FlightRecorder.load(record_path)
+        self.is_running = False
+        self.sample_count = 0
+        self.video_frame_count = 0
+        self._start_time = 0.0
+
+    def _wait_time(self, offset: float) -> float:
+        """Kayıttaki zaman farkına göre beklenecek süre"""
+        if not self.speed:
+            return 0.0
+        return offset / self.speed - (time.perf_counter() - self._start_time)
+
+    async def run(self) -> dict:
+        """Oynatmayı başlat, bitince throughput istatistiklerini döndür"""
+        if len(self.records) == 0:
+            logger.warning(f"Replay kaydı boş: {self.record_path}")
+            return {}
+
+        self.is_running = True
+        self._start_time = time.perf_counter()
+        processed_before = self.video_processor.frame_count if self.video_processor else 0
+        logger.info(f"Replay başladı: {len(self.records)} örnek, hız: {self.speed or 'maksimum'}")
+
+        video_thread = None
+        if self.video_path and self.video_processor:
+            video_thread = threading.Thread(target=self._feed_video, daemon=True)
+            video_thread.start()
+
+        start_timestamp = float(self.records['timestamp'][0])
+        self.telemetry_hub.publish("connection_state", ConnectionStateSample(is_connected=True))
+        last_flight_mode = None
+        last_armed = None
+
+        for record in self.records:
+            if not self.is_running:
+                break
+
+            delay = self._wait_time(float(record['timestamp']) - start_timestamp)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif self.sample_count % 100 == 0:
+                await asyncio.sleep(0)  # Maksimum hızda diğer görevlere de sıra ver
+
+            self.telemetry_hub.publish("position", PositionSample(
+                latitude_deg=float(record['lat']),
+                longitude_deg=float(record['lon']),
+                absolute_altitude_m=float('nan'),
+                relative_altitude_m=float(record['relative_alt'])
+            ))
+            if not np.isnan(record['battery']):
+                self.telemetry_hub.publish("battery", BatterySample(remaining_percent=float(record['battery'])))
+            if int(record['flight_mode']) != last_flight_mode and record['flight_mode'] >= 0:
+                last_flight_mode = int(record['flight_mode'])
+                self.telemetry_hub.publish("flight_mode", FlightMode(last_flight_mode))
+            if bool(record['armed']) != last_armed:
+                last_armed = bool(record['armed'])
+                self.telemetry_hub.publish("armed", last_armed)
+            self.sample_count += 1
+
+        if video_thread:
+            await asyncio.get_running_loop().run_in_executor(None, video_thread.join)
+
+        elapsed = time.perf_counter() - self._start_time
+        self.is_running = False
+        processed = (self.video_processor.frame_count - processed_before) if self.video_processor else 0
+        stats = {
+            'samples': self.sample_count,
+            'video_frames': self.video_frame_count,
+            'processed_frames': processed,
+            'elapsed_s': elapsed,
+            'samples_per_s': self.sample_count / elapsed if elapsed else 0.0,
+            'processed_fps': processed / elapsed if elapsed else 0.0,
+        }
+        logger.info(f"Replay tamamlandı: {stats['samples']} örnek, {stats['processed_frames']} frame, "
+                    f"{elapsed:.1f} s ({stats['samples_per_s']:.0f} örnek/s, {stats['processed_fps']:.1f} FPS)")
+        return stats
+
+    def _feed_video(self):
+        """Video dosyasını kayıt zamanına göre VideoProcessor giriş yuvasına besle (ayrı thread)"""
+        cap = cv2.VideoCapture(self.video_path)
+        if not cap.isOpened():
+            logger.error(f"Replay videosu açılamadı: {self.video_path}")
+            return
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        input_slot = self.video_processor.input_slot
+        try:
+            while self.is_running:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                delay = self._wait_time(self.video_frame_count / fps)
+                if delay > 0:
+                    time.sleep(delay)
+
+                if not self.speed:
+                    # Maksimum hızda tüm frame'ler işlenir: önceki frame alınana kadar bekle
+                    while self.is_running and self.video_processor.is_processing:
+                        if input_slot.wait_consumed(timeout=0.5):
+                            break
+                # Gerçek zamanlı oynatmada canlı akış gibi işlenmemiş frame düşer
+                self.video_processor.submit(frame, self.video_frame_count, time.time())
+                self.video_frame_count += 1
+
+            # Son frame'in işlenmesini bekle
+            self.video_processor.wait_processed(input_slot.seq, timeout=5.0)
+        finally:
+            cap.release()
+
+    def stop(self):
+        """Oynatmayı durdur"""
+        self.is_running = False
+
+
+@dataclass
+class SimFault:
+    """Simülasyonda zamanlanmış arıza"""
+    kind: str  # "link_loss", "battery_drop", "altitude_spike", "camera_timeout"
+    start_s: float  # Bağlantıdan itibaren başlangıç zamanı
+    duration_s: float = 5.0
+    magnitude: float = 0.0  # battery_drop: %, altitude_spike: metre
+
+
+@dataclass
+class HealthSample:
+    """MAVSDK Health ile aynı alanlara sahip örnek"""
+    is_global_position_ok: bool = True
+    is_home_position_ok: bool = True
+    is_armable: bool = True
+
+
+@dataclass
+class MissionProgressSample:
+    """MAVSDK MissionProgress ile aynı alanlara sahip örnek"""
+    current: int
+    total: int
+
+
+class SimulatedSystem:
+    """mavsdk.System yerine geçen, bu modülün kullandığı API alt kümesini taklit eden simülasyon"""
+
+    MIN_RATE_HZ = 1.0
+    MAX_RATE_HZ = 200.0
+    HOME_AMSL_M = 100.0  # Kalkış noktasının deniz seviyesinden yüksekliği
+
+    def __init__(self, rate_hz: float = 10.0, faults=None, home_lat: float = 45.0, home_lon: float = 37.5):
+        self.rate_hz = min(max(rate_hz, self.MIN_RATE_HZ), self.MAX_RATE_HZ)
+        self.faults = list(faults or [])
+        self.home_lat = home_lat
+        self.home_lon = home_lon
+
+        # Araç durumu
+        self.lat = home_lat
+        self.lon = home_lon
+        self.relative_alt = 0.0
+        self.battery = 100.0
+        self.armed = False
+        self.flight_mode = FlightMode.READY
+        self.target = None  # (lat, lon, alt)
+        self.horizontal_speed = 10.0  # m/s
+        self.vertical_speed = 3.0  # m/s
+        self.battery_drain = 0.05  # %/s (arm edilmişken)
+
+        self._start_time = None
+        self._last_step = None
+        self._applied_faults = set()
+
+        self.telemetry = _SimTelemetry(self)
+        self.action = _SimAction(self)
+        self.mission = _SimMission(self)
+        self.param = _SimParam(self)
+        self.camera = _SimCamera(self)
+        self.core = _SimCore(self)
+
+    @classmethod
+    def from_address(cls, address: str):
+        """'sim://<hz>?faults=<json dosyası>' adresinden simülasyon oluştur"""
+        parsed = urllib.parse.urlparse(address)
+        rate_hz = float(parsed.netloc or 10.0)
+        faults = []
+        fault_file = urllib.parse.parse_qs(parsed.query).get("faults")
+        if fault_file:
+            with open(fault_file[0], "r") as file:
+                faults = [SimFault(**fault) for fault in json.load(file)]
+        return cls(rate_hz=rate_hz, faults=faults)
+
+    async def connect(self, system_address: str = None):
+        """Simülasyon saatini başlat"""
+        self._start_time = time.monotonic()
+        self._last_step = self._start_time
+        logger.info(f"Simülasyon bağlandı: {self.rate_hz:.0f} Hz, {len(self.faults)} arıza senaryosu")
+
+    def elapsed(self) -> float:
+        """Bağlantıdan beri geçen süre"""
+        return time.monotonic() - self._start_time if self._start_time else 0.0
+
+    def active_faults(self) -> dict:
+        """Şu an aktif olan arızalar (tür -> arıza)"""
+        now = self.elapsed()
+        return {fault.kind: fault for fault in self.faults
+                if fault.start_s <= now < fault.start_s + fault.duration_s}
+
+    def _step(self):
+        """Araç durumunu geçen süreye göre ilerlet (her akış çağırabilir)"""
+        now = time.monotonic()
+        dt = now - self._last_step
+        self._last_step = now
+        if dt <= 0:
+            return
+
+        if self.armed:
+            self.battery = max(0.0, self.battery - self.battery_drain * dt)
+
+        # Pil düşüşü arızası bir kez uygulanır
+        for index, fault in enumerate(self.faults):
+            if fault.kind == "battery_drop" and index not in self._applied_faults and \
+                    self.elapsed() >= fault.start_s:
+                self._applied_faults.add(index)
+                self.battery = max(0.0, self.battery - fault.magnitude)
+
+        if self.target is None:
+            return
+
+        target_lat, target_lon, target_alt = self.target
+        meters_per_deg_lon = 111320.0 * math.cos(math.radians(self.lat))
+        north = (target_lat - self.lat) * 111320.0
+        east = (target_lon - self.lon) * meters_per_deg_lon
+        distance = math.hypot(north, east)
+        step = self.horizontal_speed * dt
+        if distance <= step:
+            self.lat, self.lon = target_lat, target_lon
+        else:
+            self.lat += north / distance * step / 111320.0
+            self.lon += east / distance * step / meters_per_deg_lon
+
+        climb = target_alt - self.relative_alt
+        vertical_step = self.vertical_speed * dt
+        self.relative_alt = target_alt if abs(climb) <= vertical_step else \
+            self.relative_alt + math.copysign(vertical_step, climb)
+
+        if self.is_at_target():
+            self.mission._on_target_reached()
+            if not self.is_at_target():
+                return  # Görev yeni hedef verdi (sonraki waypoint veya iniş), araç önce oraya gider
+            if self.flight_mode in (FlightMode.LAND, FlightMode.RETURN_TO_LAUNCH) and self.relative_alt <= 0.0:
+                # Yere inmeden disarm edilmez
+                self.armed = False
+                self.target = None
+                self.flight_mode = FlightMode.READY
+            elif self.flight_mode == FlightMode.RETURN_TO_LAUNCH:
+                self.target = (self.lat, self.lon, 0.0)
+            elif self.flight_mode == FlightMode.TAKEOFF:
+                self.flight_mode = FlightMode.HOLD
+
+    def is_at_target(self, acceptance_m: float = 1.0) -> bool:
+        """Hedefe ulaşıldı mı"""
+        if self.target is None:
+            return True
+        target_lat, target_lon, target_alt = self.target
+        north = (target_lat - self.lat) * 111320.0
+        east = (target_lon - self.lon) * 111320.0 * math.cos(math.radians(self.lat))
+        return math.hypot(north, east) <= acceptance_m and abs(target_alt - self.relative_alt) <= 0.5
+
+    async def stream(self, make_sample, rate_hz: Optional[float] = None):
+        """Sabit hızda örnek üreten akış; link_loss arızasında mesaj göndermez"""
+        period = 1.0 / (rate_hz or self.rate_hz)
+        next_time = time.monotonic()
+        while True:
+            next_time += period
+            await asyncio.sleep(max(0.0, next_time - time.monotonic()))
+            self._step()
+            if "link_loss" in self.active_faults():
+                continue
+            yield make_sample()
+
+
+class _SimTelemetry:
+    """Simülasyon telemetri eklentisi"""
+
+    def __init__(self, system):
+        self.system = system
+
+    def position(self):
+        system = self.system
+
+        def sample():
+            spike = system.active_faults().get("altitude_spike")
+            altitude = system.relative_alt + (spike.magnitude if spike else 0.0)
+            return PositionSample(system.lat, system.lon, altitude + system.HOME_AMSL_M, altitude)
+        return system.stream(sample)
+
+    def battery(self):
+        return self.system.stream(lambda: BatterySample(remaining_percent=self.system.battery, voltage_v=16.8))
+
+    def armed(self):
+        return self.system.stream(lambda: self.system.armed)
+
+    def flight_mode(self):
+        return self.system.stream(lambda: self.system.flight_mode)
+
+    def health(self):
+        return self.system.stream(HealthSample, rate_hz=1.0)
+
+
+class _SimAction:
+    """Simülasyon action eklentisi"""
+
+    def __init__(self, system):
+        self.system = system
+        self.takeoff_altitude = 10.0
+
+    async def arm(self):
+        self.system.armed = True
+
+    async def disarm(self):
+        self.system.armed = False
+
+    async def takeoff(self):
+        if not self.system.armed:
+            raise RuntimeError("Simülasyon: arm edilmeden kalkış yapılamaz")
+        self.system.flight_mode = FlightMode.TAKEOFF
+        self.system.target = (self.system.lat, self.system.lon, self.takeoff_altitude)
+
+    async def land(self):
+        self.system.flight_mode = FlightMode.LAND
+        self.system.target = (self.system.lat, self.system.lon, 0.0)
+
+    async def return_to_launch(self):
+        self.system.flight_mode = FlightMode.RETURN_TO_LAUNCH
+        self.system.target = (self.system.home_lat, self.system.home_lon, max(self.system.relative_alt, 10.0))
+
+    async def goto_location(self, latitude_deg, longitude_deg, absolute_altitude_m, yaw_deg):
+        self.system.flight_mode = FlightMode.HOLD
+        # Hedef mutlak irtifa (AMSL), simülasyon kalkış noktasına göre bağıl irtifayla uçar
+        self.system.target = (latitude_deg, longitude_deg, max(0.0, absolute_altitude_m - self.system.HOME_AMSL_M))
+
+    async def transition_to_fixedwing(self):
+        logger.info("Simülasyon: Fixed-Wing geçişi")
+
+    async def transition_to_multicopter(self):
+        logger.info("Simülasyon: MultiCopter geçişi")
+
+
+class _SimMission:
+    """Simülasyon mission eklentisi"""
+
+    def __init__(self, system):
+        self.system = system
+        self.items = []
+        self.current = 0
+        self.is_active = False
+
+    async def clear_mission(self):
+        self.items = []
+        self.current = 0
+        self.is_active = False
+
+    async def upload_mission(self, mission_plan):
+        self.items = list(mission_plan.mission_items)
+        self.current = 0
+
+    async def start_mission(self):
+        if not self.items:
+            raise RuntimeError("Simülasyon: yüklü mission yok")
+        self.is_active = True
+        self.system.flight_mode = FlightMode.MISSION
+        self._go_to_current()
+
+    def _go_to_current(self):
+        item = self.items[self.current]
+        self.system.target = (item.latitude_deg, item.longitude_deg, item.relative_altitude_m)
+
+    def _on_target_reached(self):
+        if not self.is_active:
+            return
+        self.current += 1
+        if self.current >= len(self.items):
+            self.is_active = False
+            self.system.flight_mode = FlightMode.LAND
+            self.system.target = (self.system.lat, self.system.lon, 0.0)
+        else:
+            self._go_to_current()
+
+    def mission_progress(self):
+        return self.system.stream(lambda: MissionProgressSample(self.current, len(self.items)), rate_hz=1.0)
+
+
+class _SimParam:
+    """Simülasyon parametre eklentisi"""
+
+    def __init__(self, system):
+        self.values = {}
+
+    async def get_param_int(self, name):
+        return self.values.get(name, 1)
+
+    async def set_param_int(self, name, value):
+        self.values[name] = value
+
+
+class _SimCamera:
+    """Simülasyon kamera eklentisi"""
+
+    def __init__(self, system):
+        self.system = system
+        self.mode = Mode.PHOTO
+
+    async def get_mode(self, camera_id=1):
+        if "camera_timeout" in self.system.active_faults():
+            await asyncio.sleep(30)  # Yanıt vermeyen kamera
+        return self.mode
+
+    async def set_mode(self, mode):
+        self.mode = mode
+
+
+class _SimCore:
+    """Simülasyon core eklentisi"""
+
+    def __init__(self, system):
+        self.system = system
+
+    async def connection_state(self):
+        """Bağlantı durumu değiştikçe yayınla (link_loss arızası bağlantıyı düşürür)"""
+        last_state = None
+        while True:
+            is_connected = "link_loss" not in self.system.active_faults()
+            if is_connected != last_state:
+                last_state = is_connected
+                yield ConnectionStateSample(is_connected=is_connected)
+            await asyncio.sleep(0.1)
+
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """İki nokta arasındaki büyük çember mesafesi (metre)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+class _StreamingSimplifier:
+    """Sapma toleransı aşılınca köşe noktası üreten çevrimiçi çizgi sadeleştirici"""
+
+    def __init__(self, tolerance_m: float, max_window: int = 64):
+        self.tolerance_m = tolerance_m
+        self.max_window = max_window  # Bekleyen nokta sınırı (maliyet ve gecikme üst sınırı)
+        self.anchor = None
+        self.pending = []
+
+    @staticmethod
+    def _segment_distance(point, start, end) -> float:
+        """Noktanın start-end doğru parçasına uzaklığı (ENU metre)"""
+        px, py = point
+        ax, ay = start
+        bx, by = end
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0.0:
+            return math.hypot(px - ax, py - ay)
+        t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+        return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+    def push(self, xy, lat_lon) -> list:
+        """Yeni noktayı ekle, kesinleşen köşe noktalarını (lat, lon) döndür"""
+        if self.anchor is None:
+            self.anchor = (xy, lat_lon)
+            return [lat_lon]
+
+        self.pending.append((xy, lat_lon))
+        anchor_xy = self.anchor[0]
+        for pending_xy, _ in self.pending[:-1]:
+            if self._segment_distance(pending_xy, anchor_xy, xy) > self.tolerance_m:
+                # Son geçerli nokta köşe olur, yeni parça ondan başlar
+                self.anchor = self.pending[-2]
+                self.pending = self.pending[-1:]
+                return [self.anchor[1]]
+
+        if len(self.pending) >= self.max_window:
+            self.anchor = self.pending[-1]
+            self.pending = []
+            return [self.anchor[1]]
+        return []
+
+
+class FlightTrack:
+    """Metrik seyreltilmiş ve çok çözünürlüklü sadeleştirilmiş uçuş izi"""
+
+    # Seviye başına sapma toleransı (metre); seviye 0 seyreltilmiş ham iz
+    LEVEL_TOLERANCES_M = (0.0, 2.0, 8.0, 32.0)
+
+    def __init__(self, min_spacing_m: float = 1.0):
+        self.min_spacing_m = min_spacing_m
+        self.levels = [[] for _ in self.LEVEL_TOLERANCES_M]
+        self._simplifiers = [_StreamingSimplifier(tolerance) for tolerance in self.LEVEL_TOLERANCES_M[1:]]
+        self._origin = None
+
+    def __len__(self):
+        return len(self.levels[0])
+
+    @property
+    def points(self) -> list:
+        """Seyreltilmiş ham iz"""
+        return self.levels[0]
+
+    def _to_enu(self, lat: float, lon: float):
+        """İlk noktaya göre yerel doğu/kuzey koordinatı (metre)"""
+        origin_lat, origin_lon = self._origin
+        x = math.radians(lon - origin_lon) * EARTH_RADIUS_M * math.cos(math.radians(origin_lat))
+        y = math.radians(lat - origin_lat) * EARTH_RADIUS_M
+        return x, y
+
+    def add(self, lat: float, lon: float) -> bool:
+        """Son noktaya min_spacing_m'den uzaksa noktayı tüm seviyelere ekle"""
+        raw = self.levels[0]
+        if raw:
+            last_lat, last_lon = raw[-1]
+            if haversine_m(last_lat, last_lon, lat, lon) < self.min_spacing_m:
+                return False
+        else:
+            self._origin = (lat, lon)
+
+        raw.append((lat, lon))
+        xy = self._to_enu(lat, lon)
+        for level, simplifier in enumerate(self._simplifiers, start=1):
+            self.levels[level].extend(simplifier.push(xy, (lat, lon)))
+        return True
+
+    def level_for_zoom(self, zoom: float, latitude: float, max_error_px: float = 2.0) -> int:
+        """Sapması ekranda max_error_px pikseli geçmeyen en kaba seviyeyi seç"""
+        meters_per_pixel = 156543.03392 * math.cos(math.radians(latitude)) / (2 ** zoom)
+        level = 0
+        for index, tolerance in enumerate(self.LEVEL_TOLERANCES_M):
+            if tolerance <= meters_per_pixel * max_error_px:
+                level = index
+        return level
+
+
+class TelemetryHistory:
+    """Zaman indeksli konum geçmişi; verilen ana ait pozisyonu enterpolasyonla bulur"""
+
+    def __init__(self, capacity: int = 36000, max_extrapolation_s: float = 0.5):
+        self.capacity = capacity  # 10 Hz'de ~1 saat
+        self.max_extrapolation_s = max_extrapolation_s
+        # Kapasitenin iki katı ayrılır; dolunca son yarı başa kaydırılır (amortize O(1) ekleme)
+        self._data = np.zeros((2 * capacity, 4), dtype=np.float64)  # ts, lat, lon, alt
+        self._start = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._end - self._start
+
+    def add(self, timestamp: float, lat: float, lon: float, alt: float):
+        """Yeni örnek ekle (zaman sırası bozulan örnek yok sayılır)"""
+        with self._lock:
+            if self._end > self._start and timestamp <= self._data[self._end - 1, 0]:
+                return
+            if self._end == len(self._data):
+                keep = self.capacity - 1
+                self._data[:keep] = self._data[self._end - keep:self._end]
+                self._start, self._end = 0, keep
+            self._data[self._end] = (timestamp, lat, lon, alt)
+            self._end += 1
+            if self._end - self._start > self.capacity:
+                self._start += 1
+
+    def pose_at(self, timestamp: float) -> Optional[tuple]:
+        """timestamp anındaki (lat, lon, alt); aralık dışında sınırlı ekstrapolasyon, yoksa None"""
+        with self._lock:
+            window = self._data[self._start:self._end]
+            if not len(window):
+                return None
+            times = window[:, 0]
+            index = int(np.searchsorted(times, timestamp))
+            if len(window) == 1:
+                return tuple(window[0, 1:].tolist())
+            # Uçlarda son iki örnekle doğrusal ekstrapolasyon, en fazla max_extrapolation_s
+            if index == 0:
+                timestamp = max(timestamp, times[0] - self.max_extrapolation_s)
+                index = 1
+            elif index == len(window):
+                timestamp = min(timestamp, times[-1] + self.max_extrapolation_s)
+                index = len(window) - 1
+            before, after = window[index - 1], window[index]
+            ratio = (timestamp - before[0]) / (after[0] - before[0])
+            return tuple((before[1:] + (after[1:] - before[1:]) * ratio).tolist())
+
+    def span(self) -> Optional[tuple]:
+        """Tutulan en eski ve en yeni örnek zamanı"""
+        with self._lock:
+            if self._end == self._start:
+                return None
+            return float(self._data[self._start, 0]), float(self._data[self._end - 1, 0])
+
+
+@dataclass
+class DetectionSite:
+    """Yakın tespitlerin birleştirildiği tek şişe alanı"""
+    site_id: int
+    lat: float
+    lon: float
+    altitude: float
+    first_seen: datetime
+    last_seen: datetime
+    count: int = 0  # Birleştirilen ham tespit sayısı
+    confidence: float = 0.0  # Tespitlerin en az birinin doğru olma olasılığı
+    x: float = 0.0  # Yerel doğu/kuzey koordinatı (metre)
+    y: float = 0.0
+
+
+class DetectionSiteIndex:
+    """Tespitleri merge_radius_m içinde alanlara birleştiren ızgara tabanlı mekansal indeks"""
+
+    def __init__(self, merge_radius_m: float = 3.0):
+        self.merge_radius_m = merge_radius_m
+        self.cell_size_m = merge_radius_m  # Birleştirme için komşu 3x3 hücreye bakmak yeter
+        self.sites = {}
+        self._cells = {}  # (hücre x, hücre y) -> alan id kümesi
+        self._origin = None
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.sites)
+
+    def _to_enu(self, lat: float, lon: float):
+        """İlk tespite göre yerel doğu/kuzey koordinatı (metre)"""
+        origin_lat, origin_lon = self._origin
+        x = math.radians(lon - origin_lon) * EARTH_RADIUS_M * math.cos(math.radians(origin_lat))
+        y = math.radians(lat - origin_lat) * EARTH_RADIUS_M
+        return x, y
+
+    def _cell(self, x: float, y: float):
+        return math.floor(x / self.cell_size_m), math.floor(y / self.cell_size_m)
+
+    def _candidates(self, x_min: float, y_min: float, x_max: float, y_max: float):
+        """Dikdörtgeni kesen hücrelerdeki alanlar (hücre sayısı alan sayısını aşarsa hepsi)"""
+        cell_x0, cell_y0 = self._cell(x_min, y_min)
+        cell_x1, cell_y1 = self._cell(x_max, y_max)
+        if (cell_x1 - cell_x0 + 1) * (cell_y1 - cell_y0 + 1) > len(self._cells):
+            return list(self.sites.values())
+        return [self.sites[site_id]
+                for cell_x in range(cell_x0, cell_x1 + 1)
+                for cell_y in range(cell_y0, cell_y1 + 1)
+                for site_id in self._cells.get((cell_x, cell_y), ())]
+
+    def add(self, lat: float, lon: float, altitude: float, timestamp: datetime,
+            confidence: float = 1.0, count: int = 1):
+        """Tespiti en yakın alana birleştir ya da yeni alan aç; (alan kopyası, yeni mi) döner"""
+        with self._lock:
+            if self._origin is None:
+                self._origin = (lat, lon)
+            x, y = self._to_enu(lat, lon)
+            radius = self.merge_radius_m
+            nearest, nearest_dist = None, radius
+            for site in self._candidates(x - radius, y - radius, x + radius, y + radius):
+                dist = math.hypot(site.x - x, site.y - y)
+                if dist <= nearest_dist:
+                    nearest, nearest_dist = site, dist
+
+            created = nearest is None
+            if created:
+                site = DetectionSite(self._next_id, lat, lon, altitude, timestamp, timestamp, x=x, y=y)
+                self._next_id += 1
+                self.sites[site.site_id] = site
+            else:
+                site = nearest
+                # Merkez, tespit sayısıyla ağırlıklı ortalama olarak kayar
+                weight = count / (site.count + count)
+                self._cells[self._cell(site.x, site.y)].discard(site.site_id)
+                site.lat += (lat - site.lat) * weight
+                site.lon += (lon - site.lon) * weight
+                site.altitude += (altitude - site.altitude) * weight
+                site.x, site.y = self._to_enu(site.lat, site.lon)
+                site.first_seen = min(site.first_seen, timestamp)
+                site.last_seen = max(site.last_seen, timestamp)
+
+            site.count += count
+            site.confidence = 1.0 - (1.0 - site.confidence) * (1.0 - min(max(confidence, 0.0), 1.0))
+            self._cells.setdefault(self._cell(site.x, site.y), set()).add(site.site_id)
+            return copy.copy(site), created
+
+    def query_radius(self, lat: float, lon: float, radius_m: float) -> list:
+        """Noktaya radius_m içindeki alanlar, yakından uzağa"""
+        with self._lock:
+            if self._origin is None:
+                return []
+            x, y = self._to_enu(lat, lon)
+            found = []
+            for site in self._candidates(x - radius_m, y - radius_m, x + radius_m, y + radius_m):
+                dist = math.hypot(site.x - x, site.y - y)
+                if dist <= radius_m:
+                    found.append((dist, site.site_id, copy.copy(site)))
+            return [site for _, _, site in sorted(found)]
+
+    def query_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> list:
+        """Enlem/boylam kutusu içindeki alanlar"""
+        with self._lock:
+            if self._origin is None:
+                return []
+            x_min, y_min = self._to_enu(min_lat, min_lon)
+            x_max, y_max = self._to_enu(max_lat, max_lon)
+            return [copy.copy(site) for site in self._candidates(x_min, y_min, x_max, y_max)
+                    if min_lat <= site.lat <= max_lat and min_lon <= site.lon <= max_lon]
+
+    def clear(self):
+        """Tüm alanları sil"""
+        with self._lock:
+            self.sites.clear()
+            self._cells.clear()
+            self._origin = None  # Id'ler sıfırlanmaz, bekleyen marker güncellemeleri karışmaz
+
+
+class MapPathRenderer:
+    """Uçuş yolunu sabit boyutlu parçalar halinde haritaya artımlı çizen sınıf"""
+
+    def __init__(self, map_widget, color: str = "blue", width: int = 3, chunk_size: int = 100):
+        self.map_widget = map_widget
+        self.color = color
+        self.width = width
+        self.chunk_size = chunk_size  # Tek CanvasPath'teki en fazla nokta
+        self.segments = []  # Tamamlanmış parçalar
+        self.tail = None  # Nokta eklenen son parça
+        self.tail_points = []
+        self.rendered_count = 0
+        self.generation = None
+        self.provisional = None  # Kesinleşmemiş son köşe (aracın son ham konumu)
+
+    def sync(self, points: list, generation, provisional: Optional[tuple] = None):
+        """Yeni noktaları çiz, varsa geçici son köşeyi (provisional) güncelle; generation değişirse baştan kur"""
+        if generation != self.generation:
+            self.clear()
+            self.generation = generation
+
+        new_points = points[self.rendered_count:]
+        if new_points and self.provisional is not None:
+            self._set_provisional(None)  # Kesin noktalar geçici köşenin önüne eklenmez
+        for lat, lon in new_points:
+            self._append(lat, lon)
+        self.rendered_count += len(new_points)
+
+        if provisional is not None and self.tail_points and tuple(provisional) == tuple(self.tail_points[-1]):
+            provisional = None
+        if provisional != self.provisional:
+            self._set_provisional(provisional)
+
+    def _set_provisional(self, point: Optional[tuple]):
+        """Son parçayı kesin noktalar + (varsa) geçici köşeyle yeniden kur (maliyet chunk_size ile sınırlı)"""
+        self.provisional = point
+        points = self.tail_points + ([point] if point is not None else [])
+        if len(points) < 2:
+            if self.tail is not None:
+                self.tail.delete()
+                self.tail = None
+        elif self.tail is None:
+            self.tail = self.map_widget.set_path(points, color=self.color, width=self.width)
+        else:
+            self.tail.set_position_list(points)
+
+    def _append(self, lat: float, lon: float):
+        """Son parçaya nokta ekle, parça dolunca yeni parçaya geç"""
+        self.tail_points.append((lat, lon))
+        if self.tail is not None:
+            # Sadece son parça yeniden çizilir, maliyet chunk_size ile sınırlı
+            self.tail.add_position(lat, lon)
+        elif len(self.tail_points) >= 2:
+            self.tail = self.map_widget.set_path(list(self.tail_points), color=self.color, width=self.width)
+
+        if len(self.tail_points) >= self.chunk_size:
+            self.segments.append(self.tail)
+            # Yeni parça öncekinin son noktasından başlar ki çizgi kopmasın
+            self.tail = None
+            self.tail_points = [(lat, lon)]
+
+    def set_color(self, color: str):
+        """Çizgi rengini değiştir (sadece renk farklıysa yeniden çizer)"""
+        if color == self.color:
+            return
+        self.color = color
+        for path in self.segments + ([self.tail] if self.tail else []):
+            path.path_color = color
+            path.draw()
+
+    def clear(self):
+        """Tüm parçaları haritadan sil"""
+        for path in self.segments + ([self.tail] if self.tail else []):
+            path.delete()
+        self.segments = []
+        self.tail = None
+        self.tail_points = []
+        self.rendered_count = 0
+        self.provisional = None
+
+
+class VehicleLink:
+    """Tek bir aracın bağlantısını, telemetri hub'ını, failsafe'ini ve uçuş yolunu tutan sınıf"""
+
+    def __init__(self, vehicle_id: str, address: Optional[str], gui_callback=None):
+        self.vehicle_id = vehicle_id
+        self.address = address  # None = replay aracı
+        self.gui_callback = gui_callback
+        self.drone = None
+        self.telemetry_hub = None
+        self.camera_cache = None
+        self.flight_recorder = None
+        self.failsafe_manager = None
+
+        # Araç durumu
+        self.current_lat = 45.0
+        self.current_lon = 37.5
+        self.flight_track = FlightTrack()
+        self.path_generation = 0  # Yol her temizlendiğinde artar
+        self.telemetry_history = TelemetryHistory()  # Tespitlerin çekim anı konumu için
+
+        # Harita nesneleri (sadece Tk thread'inden kullanılır)
+        self.marker = None
+        self.marker_is_active = None
+        self.path_renderer = None
+
+    async def connect(self, mavsdk_server_port: int):
+        """Araca bağlan ve telemetri, kayıt ve failsafe bileşenlerini başlat"""
+        if self.address.startswith("sim://"):
+            self.drone = SimulatedSystem.from_address(self.address)
+        else:
+            # Her araç kendi mavsdk_server'ını farklı gRPC portunda kullanır
+            self.drone = System(port=mavsdk_server_port)
+
+        logger.info(f"[{self.vehicle_id}] Bağlantı adresi: {self.address}")
+        await self.drone.connect(system_address=self.address)
+
+        async for state in self.drone.core.connection_state():
+            if state.is_connected:
+                logger.info(f"[{self.vehicle_id}] Drone bağlantısı başarılı!")
+                break
+
+        # Telemetri akışları tek sefer açılır, tüm tüketiciler hub'dan okur
+        await self._start_components()
+
+        # Kamera modu telemetri döngüsünü bekletmesin diye ayrı yenilenir
+        self.camera_cache = CameraModeCache(self.drone)
+        await self.camera_cache.start()
+
+        # Tüm telemetri örnekleri uçuş kaydına yazılır
+        record_path = os.path.join("flight_logs",
+                                   f"flight_{self.vehicle_id}_{datetime.now():%Y%m%d_%H%M%S}.bin")
+        self.flight_recorder = FlightRecorder(record_path)
+        self.flight_recorder.open()
+        self.flight_recorder.attach(self.telemetry_hub)
+
+    async def start_replay_mode(self):
+        """Araçsız hub ve failsafe başlat (replay verisiyle beslenir)"""
+        await self._start_components()
+
+    async def _start_components(self):
+        """Hub ve failsafe'i başlat"""
+        self.telemetry_hub = TelemetryHub(self.drone)
+        self.telemetry_hub.add_listener("position", self._on_position)
+        await self.telemetry_hub.start()
+
+        self.failsafe_manager = FailsafeManager(self.drone, self._failsafe_callback,
+                                                telemetry_hub=self.telemetry_hub)
+        await self.failsafe_manager.start_monitoring()
+
+    def _failsafe_callback(self, message: str):
+        """Failsafe mesajlarına araç kimliğini ekle"""
+        if self.gui_callback:
+            self.gui_callback(f"[{self.vehicle_id}] {message}")
+
+    @property
+    def flight_path(self) -> list:
+        """Seyreltilmiş ham uçuş yolu"""
+        return self.flight_track.points
+
+    def _on_position(self, topic: str, position):
+        """Konumu ve uçuş yolunu güncelle"""
+        self.current_lat = position.latitude_deg
+        self.current_lon = position.longitude_deg
+        timestamp = self.telemetry_hub.timestamps.get(topic, time.time()) if self.telemetry_hub else time.time()
+        self.telemetry_history.add(timestamp, self.current_lat, self.current_lon, position.relative_altitude_m)
+
+        # Metrik minimum mesafe kontrolü (çok sık güncellemeyi önle)
+        self.flight_track.add(self.current_lat, self.current_lon)
+
+    def clear_path(self):
+        """Uçuş yolunu mevcut konumdan yeniden başlat"""
+        track = FlightTrack()
+        track.add(self.current_lat, self.current_lon)
+        self.flight_track = track
+        self.path_generation += 1
+
+    def close(self, loop):
+        """Bileşenleri durdur (Tk thread'inden çağrılabilir)"""
+        if self.failsafe_manager:
+            self.failsafe_manager.stop_monitoring()
+        if self.telemetry_hub:
+            loop.call_soon_threadsafe(self.telemetry_hub.stop)
+        if self.camera_cache:
+            loop.call_soon_threadsafe(self.camera_cache.stop)
+        if self.flight_recorder:
+            self.flight_recorder.close()
+
+
+class FleetManager:
+    """Birden çok aracı aynı asyncio döngüsünde yöneten sınıf"""
+
+    BASE_SERVER_PORT = 50051  # İlk mavsdk_server gRPC portu
+
+    def __init__(self, gui_callback=None):
+        self.gui_callback = gui_callback
+        self.vehicles = {}  # Araç kimliği -> VehicleLink (bağlanma sırasıyla)
+        self.active_id = None
+        self._next_index = 1
+
+    def _new_vehicle(self, address: Optional[str], prefix: str = "UAV") -> VehicleLink:
+        """Sıradaki kimlikle araç oluştur"""
+        vehicle_id = f"{prefix}-{self._next_index}"
+        self._next_index += 1
+        return VehicleLink(vehicle_id, address, gui_callback=self.gui_callback)
+
+    async def connect(self, address: str) -> VehicleLink:
+        """Yeni araca bağlan ve filoya ekle"""
+        for vehicle in self.vehicles.values():
+            if vehicle.address == address:
+                raise RuntimeError(f"{address} zaten {vehicle.vehicle_id} tarafından kullanılıyor")
+
+        vehicle = self._new_vehicle(address)
+        await vehicle.connect(self.BASE_SERVER_PORT + self._next_index - 2)
+        self._add(vehicle)
+        return vehicle
+
+    async def add_replay_vehicle(self) -> VehicleLink:
+        """Replay verisiyle beslenecek araç ekle"""
+        vehicle = self._new_vehicle(None, prefix="REPLAY")
+        await vehicle.start_replay_mode()
+        self._add(vehicle)
+        return vehicle
+
+    def _add(self, vehicle: VehicleLink):
+        """Aracı filoya ekle, ilk araç aktif olur"""
+        self.vehicles[vehicle.vehicle_id] = vehicle
+        if self.active_id is None:
+            self.active_id = vehicle.vehicle_id
+        logger.info(f"Filoya eklendi: {vehicle.vehicle_id} (toplam {len(self.vehicles)})")
+
+    def get_active(self) -> Optional[VehicleLink]:
+        """Aktif aracı döndür"""
+        return self.vehicles.get(self.active_id)
+
+    def set_active(self, vehicle_id: str):
+        """Aktif aracı değiştir"""
+        if vehicle_id in self.vehicles:
+            self.active_id = vehicle_id
+            logger.info(f"Aktif araç: {vehicle_id}")
+
+    def close(self, loop):
+        """Tüm araçları kapat"""
+        for vehicle in self.vehicles.values():
+            vehicle.close(loop)
+
+
+class DetectionTable:
+    """Yalnızca görünen satırları çizen, sıralanabilir ve filtrelenebilir tespit tablosu"""
+
+    COLUMNS = [
+        # (anahtar, başlık, genişlik, biçim)
+        ("timestamp", "Zaman", 90, lambda d: d['timestamp'].strftime("%H:%M:%S")),
+        ("lat", "Enlem", 110, lambda d: f"{d['lat']:.6f}"),
+        ("lon", "Boylam", 110, lambda d: f"{d['lon']:.6f}"),
+        ("altitude", "İrtifa", 80, lambda d: f"{d['altitude']:.1f}m"),
+        ("count", "Adet", 60, lambda d: str(d['count'])),
+        ("site_id", "Alan", 60, lambda d: f"#{d['site_id']}"),
+    ]
+
+    def __init__(self, parent, detections: list, row_height: int = 20, refresh_ms: int = 500):
+        self.detections = detections  # Sahibi tarafından yerinde büyütülür, kopyalanmaz
+        self.row_height = row_height
+        self.refresh_ms = refresh_ms
+        self.sort_key = "timestamp"
+        self.sort_desc = False
+        self.filter_text = ""
+        self.view = []  # Filtreden geçen indeksler, her zaman artan sıralı
+        self.top_row = 0
+        self._seen = 0
+        self._slots = []  # Görünür satır başına yeniden kullanılan canvas öğeleri
+
+        header = ctk.CTkFrame(parent)
+        header.pack(fill="x", padx=10, pady=(5, 0))
+        self.header_buttons = {}
+        for key, title, width, _ in self.COLUMNS:
+            btn = ctk.CTkButton(header, text=title, width=width, command=lambda k=key: self.sort_by(k))
+            btn.pack(side="left", padx=1)
+            self.header_buttons[key] = btn
+
+        self.filter_entry = ctk.CTkEntry(header, placeholder_text="Filtre", width=120)
+        self.filter_entry.pack(side="right", padx=5)
+        self.filter_entry.bind("<KeyRelease>", lambda event: self.set_filter(self.filter_entry.get()))
+
+        body = ctk.CTkFrame(parent)
+        body.pack(fill="both", expand=True, padx=10, pady=5)
+        self.canvas = tkinter.Canvas(body, bg="#2b2b2b", highlightthickness=0)
+        self.scrollbar = ctk.CTkScrollbar(body, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.summary_label = ctk.CTkLabel(parent, text="", font=("Courier", 10))
+        self.summary_label.pack()
+
+        self.canvas.bind("<Configure>", lambda event: self.render())
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_rows(-3))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_rows(3))
+
+        self._rebuild_view()
+        self._update_header()
+        self.canvas.after(self.refresh_ms, self._tick)
+
+    def _sort_value(self, index: int):
+        """Sıralama anahtarı; eşitlikte eklenme sırası korunur"""
+        if self.sort_key == "timestamp":
+            return index
+        return (self.detections[index][self.sort_key], index)
+
+    def _row_text(self, detection: dict) -> list:
+        """Satırın sütun metinleri"""
+        return [fmt(detection) for _, _, _, fmt in self.COLUMNS]
+
+    def _matches(self, index: int) -> bool:
+        """Satır filtre metnini içeriyor mu"""
+        if not self.filter_text:
+            return True
+        return self.filter_text in " ".join(self._row_text(self.detections[index])).lower()
+
+    def _rebuild_view(self):
+        """Filtre veya sıralama değişince görünümü tamamen yeniden hesapla"""
+        self._seen = len(self.detections)
+        self.view = sorted((i for i in range(self._seen) if self._matches(i)), key=self._sort_value)
+
+    def _absorb_new(self) -> bool:
+        """Yeni eklenen tespitleri görünüme sıralı yerleştir"""
+        total = len(self.detections)
+        if total < self._seen:  # Liste temizlendi
+            self._rebuild_view()
+            return True
+        if total == self._seen:
+            return False
+        for index in range(self._seen, total):
+            if self._matches(index):
+                bisect.insort(self.view, index, key=self._sort_value)
+        self._seen = total
+        return True
+
+    def _tick(self):
+        """Canlı güncelleme: yalnızca yeni satır geldiyse yeniden çiz"""
+        if not self.canvas.winfo_exists():
+            return
+        try:
+            if self._absorb_new():
+                self.render()
+        except Exception as e:
+            logger.error(f"Tespit tablosu güncelleme hatası: {e}")
+        self.canvas.after(self.refresh_ms, self._tick)
+
+    def sort_by(self, key: str):
+        """Sütuna göre sırala; aynı sütuna tekrar tıklamak yönü değiştirir"""
+        if key == self.sort_key:
+            self.sort_desc = not self.sort_desc
+        else:
+            self.sort_key = key
+            self.sort_desc = False
+            self.view.sort(key=self._sort_value)
+        self._update_header()
+        self.render()
+
+    def set_filter(self, text: str):
+        """Filtre metnini uygula"""
+        text = text.strip().lower()
+        if text == self.filter_text:
+            return
+        self.filter_text = text
+        self._rebuild_view()
+        self.top_row = 0
+        self.render()
+
+    def _update_header(self):
+        """Sıralama yönünü başlıkta göster"""
+        for key, title, _, _ in self.COLUMNS:
+            arrow = (" ▼" if self.sort_desc else " ▲") if key == self.sort_key else ""
+            self.header_buttons[key].configure(text=title + arrow)
+
+    def _visible_count(self) -> int:
+        """Canvas'a sığan satır sayısı"""
+        return max(1, self.canvas.winfo_height() // self.row_height)
+
+    def _ensure_slots(self, count: int):
+        """Gerekirse satır yuvası ekle (yuvalar silinmez, yeniden kullanılır)"""
+        while len(self._slots) < count:
+            y = len(self._slots) * self.row_height
+            fill = "#333333" if len(self._slots) % 2 else "#2b2b2b"
+            background = self.canvas.create_rectangle(0, y, 10000, y + self.row_height, fill=fill, width=0)
+            texts = []
+            x = 5
+            for _, _, width, _ in self.COLUMNS:
+                texts.append(self.canvas.create_text(x, y + self.row_height // 2, anchor="w", fill="white",
+                                                     font=("Courier", 10), text=""))
+                x += width + 2
+            self._slots.append((background, texts))
+
+    def render(self):
+        """Yalnızca görünen satırları yuvalara yaz"""
+        visible = self._visible_count()
+        total = len(self.view)
+        self.top_row = max(0, min(self.top_row, total - visible))
+        self._ensure_slots(visible)
+
+        for slot, (background, texts) in enumerate(self._slots):
+            row = self.top_row + slot
+            if slot < visible and row < total:
+                position = total - 1 - row if self.sort_desc else row
+                values = self._row_text(self.detections[self.view[position]])
+                self.canvas.itemconfigure(background, state="normal")
+                for item, value in zip(texts, values):
+                    self.canvas.itemconfigure(item, text=value, state="normal")
+            else:
+                self.canvas.itemconfigure(background, state="hidden")
+                for item in texts:
+                    self.canvas.itemconfigure(item, state="hidden")
+
+        if total:
+            self.scrollbar.set(self.top_row / total, min(1.0, (self.top_row + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.summary_label.configure(text=f"{total} / {len(self.detections)} tespit, "
+                                          f"toplam {sum(self.detections[i]['count'] for i in self.view)} şişe")
+
+    def scroll_rows(self, delta: int):
+        """Satır bazında kaydır"""
+        self.top_row += delta
+        self.render()
+
+    def _on_mousewheel(self, event):
+        """Fare tekerleği ile kaydır"""
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, action, *args):
+        """Kaydırma çubuğu komutlarını satır indeksine çevir"""
+        if action == "moveto":
+            self.top_row = int(float(args[0]) * len(self.view))
+        elif action == "scroll":
+            step = self._visible_count() if args[1] == "pages" else 1
+            self.top_row += int(args[0]) * step
+        self.render()
+
+
+@dataclass
+class Notification:
+    """Kuyruktaki tek bildirim"""
+    title: str
+    message: str
+    level: str = "info"
+    count: int = 1
+    widget: object = None
+    label: object = None
+    dismiss_id: object = None
+
+
+class NotificationCenter:
+    """Herhangi bir thread'den gelen uyarıları Tk thread'inde modal olmayan bildirimler olarak gösteren sınıf"""
+
+    LEVEL_COLORS = {"info": "#2fa572", "warning": "orange", "error": "red"}
+    LEVEL_DURATIONS_MS = {"info": 4000, "warning": 8000, "error": 0}  # 0 = kullanıcı kapatana kadar
+
+    def __init__(self, max_visible: int = 4, poll_interval_ms: int = 100, status_reset_ms: int = 5000):
+        self.max_visible = max_visible
+        self.poll_interval_ms = poll_interval_ms
+        self.status_reset_ms = status_reset_ms
+        self.root = None
+        self.container = None
+        self.status_label = None
+        self.visible = []
+        self._pending = deque()  # Herhangi bir thread'den eklenir, Tk thread'inde boşaltılır
+        self._pending_status = None
+        self._status_reset_id = None
+
+    def notify(self, title: str, message: str, level: str = "info"):
+        """Bildirimi kuyruğa ekle (thread-safe, beklemez)"""
+        self._pending.append(Notification(title, message, level))
+
+    def set_status(self, message: str):
+        """Durum satırını güncelle (thread-safe, son mesaj geçerli)"""
+        self._pending_status = message
+
+    def attach(self, root, status_label=None):
+        """Pencereye bağlan ve kuyruğu periyodik olarak boşalt"""
+        self.root = root
+        self.status_label = status_label
+        self.container = ctk.CTkFrame(root, fg_color="transparent")
+        self.root.after(self.poll_interval_ms, self._poll)
+
+    def _poll(self):
+        """Bekleyen bildirimleri ve durum mesajını Tk thread'inde uygula"""
+        try:
+            while self._pending:
+                self._show(self._pending.popleft())
+
+            status, self._pending_status = self._pending_status, None
+            if status is not None and self.status_label:
+                self._apply_status(status)
+        except Exception as e:
+            logger.error(f"Bildirim gösterim hatası: {e}")
+        finally:
+            self.root.after(self.poll_interval_ms, self._poll)
+
+    def _show(self, notification: Notification):
+        """Bildirimi yığına ekle; aynısı görünüyorsa sayacını artır"""
+        for shown in self.visible:
+            if (shown.title, shown.message, shown.level) == (notification.title, notification.message,
+                                                               notification.level):
+                shown.count += 1
+                shown.label.configure(text=self._format(shown))
+                self._schedule_dismiss(shown)
+                return
+
+        while len(self.visible) >= self.max_visible:
+            self._dismiss(self.visible[0])
+
+        color = self.LEVEL_COLORS.get(notification.level, self.LEVEL_COLORS["info"])
+        toast = ctk.CTkFrame(self.container, border_width=2, border_color=color)
+        notification.label = ctk.CTkLabel(toast, text=self._format(notification), justify="left",
+                                          wraplength=320, anchor="w")
+        notification.label.pack(side="left", padx=10, pady=6, fill="x", expand=True)
+        close_btn = ctk.CTkButton(toast, text="✕", width=24, fg_color="transparent",
+                                  command=lambda: self._dismiss(notification))
+        close_btn.pack(side="right", padx=4, pady=4)
+        notification.widget = toast
+
+        toast.pack(fill="x", pady=3)
+        self.visible.append(notification)
+        self.container.place(relx=1.0, rely=0.0, x=-12, y=60, anchor="ne")
+        self.container.lift()
+        self._schedule_dismiss(notification)
+
+    @staticmethod
+    def _format(notification: Notification) -> str:
+        """Başlık, mesaj ve tekrar sayısını birleştir"""
+        suffix = f" (x{notification.count})" if notification.count > 1 else ""
+        return f"{notification.title}{suffix}\n{notification.message}"
+
+    def _schedule_dismiss(self, notification: Notification):
+        """Seviyeye göre otomatik kapanma zamanlayıcısını (yeniden) kur"""
+        if notification.dismiss_id:
+            self.root.after_cancel(notification.dismiss_id)
+            notification.dismiss_id = None
+        duration = self.LEVEL_DURATIONS_MS.get(notification.level, 0)
+        if duration:
+            notification.dismiss_id = self.root.after(duration, lambda: self._dismiss(notification))
+
+    def _dismiss(self, notification: Notification):
+        """Bildirimi yığından kaldır"""
+        if notification not in self.visible:
+            return
+        self.visible.remove(notification)
+        if notification.dismiss_id:
+            self.root.after_cancel(notification.dismiss_id)
+            notification.dismiss_id = None
+        notification.widget.destroy()
+        if not self.visible:
+            self.container.place_forget()
+
+    def _apply_status(self, message: str):
+        """Durum satırını yaz ve bir süre sonra 'Hazır'a döndür"""
+        self.status_label.configure(text=message)
+        if self._status_reset_id:
+            self.root.after_cancel(self._status_reset_id)
+        self._status_reset_id = self.root.after(self.status_reset_ms,
+                                                lambda: self.status_label.configure(text="Hazır"))
 
 
 class DroneGCS:
     """Ana GCS sınıfı"""
 
+    # Kamera kaynakları (ör. {"main": 0, "forward": 1}); ilki video panelinde gösterilir
+    VIDEO_SOURCES = {VideoProcessor.DEFAULT_SOURCE: 0}
+
+    # INT8 kalibrasyon frame'lerinin toplandığı klasör (kayıt klasörü altında; None = toplama)
+    CALIBRATION_DIR = os.path.join("flight_logs", "calibration")
+
+    # Çıkarımı ayrı süreçte çalıştır (opsiyonel; GIL, Tk ve asyncio thread'leriyle paylaşılmaz)
+    OUT_OF_PROCESS_INFERENCE = False
+
+    # Dedektör her N. frame'de çalışır, aradaki frame'leri takipçi doldurur
+    DETECT_EVERY_N_FRAMES = 2
+
+    # Bu mesafedeki şişe tespitleri haritada tek alan olarak birleştirilir (metre)
+    BOTTLE_MERGE_RADIUS_M = 3.0
+
+    # Donanımsız yük testi için simülasyon bağlantıları
+    SIM_PORTS = ["sim://10", "sim://50", "sim://200"]
+
+    # Filodaki araçlar için ayrı UDP uç noktaları
+    UDP_PORTS = [f"udp://:{14540 + i}" for i in range(10)]
+
+    # Araç bağlı değilken harita merkezi
+    DEFAULT_LAT = 45.0
+    DEFAULT_LON = 37.5
+
+    # Replay hız seçenekleri (None = olabildiğince hızlı)
+    REPLAY_SPEEDS = {"Replay 1x": 1.0, "Replay 10x": 10.0, "Replay Max": None}
+
     def __init__(self):
         # Global değişkenler
         # Şişe tespit sistemi için yeni değişkenler - BURAYA EKLEYİN
-        self.bottle_detections = []  # Tespit edilen şişe konumları
-        self.bottle_markers = []  # Haritadaki şişe markerları
-        self.drone = None
-        self.failsafe_manager = None
-        self.video_processor = VideoProcessor('/home/meg/best.pt', detection_callback=self._on_object_detected)
+        self.bottle_detections = []  # Tespit edilen ham şişe konumları
+        self.bottle_sites = DetectionSiteIndex(self.BOTTLE_MERGE_RADIUS_M)  # Birleştirilmiş şişe alanları
+        self.bottle_markers = {}  # Alan id -> haritadaki şişe markerı
+        self.detection_window = None
+        self.fleet = FleetManager(gui_callback=self._failsafe_callback)
+        self.video_processor = VideoProcessor('/home/meg/best.pt', detection_callback=self._on_object_detected,
+                                              out_of_process=self.OUT_OF_PROCESS_INFERENCE,
+                                              calibration_dir=self.CALIBRATION_DIR,
+                                              detect_every=self.DETECT_EVERY_N_FRAMES)
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
@@ -342,21 +3642,31 @@ class DroneGCS:
         self.info_label = None
         self.status_label = None
         self.log_text = None
-        self.drone_marker = None
-        self.path_line = None
+        self.notifications = NotificationCenter()
+        self.drone_marker = None  # Araç bağlanana kadar gösterilen marker
+        self._centered_vehicle_id = None
+        self.vehicle_menu = None
         self.video_canvas = None
-        self.cap = None
+        self.frame_grabbers = {}  # Kaynak adı -> FrameGrabber
+        self.display_pipeline = None
+        self._displayed_seq = 0
+        self._video_photo = None  # Kalıcı PhotoImage; yalnızca pikselleri güncellenir
+        self._video_image_item = None
+        self._video_stats_item = None
+        self._display_fps = 0.0
+        self._display_paste_ms = 0.0
+        self._last_display_time = None
         self.map_widget = None
 
         # Drone durumu
-        self.current_lat = 45.0
-        self.current_lon = 37.5
-        self.flight_path = []
         self.selected_port = None
+        self.replay = None
+        self.replay_speed = "Replay 1x"
+        self._telemetry_future = None
 
         # Log mesajlarını saklamak için
-        self.log_messages = []
-        self.max_log_messages = 50
+        self.log_sink = GuiLogSink()
+        self.log_search_entry = None
 
         # Event loop'u başlat
         self._start_asyncio_loop()
@@ -366,6 +3676,46 @@ class DroneGCS:
         log_handler.setLevel(logging.INFO)
         logger.addHandler(log_handler)
 
+    @property
+    def active_vehicle(self) -> Optional[VehicleLink]:
+        """Komutların ve bilgi panelinin kullandığı aktif araç"""
+        return self.fleet.get_active()
+
+    @property
+    def drone(self):
+        vehicle = self.active_vehicle
+        return vehicle.drone if vehicle else None
+
+    @property
+    def telemetry_hub(self):
+        vehicle = self.active_vehicle
+        return vehicle.telemetry_hub if vehicle else None
+
+    @property
+    def camera_cache(self):
+        vehicle = self.active_vehicle
+        return vehicle.camera_cache if vehicle else None
+
+    @property
+    def failsafe_manager(self):
+        vehicle = self.active_vehicle
+        return vehicle.failsafe_manager if vehicle else None
+
+    @property
+    def flight_path(self) -> list:
+        vehicle = self.active_vehicle
+        return vehicle.flight_path if vehicle else []
+
+    @property
+    def current_lat(self) -> float:
+        vehicle = self.active_vehicle
+        return vehicle.current_lat if vehicle else self.DEFAULT_LAT
+
+    @property
+    def current_lon(self) -> float:
+        vehicle = self.active_vehicle
+        return vehicle.current_lon if vehicle else self.DEFAULT_LON
+
     def _start_asyncio_loop(self):
         """Asenkron döngüyü başlat"""
         t = threading.Thread(target=self._run_asyncio_loop, daemon=True)
@@ -376,53 +3726,33 @@ class DroneGCS:
         asyncio.set_event_loop(self.loop)
         self.loop.run_forever()
 
-    def _add_log_message(self, message: str):
-        """Log mesajı ekle"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
+    def _add_log_message(self, message: str, levelno: int = logging.INFO):
+        """Log mesajı ekle (GUI'ye bir sonraki boşaltmada yazılır)"""
+        self.log_sink.add(message, levelno)
 
-        self.log_messages.append(formatted_message)
-
-        if len(self.log_messages) > self.max_log_messages:
-            self.log_messages.pop(0)
-
-        if self.log_text:
-            self.root.after(0, self._update_log_display)
-
-    def _update_log_display(self):
-        """Log görüntüsünü güncelle"""
-        if self.log_text:
-            self.log_text.configure(state="normal")
-            self.log_text.delete("1.0", "end")
-            for message in self.log_messages[-10:]:
-                self.log_text.insert("end", message + "\n")
-            self.log_text.configure(state="disabled")
-            self.log_text.see("end")
-
-    def _add_bottle_marker_to_map(self, lat: float, lon: float, count: int, timestamp: str):
-        """Haritaya şişe markeri ekle - YENİ FONKSİYON"""
+    def _add_bottle_marker_to_map(self, site: DetectionSite):
+        """Şişe alanının markerını ekle ya da mevcut markerı yerinde güncelle"""
         try:
             if hasattr(self, 'map_widget') and self.map_widget:
+                text = (f"🍼 Şişe x{site.count} (%{site.confidence * 100:.0f})\n"
+                        f"{site.last_seen.strftime('%H:%M:%S')}")
+                bottle_marker = self.bottle_markers.get(site.site_id)
+                if bottle_marker:
+                    bottle_marker.set_position(site.lat, site.lon)
+                    bottle_marker.set_text(text)
+                    return
+
                 # Şişe markeri oluştur - farklı renk ve simge kullan
-                bottle_marker = self.map_widget.set_marker(
-                    lat,
-                    lon,
-                    text=f"🍼 Şişe x{count}\n{timestamp}",
+                self.bottle_markers[site.site_id] = self.map_widget.set_marker(
+                    site.lat,
+                    site.lon,
+                    text=text,
                     marker_color_circle="blue",  # Mavi renk (drone kırmızı)
                     marker_color_outside="darkblue",  # Koyu mavi dış renk
                     font=("Arial", 8, "bold")
                 )
 
-                # Markeri listeye ekle (sonradan silebilmek için)
-                self.bottle_markers.append({
-                    'marker': bottle_marker,
-                    'lat': lat,
-                    'lon': lon,
-                    'count': count,
-                    'timestamp': timestamp
-                })
-
-                logger.info(f"Şişe markeri haritaya eklendi: ({lat:.6f}, {lon:.6f})")
+                logger.info(f"Şişe markeri haritaya eklendi: ({site.lat:.6f}, {site.lon:.6f})")
 
         except Exception as e:
             logger.error(f"Şişe markeri ekleme hatası: {e}")
@@ -430,11 +3760,12 @@ class DroneGCS:
     def clear_bottle_markers(self):
         """Haritadaki tüm şişe markerlarını temizle - YENİ FONKSİYON"""
         try:
-            for bottle_marker_info in self.bottle_markers:
-                bottle_marker_info['marker'].delete()
+            for bottle_marker in self.bottle_markers.values():
+                bottle_marker.delete()
 
             self.bottle_markers.clear()
             self.bottle_detections.clear()
+            self.bottle_sites.clear()
             logger.info("Tüm şişe markerleri temizlendi")
             self._update_status_label("Şişe markerleri temizlendi")
 
@@ -442,49 +3773,29 @@ class DroneGCS:
             logger.error(f"Şişe markerleri temizleme hatası: {e}")
 
     def show_bottle_detections(self):
-        """Tespit edilen şişelerin listesini göster - YENİ FONKSİYON"""
-        if not self.bottle_detections:
-            messagebox.showinfo("Şişe Tespitleri", "Henüz şişe tespiti yapılmamış.")
+        """Tespit edilen şişelerin listesini göster (canlı güncellenen sanal tablo)"""
+        if self.detection_window and self.detection_window.winfo_exists():
+            self.detection_window.lift()
             return
 
         # Yeni pencere oluştur
-        detection_window = ctk.CTkToplevel(self.root)
-        detection_window.title("Şişe Tespit Listesi")
-        detection_window.geometry("700x450")
+        self.detection_window = ctk.CTkToplevel(self.root)
+        self.detection_window.title("Şişe Tespit Listesi")
+        self.detection_window.geometry("700x450")
 
         # Başlık
-        title_label = ctk.CTkLabel(detection_window, text="🍼 Tespit Edilen Şişeler",
+        title_label = ctk.CTkLabel(self.detection_window, text="🍼 Tespit Edilen Şişeler",
                                    font=("Arial", 16, "bold"))
         title_label.pack(pady=10)
 
-        # Tablo başlığı
-        header_frame = ctk.CTkFrame(detection_window)
-        header_frame.pack(fill="x", padx=10, pady=5)
-
-        header_text = "Zaman     | Enlem      | Boylam     | İrtifa  | Adet"
-        header_label = ctk.CTkLabel(header_frame, text=header_text, font=("Courier", 12, "bold"))
-        header_label.pack(pady=5)
-
-        # Scrollable frame için container
-        scrollable_frame = ctk.CTkScrollableFrame(detection_window)
-        scrollable_frame.pack(fill="both", expand=True, padx=10, pady=5)
-
-        # Her tespit için satır oluştur
-        for i, detection in enumerate(self.bottle_detections):
-            timestamp = detection['timestamp'].strftime("%H:%M:%S")
-            text = f"{timestamp} | {detection['lat']:.6f} | {detection['lon']:.6f} | {detection['altitude']:.1f}m | {detection['count']}"
-
-            row_frame = ctk.CTkFrame(scrollable_frame)
-            row_frame.pack(fill="x", pady=1)
-
-            row_label = ctk.CTkLabel(row_frame, text=text, font=("Courier", 10))
-            row_label.pack(anchor="w", padx=5, pady=2)
+        DetectionTable(self.detection_window, self.bottle_detections)
 
         # Kapatma butonu
-        close_btn = ctk.CTkButton(detection_window, text="Kapat", command=detection_window.destroy)
+        close_btn = ctk.CTkButton(self.detection_window, text="Kapat", command=self.detection_window.destroy)
         close_btn.pack(pady=10)
 
-    def _on_object_detected(self, object_type: str, count: int):
+    def _on_object_detected(self, object_type: str, count: int, capture_time: Optional[float] = None,
+                            confidence: float = 1.0):
         """Nesne tespit edildiğinde çağrılan callback fonksiyonu - ŞİŞE MARKERİ EKLENDİ"""
         try:
             if object_type == "bottle":
@@ -495,89 +3806,118 @@ class DroneGCS:
                 if self.failsafe_manager and self.failsafe_manager.drone_state:
                     altitude = self.failsafe_manager.drone_state.altitude
 
-                # Şişe tespit bilgilerini sakla
+                # İşleme gecikmesi boyunca araç ilerlemiş olabilir: çekim anındaki konumu kullan
+                vehicle = self.active_vehicle
+                pose = vehicle.telemetry_history.pose_at(capture_time) if vehicle and capture_time else None
+                if pose:
+                    shift_m = haversine_m(lat, lon, pose[0], pose[1])
+                    lat, lon, altitude = pose
+                    logger.debug(f"Tespit konumu {(time.time() - capture_time) * 1000:.0f} ms gecikmeye göre "
+                                 f"düzeltildi ({shift_m:.1f} m)")
+
+                # Şişe tespit bilgilerini sakla; yakındaki tespitler aynı alana birleşir
+                detected_at = datetime.fromtimestamp(capture_time) if capture_time else datetime.now()
+                site, is_new_site = self.bottle_sites.add(lat, lon, altitude, detected_at, confidence, count)
                 detection_info = {
                     'lat': lat,
                     'lon': lon,
                     'altitude': altitude,
                     'count': count,
-                    'timestamp': datetime.now()
+                    'site_id': site.site_id,
+                    'timestamp': detected_at
                 }
                 self.bottle_detections.append(detection_info)
 
+                # Haritadaki alan markerını ekle/güncelle
+                if self.root:
+                    self.root.after(0, lambda: self._add_bottle_marker_to_map(site))
+
+                if not is_new_site:
+                    logger.debug(f"Şişe tespiti #{site.site_id} alanına birleştirildi (x{site.count})")
+                    return
+
                 location_info = f"Enlem: {lat:.6f}, Boylam: {lon:.6f}, İrtifa: {altitude:.2f}m"
-                timestamp = datetime.now().strftime("%H:%M:%S")
+                timestamp = detected_at.strftime("%H:%M:%S")
                 detection_message = f"🍼 ŞİŞE TESPİT EDİLDİ! [{timestamp}] Adet: {count} | Konum: {location_info}"
 
                 logger.info(detection_message)
-                self._update_status_label(f"Şişe tespit edildi! Adet: {count}")
-
-                # Haritaya şişe markeri ekle ve mesaj kutusunu göster
-                if self.root:
-                    self.root.after(0, lambda: self._add_bottle_marker_to_map(lat, lon, count, timestamp))
-                    self.root.after(0, lambda: self._show_detection_messagebox(count, location_info, timestamp))
+                self._update_status_label(f"Şişe tespit edildi! Toplam alan: {len(self.bottle_sites)}")
+                self.notifications.notify("Nesne Tespiti", f"🍼 Şişe tespit edildi! [{timestamp}] Adet: {count}\n{location_info}")
 
         except Exception as e:
             logger.error(f"Nesne tespit callback hatası: {e}")
 
-    def _show_detection_messagebox(self, count: int, location_info: str, timestamp: str):
-        """Tespit mesaj kutusunu göster"""
-        try:
-            message = f"🍼 Şişe tespit edildi!\n\nZaman: {timestamp}\nAdet: {count}\nKonum: {location_info}"
-            messagebox.showinfo("Nesne Tespiti", message)
-        except Exception as e:
-            logger.error(f"Mesaj kutusu gösterme hatası: {e}")
-
     def _failsafe_callback(self, message: str):
-        """Failsafe mesajlarını GUI'de göster"""
-        if self.status_label:
-            self.status_label.after(0, lambda: self._update_status_label(message))
-        messagebox.showwarning("Failsafe Uyarı", message)
+        """Failsafe mesajlarını GUI'de göster (event loop thread'ini bekletmez)"""
+        self._update_status_label(message)
+        self.notifications.notify("Failsafe Uyarı", message, "warning")
 
     def _update_status_label(self, message: str):
-        """Status label'ı güncelle"""
-        if self.status_label:
-            self.status_label.configure(text=message)
-            self.root.after(5000, lambda: self.status_label.configure(text="Hazır"))
+        """Status label'ı güncelle (herhangi bir thread'den çağrılabilir)"""
+        self.notifications.set_status(message)
 
     def _update_map(self):
-        """Harita üzerindeki drone konumu ve path'i güncelle"""
+        """Harita üzerindeki tüm araçların konumunu ve path'ini artımlı güncelle"""
         try:
             if hasattr(self, 'map_widget') and self.map_widget:
-                # Drone marker'ını güncelle
-                if self.drone_marker:
-                    self.drone_marker.delete()
-
-                self.drone_marker = self.map_widget.set_marker(
-                    self.current_lat,
-                    self.current_lon,
-                    text="🚁 Drone",
-                    marker_color_circle="red",
-                    marker_color_outside="darkred"
-                )
-
-                # Path çizgisini güncelle
-                if len(self.flight_path) > 1:
-                    # Mevcut path line'ı sil
-                    if hasattr(self, 'path_line') and self.path_line:
-                        self.path_line.delete()
+                vehicles = list(self.fleet.vehicles.values())
 
-                    # Yeni path line çiz
-                    self.path_line = self.map_widget.set_path(
-                        self.flight_path,
-                        color="blue",
-                        width=3
-                    )
-
-                # Harita merkezini drone konumuna odakla
-                self.map_widget.set_position(self.current_lat, self.current_lon)
+                # İlk araç bağlanınca yer tutucu marker kaldırılır
+                if vehicles and self.drone_marker:
+                    self.drone_marker.delete()
+                    self.drone_marker = None
+
+                for vehicle in vehicles:
+                    is_active = vehicle.vehicle_id == self.fleet.active_id
+
+                    # Marker yerinde taşınır, sadece aktiflik değişince yeniden oluşturulur
+                    if vehicle.marker is None or vehicle.marker_is_active != is_active:
+                        if vehicle.marker:
+                            vehicle.marker.delete()
+                        vehicle.marker = self.map_widget.set_marker(
+                            vehicle.current_lat,
+                            vehicle.current_lon,
+                            text=f"🚁 {vehicle.vehicle_id}",
+                            marker_color_circle="red" if is_active else "orange",
+                            marker_color_outside="darkred" if is_active else "darkorange"
+                        )
+                        vehicle.marker_is_active = is_active
+                    else:
+                        vehicle.marker.set_position(vehicle.current_lat, vehicle.current_lon)
+
+                    # Path'e sadece yeni noktalar eklenir, zoom'a uygun detay seviyesi çizilir
+                    if vehicle.path_renderer is None:
+                        vehicle.path_renderer = MapPathRenderer(self.map_widget)
+                    track = vehicle.flight_track
+                    level = track.level_for_zoom(self.map_widget.zoom, vehicle.current_lat)
+                    vehicle.path_renderer.set_color("blue" if is_active else "gray")
+                    # Kaba seviyeler yalnızca kesinleşmiş köşeleri tutar; çizgi son ham noktayla araca uzatılır
+                    provisional = track.points[-1] if level > 0 and track.points else None
+                    vehicle.path_renderer.sync(track.levels[level], (vehicle.path_generation, level), provisional)
+
+                # Harita sadece aktif drone görünür alanın kenarına yaklaşınca kaydırılır
+                if self.active_vehicle:
+                    self._keep_vehicle_in_view(self.active_vehicle)
 
                 logger.debug(
-                    f"Harita güncellendi - Drone: ({self.current_lat:.6f}, {self.current_lon:.6f}), Path noktaları: {len(self.flight_path)}")
+                    f"Harita güncellendi - {len(vehicles)} araç, Aktif: ({self.current_lat:.6f}, {self.current_lon:.6f}), Path noktaları: {len(self.flight_path)}")
 
         except Exception as e:
             logger.error(f"Harita güncelleme hatası: {e}")
 
+    def _keep_vehicle_in_view(self, vehicle: VehicleLink, margin: float = 0.2):
+        """Araç ekranın kenar payına girdiyse veya aktif araç değiştiyse haritayı ortala"""
+        marker = vehicle.marker
+        width = self.map_widget.winfo_width()
+        height = self.map_widget.winfo_height()
+        x, y = marker.get_canvas_pos(marker.position)
+
+        inside = (width * margin <= x <= width * (1 - margin) and
+                  height * margin <= y <= height * (1 - margin))
+        if not inside or self._centered_vehicle_id != vehicle.vehicle_id:
+            self.map_widget.set_position(vehicle.current_lat, vehicle.current_lon)
+            self._centered_vehicle_id = vehicle.vehicle_id
+
     def list_ports(self):
         """Mevcut portları listele"""
         try:
@@ -586,91 +3926,86 @@ class DroneGCS:
             for port in ports:
                 logger.info(f"Port: {port.device} - {port.description}")
                 port_list.append(port.device)
-            return port_list
+            return port_list + self.UDP_PORTS + self.SIM_PORTS
         except Exception as e:
             logger.error(f"Port listeleme hatası: {e}")
-            return []
+            return self.UDP_PORTS + self.SIM_PORTS
 
     def on_port_selected(self, choice):
         """Port seçim callback"""
         self.selected_port = choice
         logger.info(f"Seçilen port: {self.selected_port}")
 
+    def _connection_address(self, port: str) -> str:
+        """Seçilen porttan MAVSDK bağlantı adresini oluştur"""
+        if port.startswith(("sim://", "udp://", "serial://")):
+            return port
+        if "ttyUSB" in port or "ttyACM" in port:
+            return f"serial://{port}:115200"
+        return "udp://:14540"
+
     async def init_drone(self):
-        """Drone bağlantısını başlat"""
+        """Seçilen porttaki aracı filoya bağla"""
         try:
             if not self.selected_port:
-                messagebox.showerror("Hata", "Lütfen önce bir port seçin!")
+                self.notifications.notify("Hata", "Lütfen önce bir port seçin!", "error")
                 return
 
-            self.drone = System()
-
-            if "ttyUSB" in self.selected_port or "ttyACM" in self.selected_port:
-                connection_str = f"serial://{self.selected_port}:115200"
-            else:
-                connection_str = "udp://:14540"
-
-            logger.info(f"Bağlantı adresi: {connection_str}")
-            await self.drone.connect(system_address=connection_str)
-
-            async for state in self.drone.core.connection_state():
-                if state.is_connected:
-                    logger.info("Drone bağlantısı başarılı!")
-
-                    self.failsafe_manager = FailsafeManager(self.drone, self._failsafe_callback)
-                    asyncio.run_coroutine_threadsafe(self.failsafe_manager.start_monitoring(), self.loop)
-
-                    asyncio.run_coroutine_threadsafe(self._update_telemetry(), self.loop)
-                    break
+            await self.fleet.connect(self._connection_address(self.selected_port))
+            if self.root:
+                self.root.after(0, self._refresh_vehicle_menu)
+            self._start_telemetry_updates()
         except Exception as e:
             logger.error(f"Drone bağlantı hatası: {e}")
-            messagebox.showerror("Bağlantı Hatası", f"Drone'a bağlanılamadı: {e}")
+            self.notifications.notify("Bağlantı Hatası", f"Drone'a bağlanılamadı: {e}", "error")
+
+    def _start_telemetry_updates(self):
+        """GUI telemetri döngüsünü (henüz çalışmıyorsa) başlat"""
+        if self._telemetry_future is None or self._telemetry_future.done():
+            self._telemetry_future = asyncio.run_coroutine_threadsafe(self._update_telemetry(), self.loop)
 
     async def _update_telemetry(self):
         """Telemetri verilerini güncelle"""
         while True:
             try:
-                if not self.drone:
+                vehicle = self.active_vehicle
+                if not vehicle or not vehicle.telemetry_hub:
                     await asyncio.sleep(1)
                     continue
 
-                # Pozisyon bilgisi
-                pos = await self.drone.telemetry.position().__anext__()
-                self.current_lat = pos.latitude_deg
-                self.current_lon = pos.longitude_deg
-                alt = pos.relative_altitude_m
+                # Panel alanları eşzamanlı toplanır, eksik alan diğerlerini bekletmez
+                pos, battery = await self._collect_info_fields(vehicle.telemetry_hub, "position", "battery")
+                if pos is None:
+                    await asyncio.sleep(1)
+                    continue
 
-                # Uçuş yolunu güncelle
-                if self.flight_path and (self.current_lat, self.current_lon) != self.flight_path[-1]:
-                    # Minimum mesafe kontrolü (çok sık güncellemeyi önle)
-                    last_lat, last_lon = self.flight_path[-1]
-                    distance = math.sqrt((self.current_lat - last_lat) ** 2 + (self.current_lon - last_lon) ** 2)
-                    if distance > 0.00001:  # ~1 metre
-                        self.flight_path.append((self.current_lat, self.current_lon))
-                elif not self.flight_path:
-                    self.flight_path.append((self.current_lat, self.current_lon))
+                alt = pos.relative_altitude_m
 
                 # Batarya bilgisi
-                battery = await self.drone.telemetry.battery().__anext__()
-                batarya = battery.remaining_percent
+                batarya = f"{battery.remaining_percent:.1f}%" if battery is not None else "-"
 
-                # Kamera bilgisi
-                camera_info = "Bağlantı yok"
-                try:
-                    if self.drone and hasattr(self.drone, 'camera'):
-                        camera_mode = await self.drone.camera.get_mode(1)
-                        camera_info = "FOTOĞRAF modu" if camera_mode == Mode.PHOTO else "VİDEO modu"
-                except Exception:
-                    camera_info = "ERİŞİLEMİYOR"
+                # Kamera bilgisi (önbellekten, RPC beklemeden)
+                camera_info = vehicle.camera_cache.describe() if vehicle.camera_cache else "Bağlantı yok"
 
                 # GUI güncelle
                 if self.info_label:
-                    info_text = (f"Lat: {self.current_lat:.6f}\n"
-                                 f"Lon: {self.current_lon:.6f}\n"
+                    info_text = (f"Araç: {vehicle.vehicle_id}\n"
+                                 f"Lat: {vehicle.current_lat:.6f}\n"
+                                 f"Lon: {vehicle.current_lon:.6f}\n"
                                  f"Alt: {alt:.2f} m\n"
-                                 f"Batarya: {batarya:.1f}%\n"
+                                 f"Batarya: {batarya}\n"
                                  f"Kamera: {camera_info}\n"
-                                 f"Path: {len(self.flight_path)} nokta")
+                                 f"Path: {len(vehicle.flight_path)} nokta")
+                    if vehicle.failsafe_manager:
+                        tracker = vehicle.failsafe_manager.heartbeat_tracker
+                        info_text += (f"\nLink: %{tracker.get_link_quality() * 100:.0f} "
+                                      f"({tracker.get_rate():.1f} Hz, jitter {tracker.jitter * 1000:.0f} ms)")
+
+                    # Birden çok araç varsa tümünün özeti yan yana gösterilir
+                    if len(self.fleet.vehicles) > 1:
+                        info_text += "\n\nFİLO:"
+                        for other in list(self.fleet.vehicles.values()):
+                            info_text += "\n" + self._vehicle_summary(other)
 
                     self.info_label.after(0, lambda: self.info_label.configure(text=info_text))
 
@@ -683,6 +4018,36 @@ class DroneGCS:
                 logger.error(f"Telemetri güncelleme hatası: {e}")
                 await asyncio.sleep(2)
 
+    def _vehicle_summary(self, vehicle: VehicleLink) -> str:
+        """Filo listesi için tek satırlık araç özeti"""
+        hub = vehicle.telemetry_hub
+        battery = hub.get("battery") if hub else None
+        position = hub.get("position") if hub else None
+        link = vehicle.failsafe_manager.heartbeat_tracker.get_link_quality() if vehicle.failsafe_manager else 0.0
+        prefix = "▶" if vehicle.vehicle_id == self.fleet.active_id else " "
+        battery_text = f"%{battery.remaining_percent:.0f}" if battery is not None else "-"
+        altitude_text = f"{position.relative_altitude_m:.0f}m" if position is not None else "-"
+        return f"{prefix} {vehicle.vehicle_id}: {battery_text} {altitude_text} link %{link * 100:.0f}"
+
+    async def _collect_info_fields(self, telemetry_hub, *topics, timeout: float = 0.5):
+        """Hub konularını eşzamanlı topla, zamanında gelmeyen alan None döner"""
+        results = await asyncio.gather(
+            *(telemetry_hub.wait_for(topic, timeout=timeout) for topic in topics),
+            return_exceptions=True
+        )
+        return [None if isinstance(result, Exception) else result for result in results]
+
+    def on_vehicle_selected(self, choice):
+        """Aktif araç seçim callback"""
+        self.fleet.set_active(choice)
+        self._update_map()
+
+    def _refresh_vehicle_menu(self):
+        """Araç seçim menüsünü filoya göre güncelle"""
+        if self.vehicle_menu and self.fleet.vehicles:
+            self.vehicle_menu.configure(values=list(self.fleet.vehicles))
+            self.vehicle_menu.set(self.fleet.active_id)
+
     def manual_failsafe(self):
         """Manuel failsafe tetikleme"""
         if self.failsafe_manager:
@@ -693,17 +4058,17 @@ class DroneGCS:
                 asyncio.run_coroutine_threadsafe(self.failsafe_manager.manual_failsafe(), self.loop)
                 logger.warning("Manuel failsafe tetiklendi!")
         else:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
 
-    async def check_arm_status(self):
+    async def check_arm_status(self, vehicle: Optional[VehicleLink] = None):
         """Drone arm durumunu kontrol et"""
-        if not self.drone:
+        vehicle = vehicle or self.active_vehicle
+        if not vehicle or not vehicle.drone or not vehicle.telemetry_hub:
             return False
 
         try:
-            # Tek seferlik kontrol
-            armed_stream = self.drone.telemetry.armed()
-            armed = await armed_stream.__anext__()
+            # Hub'daki son değeri kullan
+            armed = await vehicle.telemetry_hub.wait_for("armed", timeout=3.0)
             return armed
         except Exception as e:
             logger.error(f"Arm kontrol hatası: {e}")
@@ -713,18 +4078,23 @@ class DroneGCS:
     def arm_drone(self):
         """Drone'u arm et"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def arm():
-            is_armed = await self.check_arm_status()
+            is_armed = await self.check_arm_status(vehicle)
             try:
                 if is_armed:
-                    messagebox.showinfo("Bilgi", "Drone zaten arm edilmiş!")
+                    self.notifications.notify("Bilgi", "Drone zaten arm edilmiş!")
                     return
                 logger.info("Drone arm ediliyor...")
-                await self.drone.action.arm()
-                is_armed = await self.check_arm_status()
+                await vehicle.drone.action.arm()
+                try:
+                    is_armed = await vehicle.telemetry_hub.wait_until("armed", lambda armed: armed, timeout=3.0)
+                except asyncio.TimeoutError:
+                    is_armed = False
                 if is_armed:
                     logger.info("Drone arm edildi!")
                     self._update_status_label("Drone arm edildi")
@@ -733,45 +4103,44 @@ class DroneGCS:
                     self._update_status_label("Drone arm edilemedi")
             except Exception as e:
                 logger.error(f"Arm hatası: {e}")
-                messagebox.showerror("Hata", f"Arm edilemedi: {e}")
+                self.notifications.notify("Hata", f"Arm edilemedi: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(arm(), self.loop)
 
     def disarm_drone(self):
         """Drone'u disarm et"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def disarm():
             try:
                 logger.info("Drone disarm ediliyor...")
-                await self.drone.action.disarm()
+                await vehicle.drone.action.disarm()
                 logger.info("Drone disarm edildi!")
                 self._update_status_label("Drone disarm edildi")
             except Exception as e:
                 logger.error(f"Disarm hatası: {e}")
-                messagebox.showerror("Hata", f"Disarm edilemedi: {e}")
+                self.notifications.notify("Hata", f"Disarm edilemedi: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(disarm(), self.loop)
 
-    async def check_takeoff_status(self):
+    async def check_takeoff_status(self, vehicle: Optional[VehicleLink] = None):
         """Drone kalkış durum kontrolü"""
-
-        if not self.drone:
+        vehicle = vehicle or self.active_vehicle
+        if not vehicle or not vehicle.drone or not vehicle.telemetry_hub:
             return False
 
         try:
             # Belirli bir süre içinde telemetri verisini alma
-            position = await asyncio.wait_for(
-                self.drone.telemetry.position().__anext__(),
-                timeout=3.0
-            )
+            position = await vehicle.telemetry_hub.wait_for("position", timeout=3.0)
 
             # Hedef yüksekliği tanımla - eğer önceden tanımlanmamışsa varsayılan değer kullan
             target_altitude = 10.0  # varsayılan olarak 10 metre
-            if hasattr(self.drone, "take_off_altitude_m"):
-                target_altitude = self.drone.take_off_altitude_m
+            if hasattr(vehicle.drone, "take_off_altitude_m"):
+                target_altitude = vehicle.drone.take_off_altitude_m
 
             # Göreceli yüksekliği kontrol et
             current_altitude = position.relative_altitude_m
@@ -799,14 +4168,16 @@ class DroneGCS:
         """Drone kalkış"""
 
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def takeoff():
             try:
                 logger.info("Drone kalkış yapıyor...")
-                await self.drone.action.takeoff()
-                if await self.check_takeoff_status():
+                await vehicle.drone.action.takeoff()
+                if await self.check_takeoff_status(vehicle):
                     logger.info("Drone kalktı!")
                     self._update_status_label("Drone kalktı")
                 else:
@@ -814,70 +4185,78 @@ class DroneGCS:
                     self._update_status_label("Drone kalkış yapamadı")
             except Exception as e:
                 logger.error(f"Takeoff hatası: {e}")
-                messagebox.showerror("Hata", f"Kalkış yapılamadı: {e}")
+                self.notifications.notify("Hata", f"Kalkış yapılamadı: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(takeoff(), self.loop)
 
     def land_drone(self):
         """Drone iniş"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def land():
             try:
                 logger.info("Drone iniş yapıyor...")
-                await self.drone.action.land()
+                await vehicle.drone.action.land()
                 logger.info("Drone indi!")
                 self._update_status_label("Drone indi")
             except Exception as e:
                 logger.error(f"Land hatası: {e}")
-                messagebox.showerror("Hata", f"İniş yapılamadı: {e}")
+                self.notifications.notify("Hata", f"İniş yapılamadı: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(land(), self.loop)
 
     def rtl_drone(self):
         """Return to Launch"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def rtl():
             try:
                 logger.info("Drone eve dönüyor...")
-                await self.drone.action.return_to_launch()
+                await vehicle.drone.action.return_to_launch()
                 logger.info("RTL komutu gönderildi!")
                 self._update_status_label("Eve dönüyor")
             except Exception as e:
                 logger.error(f"RTL hatası: {e}")
-                messagebox.showerror("Hata", f"RTL başlatılamadı: {e}")
+                self.notifications.notify("Hata", f"RTL başlatılamadı: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(rtl(), self.loop)
 
     def transition_fw(self):
         """Fixed-Wing moduna geç"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def t_fw():
             try:
                 logger.info("Drone Fixed-Wing moduna geçiyor...")
-                await self.drone.action.transition_to_fixedwing()
+                await vehicle.drone.action.transition_to_fixedwing()
                 logger.info("Drone Fixed-Wing moduna geçti!")
                 self._update_status_label("Fixed-Wing modunda")
             except Exception as e:
                 logger.error(f"Fixed-Wing geçiş hatası: {e}")
-                messagebox.showerror("Hata", f"Fixed-Wing moduna geçilemedi: {e}")
+                self.notifications.notify("Hata", f"Fixed-Wing moduna geçilemedi: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(t_fw(), self.loop)
 
     async def disable_arm_checks(self, disable=True):
         """Arm kontrollerini devre dışı bırak"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return False
 
+        vehicle = self.active_vehicle
+
         try:
             # Arm kontrollerini devre dışı bırakmak için parametreleri ayarla
             param_names = [
@@ -890,67 +4269,76 @@ class DroneGCS:
 
             for param_name in param_names:
                 # Parametreyi oku
-                current_value = await self.drone.param.get_param_int(param_name)
+                current_value = await vehicle.drone.param.get_param_int(param_name)
                 logger.info(f"Parametre {param_name} mevcut değeri: {current_value}")
 
                 # Parametreyi ayarla (0=devre dışı, 1=etkin)
                 new_value = 0 if disable else 1
-                await self.drone.param.set_param_int(param_name, new_value)
+                await vehicle.drone.param.set_param_int(param_name, new_value)
                 logger.info(f"Parametre {param_name} yeni değeri: {new_value}")
 
             # ARM_CHECK parametresi (eğer varsa)
             try:
-                await self.drone.param.set_param_int("COM_ARM_CHK", 0 if disable else 1)
+                await vehicle.drone.param.set_param_int("COM_ARM_CHK", 0 if disable else 1)
             except Exception:
                 pass  # Bu parametre olmayabilir
 
             message = "Arm kontrolleri devre dışı bırakıldı!" if disable else "Arm kontrolleri etkinleştirildi!"
             logger.warning(message)
-            messagebox.showinfo("Bilgi", message)
+            self.notifications.notify("Bilgi", message)
             self._update_status_label(message)
             return True
 
         except Exception as e:
             logger.error(f"Arm kontrolleri değiştirme hatası: {e}")
-            messagebox.showerror("Hata", f"Arm kontrolleri değiştirilemedi: {e}")
+            self.notifications.notify("Hata", f"Arm kontrolleri değiştirilemedi: {e}", "error")
             return False
 
     def transition_mc(self):
         """MultiCopter moduna geç"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def t_mc():
             try:
                 logger.info("Drone MultiCopter moduna geçiyor...")
-                await self.drone.action.transition_to_multicopter()
+                await vehicle.drone.action.transition_to_multicopter()
                 logger.info("Drone MultiCopter moduna geçti!")
                 self._update_status_label("MultiCopter modunda")
             except Exception as e:
                 logger.error(f"MultiCopter geçiş hatası: {e}")
-                messagebox.showerror("Hata", f"MultiCopter moduna geçilemedi: {e}")
+                self.notifications.notify("Hata", f"MultiCopter moduna geçilemedi: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(t_mc(), self.loop)
 
     def change_camera_mode(self):
         """Kamera modunu değiştir"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def change_camera():
             try:
-                result = await self.drone.camera.get_mode(1)
+                result = await vehicle.drone.camera.get_mode(1)
                 if result == Mode.PHOTO:
-                    await self.drone.camera.set_mode(Mode.VIDEO)
+                    await vehicle.drone.camera.set_mode(Mode.VIDEO)
+                    new_mode = Mode.VIDEO
                     logger.info("Video moduna geçildi")
                 else:
-                    await self.drone.camera.set_mode(Mode.PHOTO)
+                    await vehicle.drone.camera.set_mode(Mode.PHOTO)
+                    new_mode = Mode.PHOTO
                     logger.info("Fotoğraf moduna geçildi")
+
+                if vehicle.camera_cache:
+                    vehicle.camera_cache.set(new_mode)
             except CameraError as e:
                 logger.error(f"Kamera modu değiştirme hatası: {e}")
-                messagebox.showerror("Hata", f"Kamera modu değiştirilemedi: {e}")
+                self.notifications.notify("Hata", f"Kamera modu değiştirilemedi: {e}", "error")
 
         asyncio.run_coroutine_threadsafe(change_camera(), self.loop)
 
@@ -986,9 +4374,11 @@ class DroneGCS:
     def upload_mission_and_start(self):
         """Mission yükle ve başlat"""
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         file_path = filedialog.askopenfilename(
             title="Mission CSV dosyasını seçin",
             filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
@@ -1002,7 +4392,7 @@ class DroneGCS:
 
         if not lats or not lons or not alts:
             logger.error("Geçerli waypoint bulunamadı!")
-            messagebox.showerror("Hata", "CSV dosyasında geçerli waypoint bulunamadı!")
+            self.notifications.notify("Hata", "CSV dosyasında geçerli waypoint bulunamadı!", "error")
             return
 
         async def execute_mission():
@@ -1049,28 +4439,27 @@ class DroneGCS:
                 mission_plan = MissionPlan(mission_items)
 
                 logger.info("Mevcut mission temizleniyor...")
-                await self.drone.mission.clear_mission()
+                await vehicle.drone.mission.clear_mission()
 
                 logger.info("Yeni mission yükleniyor...")
-                await self.drone.mission.upload_mission(mission_plan)
+                await vehicle.drone.mission.upload_mission(mission_plan)
 
                 logger.info("Drone durumu kontrol ediliyor...")
-                async for health in self.drone.telemetry.health():
-                    if not health.is_home_position_ok:
-                        logger.warning("UYARI: Home pozisyonu ayarlanmamış!")
-                    if not health.is_global_position_ok:
-                        logger.warning("UYARI: Global pozisyon geçerli değil!")
-                    if not health.is_armable:
-                        logger.warning("UYARI: Drone arm edilemiyor!")
-                    break
-
-                is_armed = await self.drone.telemetry.armed().__anext__()
+                health = await vehicle.telemetry_hub.wait_for("health")
+                if not health.is_home_position_ok:
+                    logger.warning("UYARI: Home pozisyonu ayarlanmamış!")
+                if not health.is_global_position_ok:
+                    logger.warning("UYARI: Global pozisyon geçerli değil!")
+                if not health.is_armable:
+                    logger.warning("UYARI: Drone arm edilemiyor!")
+
+                is_armed = await vehicle.telemetry_hub.wait_for("armed")
                 if not is_armed:
                     logger.info("Drone arm ediliyor...")
                     try:
-                        await self.drone.action.arm()
+                        await vehicle.drone.action.arm()
                         for _ in range(5):
-                            is_armed = await self.drone.telemetry.armed().__anext__()
+                            is_armed = vehicle.telemetry_hub.get("armed", False)
                             if is_armed:
                                 logger.info("Drone başarıyla arm edildi!")
                                 break
@@ -1078,39 +4467,39 @@ class DroneGCS:
                             await asyncio.sleep(1)
                     except Exception as arm_error:
                         logger.error(f"Arm hatası: {arm_error}")
-                        messagebox.showerror("Hata", f"Drone arm edilemedi: {arm_error}")
+                        self.notifications.notify("Hata", f"Drone arm edilemedi: {arm_error}", "error")
                         return
                 else:
                     logger.info("Drone zaten arm edilmiş.")
 
-                flight_mode = await self.drone.telemetry.flight_mode().__anext__()
+                flight_mode = await vehicle.telemetry_hub.wait_for("flight_mode")
                 logger.info(f"Mevcut uçuş modu: {flight_mode}")
 
                 logger.info("Mission başlatılıyor...")
                 try:
-                    await self.drone.mission.start_mission()
+                    await vehicle.drone.mission.start_mission()
                     logger.info("Mission başlatıldı!")
                     self._update_status_label("Mission çalışıyor...")
                 except Exception as mission_error:
                     logger.error(f"Mission başlatma hatası: {mission_error}")
-                    messagebox.showerror("Hata", f"Mission başlatılamadı: {mission_error}")
+                    self.notifications.notify("Hata", f"Mission başlatılamadı: {mission_error}", "error")
 
                     logger.info("Mission yeniden yükleniyor...")
-                    await self.drone.mission.clear_mission()
+                    await vehicle.drone.mission.clear_mission()
                     await asyncio.sleep(1)
-                    await self.drone.mission.upload_mission(mission_plan)
+                    await vehicle.drone.mission.upload_mission(mission_plan)
 
                     logger.info("Mission yeniden başlatılıyor...")
                     try:
-                        await self.drone.mission.start_mission()
+                        await vehicle.drone.mission.start_mission()
                         logger.info("Mission başarıyla başlatıldı!")
                         self._update_status_label("Mission çalışıyor...")
                     except Exception as retry_error:
                         logger.error(f"Mission yeniden başlatılamadı: {retry_error}")
-                        messagebox.showerror("Hata", f"Mission tekrar başlatılamadı: {retry_error}")
+                        self.notifications.notify("Hata", f"Mission tekrar başlatılamadı: {retry_error}", "error")
 
                 logger.info("Mission takip ediliyor...")
-                async for prog in self.drone.mission.mission_progress():
+                async for prog in vehicle.drone.mission.mission_progress():
                     logger.info(f"Mission İlerleme: {prog.current}/{prog.total}")
                     if prog.current == prog.total:
                         logger.info("Mission başarıyla tamamlandı!")
@@ -1119,88 +4508,258 @@ class DroneGCS:
 
             except Exception as e:
                 logger.error(f"Mission işlemleri sırasında hata: {str(e)}")
-                messagebox.showerror("Mission Hatası", f"Mission sırasında hata: {str(e)}")
+                self.notifications.notify("Mission Hatası", f"Mission sırasında hata: {str(e)}", "error")
 
         asyncio.run_coroutine_threadsafe(execute_mission(), self.loop)
 
+    def on_replay_speed_selected(self, choice):
+        """Replay hız seçim callback"""
+        self.replay_speed = choice
+
+    def start_replay(self):
+        """Kaydedilmiş uçuşu telemetri, failsafe ve video işleme yollarından oynat"""
+        if self.replay and self.replay.is_running:
+            self.replay.stop()
+            logger.info("Replay durduruldu")
+            return
+
+        record_path = filedialog.askopenfilename(
+            title="Uçuş kaydını seçin",
+            filetypes=[("Flight Records", "*.bin"), ("All Files", "*.*")]
+        )
+        if not record_path:
+            logger.info("Dosya seçilmedi!")
+            return
+
+        video_path = filedialog.askopenfilename(
+            title="Replay videosu (isteğe bağlı)",
+            filetypes=[("Video Files", "*.mp4 *.avi *.mkv"), ("All Files", "*.*")]
+        ) or None
+
+        if video_path:
+            self.video_processor.start_processing()
+
+        speed = self.REPLAY_SPEEDS[self.replay_speed]
+        asyncio.run_coroutine_threadsafe(self._run_replay(record_path, video_path, speed), self.loop)
+
+    async def _run_replay(self, record_path: str, video_path: Optional[str], speed: Optional[float]):
+        """Replay aracını hazırla, oynatmayı çalıştır"""
+        try:
+            # Replay, canlı araçlardan ayrı bir filo aracı olarak oynatılır
+            vehicle = next((v for v in self.fleet.vehicles.values() if v.address is None), None)
+            if vehicle is None:
+                vehicle = await self.fleet.add_replay_vehicle()
+                self.fleet.set_active(vehicle.vehicle_id)
+                if self.root:
+                    self.root.after(0, self._refresh_vehicle_menu)
+                self._start_telemetry_updates()
+
+            self.replay = FlightReplay(record_path, vehicle.telemetry_hub, video_path=video_path,
+                                       video_processor=self.video_processor if video_path else None,
+                                       speed=speed)
+            # Her replay temiz failsafe durumuyla başlar, bitince mesaj kesildiği için heartbeat kaybı sayılmaz
+            vehicle.failsafe_manager.reset()
+            try:
+                stats = await self.replay.run()
+            finally:
+                vehicle.failsafe_manager.heartbeat_tracker.reset()
+            if stats:
+                self._update_status_label(f"Replay bitti: {stats['samples_per_s']:.0f} örnek/s, "
+                                          f"{stats['processed_fps']:.1f} FPS")
+        except Exception as e:
+            logger.error(f"Replay hatası: {e}")
+
+    def compare_inference_backends(self):
+        """Backend karşılaştırmasını arka planda çalıştır (data.yaml seçilirse mAP50 de ölçülür)"""
+        data_yaml = filedialog.askopenfilename(title="mAP için etiketli data.yaml (opsiyonel)",
+                                               filetypes=[("YAML", "*.yaml *.yml")]) or None
+
+        def run():
+            try:
+                report = self.video_processor.compare_backends(data_yaml)
+            except Exception as e:
+                logger.error(f"Backend karşılaştırma hatası: {e}")
+                return
+            lines = [f"{row['backend']}: {row['fps']:.1f} FPS"
+                     + (f" (x{row['speedup']:.2f})" if row['speedup'] is not None else "")
+                     + (f", mAP50 {row['map50']:.3f}" if row['map50'] is not None else "")
+                     for row in report]
+            self.notifications.notify("Backend Karşılaştırma", "\n".join(lines) or "Backend bulunamadı")
+
+        self._update_status_label("Backend karşılaştırması çalışıyor...")
+        threading.Thread(target=run, daemon=True).start()
+
     def start_video_stream(self):
         """Video akışını başlat"""
         try:
-            if self.cap and self.cap.isOpened():
-                self.cap.release()
+            self._stop_frame_grabbers()
+            if self.display_pipeline:
+                self.display_pipeline.stop()
+
+            for name, device in self.VIDEO_SOURCES.items():
+                grabber = FrameGrabber(device)
+                if grabber.start():
+                    self.frame_grabbers[name] = grabber
+                else:
+                    logger.error(f"Kamera açılamadı: {name} ({device})")
 
-            self.cap = cv2.VideoCapture(0)
-            if not self.cap.isOpened():
-                logger.error("Kamera açılamadı!")
-                self.video_canvas.delete("all")
+            if not self.frame_grabbers:
+                self._reset_video_canvas()
                 self.video_canvas.create_text(150, 100, text="Kamera açılamadı", fill="red")
                 return
 
+            for name, grabber in self.frame_grabbers.items():
+                self.video_processor.add_source(name)
+                grabber.add_sink(lambda frame, seq, timestamp, source=name:
+                                 self.video_processor.submit(frame, seq, timestamp, source=source))
             self.video_processor.start_processing()
+
+            # İşleme açıksa işlenmiş frame'ler (overlay ile), değilse ham kamera gösterilir
+            if self.video_processor.is_processing:
+                source_slot = self._display_stream().output_slot
+            else:
+                source_slot = next(iter(self.frame_grabbers.values())).slot
+            self.display_pipeline = DisplayPipeline(self.video_processor)
+            self.display_pipeline.set_size(self.video_canvas.winfo_width() or 320,
+                                           self.video_canvas.winfo_height() or 240)
+            self.display_pipeline.start(source_slot)
+
+            self._displayed_seq = 0
+            self._last_display_time = None
+            self._display_fps = 0.0
+            self._display_paste_ms = 0.0
+            self._reset_video_canvas()
             self._update_video_stream()
             logger.info("Video akışı başlatıldı")
         except Exception as e:
             logger.error(f"Video başlatma hatası: {e}")
-            messagebox.showerror("Hata", f"Video başlatılamadı: {e}")
+            self.notifications.notify("Hata", f"Video başlatılamadı: {e}", "error")
+
+    def _reset_video_canvas(self):
+        """Canvas'ı temizle; görüntü ve istatistik öğeleri ilk frame'de bir kez oluşturulur"""
+        self.video_canvas.delete("all")
+        self._video_photo = None
+        self._video_image_item = None
+        self._video_stats_item = None
 
     def _update_video_stream(self):
-        """Video akışını güncelle"""
+        """Video akışını güncelle: hazır tamponun pikselleri kalıcı PhotoImage'a kopyalanır"""
         try:
-            if self.cap and self.cap.isOpened():
-                ret, frame = self.cap.read()
-                if ret:
-                    if not self.video_processor.input_queue.full():
-                        self.video_processor.input_queue.put_nowait(frame)
-
-                    if not self.video_processor.output_queue.empty():
-                        processed_frame = self.video_processor.output_queue.get()
-                        processed_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-                    else:
-                        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        processed_frame = frame
-
-                    canvas_width = self.video_canvas.winfo_width() or 320
-                    canvas_height = self.video_canvas.winfo_height() or 240
+            pipeline = self.display_pipeline
+            if not pipeline or not self.frame_grabbers:
+                return
 
-                    processed_frame = cv2.resize(processed_frame, (canvas_width, canvas_height))
-                    img = Image.fromarray(processed_frame)
-                    imgtk = ImageTk.PhotoImage(image=img)
-                    self.video_canvas.delete("all")
-                    self.video_canvas.create_image(0, 0, anchor="nw", image=imgtk)
-                    self.video_canvas.image = imgtk
+            canvas_width = self.video_canvas.winfo_width() or 320
+            canvas_height = self.video_canvas.winfo_height() or 240
+            pipeline.set_size(canvas_width, canvas_height)
 
-            if self.cap and self.cap.isOpened():
-                self.root.after(30, self._update_video_stream)
+            taken = pipeline.take(self._displayed_seq)
+            if taken:
+                self._displayed_seq, buffer = taken
+                try:
+                    start_time = time.perf_counter()
+                    height, width = buffer.shape[:2]
+                    image = Image.frombuffer("RGB", (width, height), buffer, "raw", "RGB", 0, 1)
+                    photo_size = (self._video_photo.width(), self._video_photo.height()) if self._video_photo else None
+                    if photo_size != (width, height):
+                        # Yalnızca boyut değişince yeni PhotoImage
+                        self._video_photo = ImageTk.PhotoImage(image=image)
+                        if self._video_image_item is None:
+                            self._video_image_item = self.video_canvas.create_image(0, 0, anchor="nw",
+                                                                                    image=self._video_photo)
+                        else:
+                            self.video_canvas.itemconfigure(self._video_image_item, image=self._video_photo)
+                    else:
+                        self._video_photo.paste(image)
+                    paste_ms = (time.perf_counter() - start_time) * 1000
+                finally:
+                    pipeline.release()
+
+                now = time.perf_counter()
+                if self._last_display_time:
+                    instant_fps = 1.0 / max(now - self._last_display_time, 1e-6)
+                    self._display_fps = instant_fps if not self._display_fps else \
+                        self._display_fps + 0.1 * (instant_fps - self._display_fps)
+                self._last_display_time = now
+                self._display_paste_ms = paste_ms if not self._display_paste_ms else \
+                    self._display_paste_ms + 0.1 * (paste_ms - self._display_paste_ms)
+                self._update_video_stats(canvas_width, canvas_height)
+
+            grabber = next(iter(self.frame_grabbers.values()))
+            if grabber.is_running():
+                self.root.after(15, self._update_video_stream)
         except Exception as e:
             logger.error(f"Video güncelleme hatası: {e}")
+            if self.frame_grabbers:
+                self.root.after(30, self._update_video_stream)
+
+    def _update_video_stats(self, canvas_width: int, canvas_height: int):
+        """Kamera ve ekran FPS'i ile frame başına gösterim maliyetini tek metin öğesinde göster"""
+        name, grabber = next(iter(self.frame_grabbers.items()))
+        stats = grabber.get_stats()
+        text = (f"Kamera {stats['fps']:.1f} FPS | düşen {self._dropped_frames(name, grabber)}\n"
+                f"Ekran {self._display_fps:.1f} FPS | hazırlık {self.display_pipeline.prepare_ms:.1f} ms"
+                f" | kopya {self._display_paste_ms:.1f} ms")
+        if self._video_stats_item is None:
+            self._video_stats_item = self.video_canvas.create_text(0, 0, anchor="se", fill="yellow", justify="right")
+        self.video_canvas.coords(self._video_stats_item, canvas_width - 5, canvas_height - 5)
+        self.video_canvas.itemconfigure(self._video_stats_item, text=text)
+        self.video_canvas.tag_raise(self._video_stats_item)
+
+    def _display_stream(self) -> VideoStream:
+        """Video panelinde gösterilen (ilk) kaynağın akışı"""
+        return self.video_processor.streams[next(iter(self.frame_grabbers), VideoProcessor.DEFAULT_SOURCE)]
+
+    def _dropped_frames(self, name: str, grabber: FrameGrabber) -> int:
+        """Kaynağın gerçekten tüketilmeden düşen frame sayısı"""
+        # İşleme açıkken grabber yuvasını okuyan olmaz, her put düşmüş sayılır; asıl tüketici giriş yuvasıdır
+        if self.video_processor.is_processing and name in self.video_processor.streams:
+            return self.video_processor.streams[name].input_slot.dropped
+        return grabber.get_stats()['dropped']
+
+    def _stop_frame_grabbers(self):
+        """Tüm kamera yakalama thread'lerini durdur"""
+        for name, grabber in self.frame_grabbers.items():
+            stats = grabber.get_stats()
+            dropped = self._dropped_frames(name, grabber)
+            grabber.stop()
+            logger.info(f"Kamera {name}: {stats['frames']} frame, {stats['fps']:.1f} FPS, "
+                        f"{dropped} düşen frame")
+        self.frame_grabbers = {}
 
     def stop_video_stream(self):
         """Video akışını durdur"""
         try:
-            if self.cap and self.cap.isOpened():
-                self.cap.release()
-                self.cap = None
+            self._stop_frame_grabbers()
+            if self.display_pipeline:
+                self.display_pipeline.stop()
+                self.display_pipeline = None
+                logger.info(f"Ekran: {self._display_fps:.1f} FPS, frame başına "
+                            f"{self._display_paste_ms:.1f} ms kopya")
 
             self.video_processor.stop_processing()
-            self.video_canvas.delete("all")
+            self._reset_video_canvas()
             self.video_canvas.create_text(160, 120, text="Video durduruldu", fill="white")
             logger.info("Video akışı durduruldu")
         except Exception as e:
             logger.error(f"Video durdurma hatası: {e}")
 
     def clear_flight_path(self):
-        """Uçuş yolunu temizle"""
-        self.flight_path = [(self.current_lat, self.current_lon)]
+        """Aktif aracın uçuş yolunu temizle"""
+        vehicle = self.active_vehicle
+        if not vehicle:
+            return
+
+        vehicle.clear_path()
 
-        # Path line'ı haritadan sil
-        if hasattr(self, 'path_line') and self.path_line:
+        # Path parçalarını haritadan sil
+        if vehicle.path_renderer:
             try:
-                self.path_line.delete()
-                self.path_line = None
+                vehicle.path_renderer.clear()
             except Exception as e:
                 logger.error(f"Path line silme hatası: {e}")
 
-        logger.info("Uçuş yolu temizlendi")
+        logger.info(f"Uçuş yolu temizlendi ({vehicle.vehicle_id})")
 
         # Harita güncellemesini tetikle
         if hasattr(self, 'map_widget') and self.map_widget:
@@ -1276,6 +4835,18 @@ class DroneGCS:
         for i, (text, command) in enumerate(row2_buttons):
             btn = ctk.CTkButton(button_frame, text=text, command=command)
             btn.grid(row=1, column=i, padx=2, pady=2, sticky="ew")
+
+        # Uçuş kaydı replay butonu ve hız seçimi
+        replay_btn = ctk.CTkButton(button_frame, text="Replay", command=self.start_replay)
+        replay_btn.grid(row=0, column=10, padx=2, pady=2, sticky="ew")
+        replay_speed_menu = ctk.CTkOptionMenu(button_frame, values=list(self.REPLAY_SPEEDS),
+                                              command=self.on_replay_speed_selected)
+        replay_speed_menu.set(self.replay_speed)
+        replay_speed_menu.grid(row=0, column=11, padx=2, pady=2, sticky="ew")
+
+        # CPU backend'lerini (PyTorch/ONNX/OpenVINO) FPS ve mAP50 ile karşılaştırma
+        backend_btn = ctk.CTkButton(button_frame, text="Backend Test", command=self.compare_inference_backends)
+        backend_btn.grid(row=1, column=10, columnspan=2, padx=2, pady=2, sticky="ew")
         # Şişe tespit listesi butonu - YENİ BUTON
         bottle_list_btn = ctk.CTkButton(
             button_frame,
@@ -1324,6 +4895,10 @@ class DroneGCS:
             port_menu = ctk.CTkOptionMenu(button_frame, values=ports, command=self.on_port_selected)
             port_menu.grid(row=1, column=5, columnspan=3, padx=2, pady=2, sticky="ew")
 
+        # Filo araç seçimi (komutlar ve bilgi paneli aktif aracı kullanır)
+        self.vehicle_menu = ctk.CTkOptionMenu(button_frame, values=["Araç yok"], command=self.on_vehicle_selected)
+        self.vehicle_menu.grid(row=0, column=12, columnspan=2, padx=2, pady=2, sticky="ew")
+
     def _create_info_frame(self):
         """Bilgi frame'ini oluştur"""
         info_frame = ctk.CTkFrame(self.root)
@@ -1363,9 +4938,6 @@ class DroneGCS:
                 marker_color_circle="red"
             )
 
-            # Path line'ı başlat (None olarak)
-            self.path_line = None
-
             logger.info("Harita başarıyla oluşturuldu")
 
         except Exception as e:
@@ -1375,7 +4947,6 @@ class DroneGCS:
             placeholder.pack(fill="both", expand=True)
             self.map_widget = None
             self.drone_marker = None
-            self.path_line = None
 
     def _create_control_frame(self):
         """Kontrol frame'ini oluştur"""
@@ -1421,15 +4992,46 @@ class DroneGCS:
         self.log_text = ctk.CTkTextbox(log_container, height=100, font=("Courier", 10))
         self.log_text.pack(fill="both", expand=True)
 
-        # Log temizleme butonu
-        clear_log_btn = ctk.CTkButton(log_frame, text="Logları Temizle", command=self._clear_logs)
-        clear_log_btn.pack(pady=(0, 10))
+        self.log_sink.attach(self.root, self.log_text)
+
+        # Seviye filtresi, arama ve temizleme
+        log_tools = ctk.CTkFrame(log_frame)
+        log_tools.pack(fill="x", padx=10, pady=(0, 10))
+
+        level_menu = ctk.CTkOptionMenu(log_tools, values=list(GuiLogSink.LEVELS), command=self.log_sink.set_level)
+        level_menu.set("INFO")
+        level_menu.pack(side="left", padx=5)
+
+        self.log_search_entry = ctk.CTkEntry(log_tools, placeholder_text="Loglarda ara")
+        self.log_search_entry.pack(side="left", fill="x", expand=True, padx=5)
+        self.log_search_entry.bind("<Return>", lambda event: self._search_logs())
+
+        search_btn = ctk.CTkButton(log_tools, text="Ara", command=self._search_logs)
+        search_btn.pack(side="left", padx=5)
+
+        live_btn = ctk.CTkButton(log_tools, text="Canlı", width=60, command=self._end_log_search)
+        live_btn.pack(side="left", padx=5)
+
+        clear_log_btn = ctk.CTkButton(log_tools, text="Logları Temizle", command=self._clear_logs)
+        clear_log_btn.pack(side="left", padx=5)
+
+    def _search_logs(self):
+        """Log tamponunda ara; tekrar basıldıkça bir önceki eşleşmeye git"""
+        pattern = self.log_search_entry.get()
+        count = self.log_sink.search(pattern)
+        if count:
+            self._update_status_label(f"'{pattern}': {self.log_sink.search_position + 1}/{count} eşleşme")
+        elif pattern:
+            self._update_status_label(f"'{pattern}': eşleşme yok")
+
+    def _end_log_search(self):
+        """Aramayı kapat, canlı loglara dön"""
+        self.log_search_entry.delete(0, "end")
+        self.log_sink.end_search()
 
     def _clear_logs(self):
         """Logları temizle"""
-        self.log_messages.clear()
-        if self.log_text:
-            self.log_text.delete("1.0", "end")
+        self.log_sink.clear()
         logger.info("Loglar temizlendi")
 
     def _create_status_frame(self):
@@ -1440,6 +5042,8 @@ class DroneGCS:
         self.status_label = ctk.CTkLabel(status_frame, text="Hazır", font=("Arial", 12, "bold"))
         self.status_label.pack(padx=10, pady=5)
 
+        self.notifications.attach(self.root, self.status_label)
+
     def _goto_drone(self):
         """Drone'u hedefe gönder - Geliştirilmiş versiyon"""
         data = self.uav_target_info.get().split()
@@ -1449,33 +5053,35 @@ class DroneGCS:
             target_alt = float(data[2])
             user_yaw = float(data[3]) if len(data) > 3 else None
         except (IndexError, ValueError):
-            messagebox.showerror("Hata", "Lütfen geçerli enlem, boylam ve irtifa giriniz!")
+            self.notifications.notify("Hata", "Lütfen geçerli enlem, boylam ve irtifa giriniz!", "error")
             return
 
         if not self.drone:
-            messagebox.showwarning("Uyarı", "Drone bağlı değil!")
+            self.notifications.notify("Uyarı", "Drone bağlı değil!", "warning")
             return
 
+        vehicle = self.active_vehicle
+
         async def goto():
             try:
                 # Failsafe'e goto'nun aktif olduğunu bildir
-                if self.failsafe_manager:
-                    self.failsafe_manager.set_goto_active(True)
+                if vehicle.failsafe_manager:
+                    vehicle.failsafe_manager.set_goto_active(True)
 
                 # Debug log ekle
                 logger.info(f"Goto komutu başlatıldı: lat={target_lat}, lon={target_lon}, alt={target_alt}")
-                if self.failsafe_manager and self.failsafe_manager.drone_state:
+                if vehicle.failsafe_manager and vehicle.failsafe_manager.drone_state:
                     logger.info(
-                        f"Mevcut drone durumu - Batarya: {self.failsafe_manager.drone_state.battery_level}%, İrtifa: {self.failsafe_manager.drone_state.altitude}m")
+                        f"Mevcut drone durumu - Batarya: {vehicle.failsafe_manager.drone_state.battery_level}%, İrtifa: {vehicle.failsafe_manager.drone_state.altitude}m")
 
                 # Uçuş modunu kontrol et
-                flight_mode = await self.drone.telemetry.flight_mode().__anext__()
+                flight_mode = await vehicle.telemetry_hub.wait_for("flight_mode")
                 logger.info(f"Goto öncesi uçuş modu: {flight_mode}")
 
                 if user_yaw is None:
                     # Yaw hesapla
-                    delta_lon = math.radians(target_lon - self.current_lon)
-                    current_lat_rad = math.radians(self.current_lat)
+                    delta_lon = math.radians(target_lon - vehicle.current_lon)
+                    current_lat_rad = math.radians(vehicle.current_lat)
                     target_lat_rad = math.radians(target_lat)
 
                     y = math.sin(delta_lon) * math.cos(target_lat_rad)
@@ -1490,28 +5096,28 @@ class DroneGCS:
                 logger.info(f"Hedefe gidiyor: {target_lat}, {target_lon}, {target_alt}m, {target_yaw:.1f}°")
 
                 # Goto komutunu gönder
-                await self.drone.action.goto_location(target_lat, target_lon, target_alt, target_yaw)
+                await vehicle.drone.action.goto_location(target_lat, target_lon, target_alt, target_yaw)
 
                 logger.info("Goto komutu başarıyla gönderildi")
                 self._update_status_label("Hedefe gidiyor...")
 
                 # Komut sonrası uçuş modunu tekrar kontrol et
                 await asyncio.sleep(2)
-                flight_mode = await self.drone.telemetry.flight_mode().__anext__()
+                flight_mode = await vehicle.telemetry_hub.wait_for("flight_mode")
                 logger.info(f"Goto sonrası uçuş modu: {flight_mode}")
 
                 # Hedefe varış kontrolü (isteğe bağlı)
                 await asyncio.sleep(10)  # 10 saniye sonra
-                if self.failsafe_manager:
-                    self.failsafe_manager.set_goto_active(False)
+                if vehicle.failsafe_manager:
+                    vehicle.failsafe_manager.set_goto_active(False)
 
             except Exception as e:
                 logger.error(f"Goto hatası: {e}")
-                messagebox.showerror("Hata", f"Hedefe gidilemedi: {e}")
+                self.notifications.notify("Hata", f"Hedefe gidilemedi: {e}", "error")
 
                 # Hata durumunda failsafe'i normale döndür
-                if self.failsafe_manager:
-                    self.failsafe_manager.set_goto_active(False)
+                if vehicle.failsafe_manager:
+                    vehicle.failsafe_manager.set_goto_active(False)
 
         asyncio.run_coroutine_threadsafe(goto(), self.loop)
 
@@ -1519,13 +5125,16 @@ class DroneGCS:
         """Uygulama kapatılırken"""
         logger.info("Uygulama kapatılıyor...")
 
-        if self.failsafe_manager:
-            self.failsafe_manager.stop_monitoring()
+        self.fleet.close(self.loop)
 
-        if self.cap and self.cap.isOpened():
-            self.cap.release()
+        if self.replay:
+            self.replay.stop()
+
+        self._stop_frame_grabbers()
+        if self.display_pipeline:
+            self.display_pipeline.stop()
 
-        self.video_processor.stop_processing()
+        self.video_processor.close()
         self.loop.call_soon_threadsafe(self.loop.stop)
         self.root.destroy()
 
@@ -1538,6 +5147,7 @@ class DroneGCS:
 
 # Ana program
 if __name__ == "__main__":
+    log_listener = setup_logging()
     try:
         gcs = DroneGCS()
         gcs.run()
@@ -1545,4 +5155,6 @@ if __name__ == "__main__":
         logger.critical(f"Kritik hata: {e}")
         messagebox.showerror("Kritik Hata", f"Uygulama başlatılamadı: {e}")
         logger.error("Uygulama başlatılamadı, lütfen logları kontrol edin.")
+    finally:
+        shutdown_logging(log_listener)
 